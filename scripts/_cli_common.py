@@ -0,0 +1,165 @@
+"""
+Shared helpers for the batch migration scripts.
+Config loading, logging setup, console headers and the fast CSV reader live here
+so every driver script behaves the same way.
+"""
+
+import sys
+import copy
+import csv
+import re
+import yaml
+from functools import lru_cache
+import pandas as pd
+from loguru import logger
+from colorama import init, Fore
+
+from src.csv_handler import open_arrow_csv, read_arrow_table
+
+# libyaml's C parser when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = pacsv = None
+
+# Initialize colorama
+init(autoreset=True)
+
+# Currency symbols, thousands separators and whitespace stripped before parsing prices
+PRICE_STRIP = re.compile(r'[\$,₹\s]')
+
+LOG_FORMAT = "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <level>{message}</level>"
+
+
+@lru_cache(maxsize=None)
+def _parse_config(config_path: str) -> dict:
+    """Parse a YAML config once per path; callers get copies via load_config."""
+    try:
+        with open(config_path, 'r') as f:
+            return yaml.load(f, Loader=_YamlLoader)
+    except FileNotFoundError:
+        logger.warning(f"Config file not found: {config_path}")
+        return {}
+
+
+def load_config(config_path: str = "config/config.yaml") -> dict:
+    """Load configuration from YAML file (parsed once, returned as a fresh copy)."""
+    return copy.deepcopy(_parse_config(config_path))
+
+
+def setup_logging(level: str = 'INFO') -> None:
+    """Route loguru output to stderr with the scripts' standard format."""
+    logger.remove()
+    logger.add(sys.stderr, format=LOG_FORMAT, level=level)
+
+
+def print_header(title: str, color: str = Fore.CYAN) -> None:
+    """Print a banner framed by 80-column rules."""
+    print(color + "="*80)
+    print(color + title)
+    print(color + "="*80)
+
+
+def read_header(path: str) -> list:
+    """Return a CSV file's column names without parsing any rows."""
+    with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+        return next(csv.reader(f), [])
+
+
+def fast_read(
+    path: str,
+    dtype=None,
+    keep_default_na: bool = True,
+    usecols: list = None
+) -> pd.DataFrame:
+    """
+    Read a CSV with pyarrow's multithreaded reader, falling back to pandas.
+    
+    Supports the subset of pd.read_csv options these scripts use: dtype=str reads
+    every column as text, keep_default_na=False keeps empty cells as '' instead of NaN.
+    
+    Args:
+        path: Path to the CSV file
+        dtype: Pass str to read all columns as strings, or a dict of column -> str
+        keep_default_na: Whether empty cells become NaN
+        usecols: Optional list of columns to load
+    
+    Returns:
+        DataFrame containing the CSV data
+    """
+    table = read_arrow_table(path, dtype=dtype, keep_default_na=keep_default_na, usecols=usecols)
+    if table is None:
+        return pd.read_csv(path, dtype=dtype, keep_default_na=keep_default_na, usecols=usecols, low_memory=False)
+    return table.to_pandas()
+
+
+def iter_csv_chunks(path: str, usecols: list, chunk_size: int = 1_000_000, dtype=None):
+    """
+    Yield DataFrames of at most chunk_size rows for the given columns.
+    
+    When every column is read as text, pyarrow's streaming reader parses the file
+    block by block and at most about chunk_size rows are held at a time;
+    otherwise pandas' chunked C reader is used.
+    
+    Args:
+        path: Path to the CSV file
+        usecols: Columns to load
+        chunk_size: Maximum rows per yielded DataFrame
+        dtype: Optional str, or dict of column -> str, for columns read as text
+    """
+    reader = open_arrow_csv(path, usecols, dtype)
+    if reader is None:
+        yield from pd.read_csv(path, usecols=usecols, dtype=dtype, chunksize=chunk_size)
+        return
+    
+    pending = []
+    pending_rows = 0
+    with reader:
+        for batch in reader:
+            pending.append(batch)
+            pending_rows += batch.num_rows
+            if pending_rows < chunk_size:
+                continue
+            table = pa.Table.from_batches(pending, schema=reader.schema)
+            while table.num_rows >= chunk_size:
+                yield table.slice(0, chunk_size).to_pandas()
+                table = table.slice(chunk_size)
+            pending = table.to_batches()
+            pending_rows = table.num_rows
+    if pending_rows:
+        yield pa.Table.from_batches(pending, schema=reader.schema).to_pandas()
+
+
+def fast_write(df: pd.DataFrame, path: str) -> None:
+    """
+    Write a CSV with pyarrow's multithreaded writer, falling back to DataFrame.to_csv.
+    
+    Float and bool columns are rendered the way to_csv renders them (11.0, True)
+    so pandas infers the same dtypes when the file is read back.
+    
+    Args:
+        df: DataFrame to write (index is not written)
+        path: Output CSV path
+    """
+    if pacsv is None:
+        df.to_csv(path, index=False)
+        return
+    
+    rendered = {}
+    for col in df.columns[(df.dtypes == 'float64') | (df.dtypes == 'bool')]:
+        rendered[col] = df[col].astype(str).where(df[col].notna())
+    out = df.assign(**rendered) if rendered else df
+    
+    try:
+        table = pa.Table.from_pandas(out, preserve_index=False)
+        pacsv.write_csv(table, path, write_options=pacsv.WriteOptions(quoting_style='all_valid'))
+    except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+        # Mixed-type object columns cannot be converted to Arrow
+        logger.warning(f"pyarrow could not write {path} ({e}); falling back to pandas")
+        df.to_csv(path, index=False)
@@ -6,7 +6,6 @@ Check progress of the complete 20-batch migration.
 import sys
 from pathlib import Path
 from colorama import init, Fore
-import pandas as pd
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from src.csv_handler import CSVHandler
@@ -34,8 +33,9 @@ def check_progress(output_dir: str = "data/output", prefix: str = "shopify_produ
         if batch_file.exists():
             try:
                 df = handler.read_csv(str(batch_file), low_memory=False)
-                parent_rows = df[pd.notna(df['Title']) & (df['Title'] != '')]
-                variant_rows = df[pd.isna(df['Title']) | (df['Title'] == '')]
+                is_parent = df['Title'].notna() & df['Title'].ne('')
+                parent_rows = df[is_parent]
+                variant_rows = df[~is_parent]
                 
                 batch_rows = len(df)
                 batch_parents = len(parent_rows)
@@ -50,7 +50,7 @@ def check_status():
             try:
                 df = pd.read_csv(batch_file, low_memory=False)
                 rows = len(df)
-                parents = len(df[pd.notna(df['Title']) & (df['Title'] != '')])
+                parents = int((df['Title'].notna() & df['Title'].ne('')).sum())
                 variants = rows - parents
                 
                 total_migrated_rows += rows
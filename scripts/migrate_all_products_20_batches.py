@@ -226,8 +226,9 @@ def verify_all_batches(output_files: list) -> dict:
             continue
         
         df = handler.read_csv(output_file, low_memory=False)
-        parent_rows = df[pd.notna(df['Title']) & (df['Title'] != '')]
-        variant_rows = df[pd.isna(df['Title']) | (df['Title'] == '')]
+        is_parent = df['Title'].notna() & df['Title'].ne('')
+        parent_rows = df[is_parent]
+        variant_rows = df[~is_parent]
         
         batch_rows = len(df)
         batch_parents = len(parent_rows)
@@ -9,30 +9,17 @@ import sys
 import argparse
 from pathlib import Path
 from dotenv import load_dotenv
-import yaml
 import os
 import pandas as pd
 from loguru import logger
-from colorama import init, Fore
+from colorama import Fore
 import math
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.migration import MigrationOrchestrator, normalize_product_name, determine_product_group_id
-
-# Initialize colorama
-init(autoreset=True)
-
-
-def load_config(config_path: str = "config/config.yaml") -> dict:
-    """Load configuration from YAML file."""
-    try:
-        with open(config_path, 'r') as f:
-            return yaml.safe_load(f)
-    except FileNotFoundError:
-        logger.warning(f"Config file not found: {config_path}")
-        return {}
+from scripts._cli_common import load_config, setup_logging, fast_write, PRICE_STRIP
 
 
 def split_source_csv(source_csv_path: str, num_batches: int = 5) -> list:
@@ -58,62 +45,46 @@ def split_source_csv(source_csv_path: str, num_batches: int = 5) -> list:
     df['__BaseName'] = df['Name'].apply(normalize_product_name)
     df['__ProductGroupID'] = df.apply(determine_product_group_id, axis=1)
     
-    def row_has_price(row: pd.Series) -> bool:
-        for field in ['Regular price', 'Sale price']:
-            if field in row and pd.notna(row[field]):
-                try:
-                    price = float(str(row[field]).replace('$', '').replace(',', '').replace('₹', '').strip())
-                    if price > 0:
-                        return True
-                except Exception:
-                    continue
-        return False
-    
-    def row_has_image(row: pd.Series) -> bool:
-        img = row.get('Images', '')
-        if pd.isna(img):
-            return False
-        img_str = str(img).strip()
-        return img_str != '' and img_str.lower() != 'nan'
-    
-    valid_groups = []
-    invalid_groups = []
-    
-    for group_id, group_df in df.groupby('__ProductGroupID', sort=False):
-        first_idx = group_df.index.min()
-        has_price = group_df.apply(row_has_price, axis=1).any()
-        has_image = group_df.apply(row_has_image, axis=1).any()
-        
-        if has_price and has_image:
-            valid_groups.append((first_idx, group_id, group_df.copy()))
-        else:
-            invalid_groups.append((group_id, has_price, has_image))
-    
-    valid_groups.sort(key=lambda item: item[0])
-    logger.info(f"Total product groups: {len(valid_groups) + len(invalid_groups)}")
-    logger.info(f"Valid product groups (price + image): {len(valid_groups)}")
-    logger.info(f"Skipped product groups (missing data): {len(invalid_groups)}")
-    
-    # Partition valid groups evenly across batches while preserving order
+    # Row-level checks as column masks, rolled up per product group
+    has_price_row = pd.Series(False, index=df.index)
+    for field in ['Regular price', 'Sale price']:
+        if field in df.columns:
+            prices = df[field]
+            if not pd.api.types.is_numeric_dtype(prices):
+                prices = pd.to_numeric(prices.astype(str).str.replace(PRICE_STRIP, '', regex=True), errors='coerce')
+            has_price_row |= prices.gt(0)
+    
+    has_image_row = pd.Series(False, index=df.index)
+    if 'Images' in df.columns:
+        images = df['Images'].astype(str).str.strip()
+        has_image_row = df['Images'].notna() & (images != '') & (images.str.lower() != 'nan')
+    
+    group_keys = df['__ProductGroupID']
+    group_has_price = has_price_row.groupby(group_keys, sort=False).any()
+    group_has_image = has_image_row.groupby(group_keys, sort=False).any()
+    group_valid = group_has_price & group_has_image
+    
+    valid_df = df.loc[group_keys.map(group_valid).astype(bool)]
+    num_valid_groups = int(group_valid.sum())
+    num_invalid_groups = len(group_valid) - num_valid_groups
+    logger.info(f"Total product groups: {len(group_valid)}")
+    logger.info(f"Valid product groups (price + image): {num_valid_groups}")
+    logger.info(f"Skipped product groups (missing data): {num_invalid_groups}")
+    
+    # Partition valid groups evenly across batches while preserving order:
+    # ngroup() numbers groups by first appearance, i.e. by their first row index
     batch_dfs = []
-    valid_row_count = sum(len(group_df) for _, _, group_df in valid_groups)
+    valid_row_count = len(valid_df)
     invalid_row_count = total_rows - valid_row_count
-    groups_per_batch = math.ceil(len(valid_groups) / num_batches) if valid_groups else 0
+    groups_per_batch = math.ceil(num_valid_groups / num_batches) if num_valid_groups else 0
+    group_rank = valid_df.groupby('__ProductGroupID', sort=False).ngroup()
+    bucket = group_rank // groups_per_batch if groups_per_batch else group_rank
     
     for i in range(num_batches):
-        start = i * groups_per_batch
-        end = min((i + 1) * groups_per_batch, len(valid_groups))
-        batch_groups = valid_groups[start:end]
-        
-        if not batch_groups:
-            batch_df = pd.DataFrame(columns=df.columns)
-        else:
-            batch_df = pd.concat([group_df for _, _, group_df in batch_groups]).sort_index()
-        for col in ['__BaseName', '__ProductGroupID']:
-            if col in batch_df.columns:
-                batch_df = batch_df.drop(columns=[col])
+        batch_groups = max(0, min(groups_per_batch, num_valid_groups - i * groups_per_batch))
+        batch_df = valid_df.loc[bucket == i].drop(columns=['__BaseName', '__ProductGroupID'])
         batch_dfs.append(batch_df)
-        logger.info(f"Batch {i+1}: {len(batch_df):,} rows across {len(batch_groups)} product groups")
+        logger.info(f"Batch {i+1}: {len(batch_df):,} rows across {batch_groups} product groups")
     
     # Verify counts match
     total_batch_rows = sum(len(batch) for batch in batch_dfs)
@@ -122,8 +93,8 @@ def split_source_csv(source_csv_path: str, num_batches: int = 5) -> list:
         raise ValueError(f"Row count mismatch: {valid_row_count} != {total_batch_rows}")
     
     logger.info(f"✓ Distributed {valid_row_count} valid rows across {num_batches} batches without splitting products")
-    if invalid_groups:
-        logger.info(f"ℹ️ Skipped {invalid_row_count} rows across {len(invalid_groups)} invalid product groups (missing price/image)")
+    if num_invalid_groups:
+        logger.info(f"ℹ️ Skipped {invalid_row_count} rows across {num_invalid_groups} invalid product groups (missing price/image)")
     return batch_dfs
 
 
@@ -141,7 +112,7 @@ def save_batch_csv(batch_df: pd.DataFrame, batch_num: int, temp_dir: Path) -> st
     """
     temp_dir.mkdir(parents=True, exist_ok=True)
     batch_file = temp_dir / f"batch_{batch_num}_source.csv"
-    batch_df.to_csv(batch_file, index=False)
+    fast_write(batch_df, str(batch_file))
     logger.info(f"Saved batch {batch_num} source CSV: {batch_file} ({len(batch_df)} rows)")
     return str(batch_file)
 
@@ -172,17 +143,6 @@ def migrate_batch(
     logger.info(f"BATCH {batch_num}/{total_batches} - Starting Migration")
     logger.info(f"{'='*80}")
     
-    # Count rows in batch source
-    batch_df = pd.read_csv(batch_source_csv, low_memory=False)
-    batch_size = len(batch_df)
-    
-    print(Fore.CYAN + f"\n{'='*80}")
-    print(Fore.CYAN + f"BATCH {batch_num}/{total_batches} - {batch_size} Products")
-    print(Fore.CYAN + f"{'='*80}")
-    print(f"Source: {batch_source_csv}")
-    print(f"Output: {output_path}")
-    print()
-    
     try:
         # Initialize orchestrator with full batch (no sample_size limit)
         orchestrator = MigrationOrchestrator(
@@ -193,8 +153,18 @@ def migrate_batch(
             sample_size=None  # Process all rows in this batch
         )
         
-        # Analyze source
+        # Analyze source (its row count doubles as the batch size, so the
+        # intermediate CSV is not parsed a second time just to count rows)
         analysis = orchestrator.analyze_source()
+        batch_size = analysis['row_count']
+        
+        print(Fore.CYAN + f"\n{'='*80}")
+        print(Fore.CYAN + f"BATCH {batch_num}/{total_batches} - {batch_size} Products")
+        print(Fore.CYAN + f"{'='*80}")
+        print(f"Source: {batch_source_csv}")
+        print(f"Output: {output_path}")
+        print()
+        
         print(Fore.GREEN + f"✓ Batch {batch_num} source analyzed: {analysis['row_count']} rows")
         print()
         
@@ -243,8 +213,9 @@ def verify_all_batches(output_files: list) -> dict:
             continue
         
         df = pd.read_csv(output_file, low_memory=False)
-        parent_rows = df[pd.notna(df['Title']) & (df['Title'] != '')]
-        variant_rows = df[pd.isna(df['Title']) | (df['Title'] == '')]
+        is_parent = df['Title'].notna() & df['Title'].ne('')
+        parent_rows = df[is_parent]
+        variant_rows = df[~is_parent]
         
         batch_rows = len(df)
         batch_parents = len(parent_rows)
@@ -383,13 +354,7 @@ def main():
         sys.exit(1)
     
     # Setup logging
-    log_level = config.get('logging', {}).get('level', 'INFO')
-    logger.remove()
-    logger.add(
-        sys.stderr,
-        format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <level>{message}</level>",
-        level=log_level
-    )
+    setup_logging(config.get('logging', {}).get('level', 'INFO'))
     
     # Create output directory
     output_path = Path(output_dir)
@@ -3,16 +3,65 @@
 Migrate final batches 20-28 for the truly missing 503 products.
 """
 
+import queue
 import sys
+import threading
 from pathlib import Path
-from colorama import Fore, Style, init
-
-init(autoreset=True)
+from colorama import Fore
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
-from scripts.migrate_batches import migrate_batch, load_config
+from scripts.migrate_batches import migrate_batch
+from scripts._cli_common import load_config, print_header, fast_read, PRICE_STRIP
 import pandas as pd
 
+def verify_batch(batch_num: int, output_path: Path, batch_source: Path) -> tuple:
+    """
+    Check a migrated batch for orphaned variants and zero-price parents, fixing either.
+    
+    Returns:
+        (products, rows) counted from the final output file
+    """
+    df = fast_read(str(output_path), dtype=str, keep_default_na=False)
+    title_empty = df['Title'].str.strip() == ''
+    parent_mask = ~title_empty
+    handles = df['Handle'].str.strip()
+    
+    parent_handles = set(handles[parent_mask].unique())
+    variant_handles = set(handles[title_empty].unique())
+    orphaned = variant_handles - parent_handles
+    
+    # Vectorized price check: a parent row passes if any price field parses to > 0
+    has_price = pd.Series(False, index=df.index[parent_mask])
+    for field in ('Price', 'Variant Price'):
+        if field in df:
+            prices = pd.to_numeric(
+                df.loc[parent_mask, field].str.replace(PRICE_STRIP, '', regex=True),
+                errors='coerce'
+            )
+            has_price |= prices.gt(0)
+    zero_price_count = int((~has_price).sum())
+    
+    if orphaned:
+        print(Fore.YELLOW + f"  ⚠️  Batch {batch_num}: found {len(orphaned)} orphaned handles - fixing...")
+        from scripts.fix_all_batches_6_10 import aggressive_fix_batch
+        aggressive_fix_batch(str(output_path))
+        print(Fore.GREEN + f"  ✅ Fixed!")
+    
+    if zero_price_count > 0:
+        print(Fore.YELLOW + f"  ⚠️  Batch {batch_num}: found {zero_price_count} parent rows with zero prices - fixing...")
+        from scripts.fix_parent_prices_6_10 import fix_parent_prices
+        fix_parent_prices(str(output_path), str(batch_source))
+        print(Fore.GREEN + f"  ✅ Fixed!")
+    
+    if not orphaned and zero_price_count == 0:
+        print(Fore.GREEN + f"  ✅✅✅ Batch {batch_num} is perfect!")
+    else:
+        # The fixers rewrite the file, so count from the repaired output
+        df = fast_read(str(output_path), dtype=str, keep_default_na=False)
+        parent_mask = df['Title'].str.strip() != ''
+    
+    return int(df.loc[parent_mask, 'Handle'].nunique()), len(df)
+
 def main():
     """Migrate batches 20-28."""
     
@@ -25,13 +74,32 @@ def main():
     batches_to_migrate = list(range(20, 29))
     total_batches = len(batches_to_migrate)
     
-    print(Fore.CYAN + "="*80)
-    print(Fore.CYAN + f"FINAL MIGRATION - BATCHES 20-28 ({total_batches} batches)")
-    print(Fore.CYAN + "="*80)
+    print_header(f"FINAL MIGRATION - BATCHES 20-28 ({total_batches} batches)")
     print()
     
     results = []
     
+    # Verification runs on a worker thread so the next batch migrates while the
+    # previous output is re-read and fixed; the bounded queue throttles migration
+    # if verification falls behind.
+    verify_queue = queue.Queue(maxsize=2)
+    
+    def verify_worker():
+        while True:
+            item = verify_queue.get()
+            if item is None:
+                break
+            result, output_path, batch_source = item
+            try:
+                result['products'], result['rows'] = verify_batch(result['batch'], output_path, batch_source)
+            except Exception as e:
+                print(Fore.RED + f"\n❌ Error verifying batch {result['batch']}: {e}")
+                result['success'] = False
+                result['error'] = str(e)
+    
+    verifier = threading.Thread(target=verify_worker, daemon=True)
+    verifier.start()
+    
     for batch_num in batches_to_migrate:
         batch_source = temp_dir / f"batch_{batch_num}_source.csv"
         
@@ -55,56 +123,19 @@ def main():
                 total_batches=total_batches
             )
             
-            results.append({
+            batch_result = {
                 'batch': batch_num,
                 'success': result.get('success', False),
                 'output_file': str(output_path),
                 'stats': result.get('stats', {})
-            })
+            }
+            results.append(batch_result)
             
             if result.get('success'):
                 print(Fore.GREEN + f"\n✅ Batch {batch_num} completed!")
                 
                 # Verify and fix
-                df = pd.read_csv(output_path, dtype=str, keep_default_na=False, low_memory=False)
-                parent_rows = df[df['Title'].astype(str).str.strip() != '']
-                
-                parent_handles = set(parent_rows['Handle'].astype(str).str.strip().unique())
-                variant_handles = set(df[df['Title'].astype(str).str.strip() == '']['Handle'].astype(str).str.strip().unique())
-                orphaned = variant_handles - parent_handles
-                
-                zero_price_count = 0
-                for idx, row in parent_rows.iterrows():
-                    price_fields = ['Price', 'Variant Price']
-                    has_price = False
-                    for field in price_fields:
-                        if field in row:
-                            price_str = str(row[field]).strip()
-                            if price_str and price_str.lower() != 'nan':
-                                try:
-                                    price = float(price_str.replace('$', '').replace(',', '').strip())
-                                    if price > 0:
-                                        has_price = True
-                                        break
-                                except:
-                                    pass
-                    if not has_price:
-                        zero_price_count += 1
-                
-                if orphaned:
-                    print(Fore.YELLOW + f"  ⚠️  Found {len(orphaned)} orphaned handles - fixing...")
-                    from scripts.fix_all_batches_6_10 import aggressive_fix_batch
-                    aggressive_fix_batch(str(output_path))
-                    print(Fore.GREEN + f"  ✅ Fixed!")
-                
-                if zero_price_count > 0:
-                    print(Fore.YELLOW + f"  ⚠️  Found {zero_price_count} parent rows with zero prices - fixing...")
-                    from scripts.fix_parent_prices_6_10 import fix_parent_prices
-                    fix_parent_prices(str(output_path), str(batch_source))
-                    print(Fore.GREEN + f"  ✅ Fixed!")
-                
-                if not orphaned and zero_price_count == 0:
-                    print(Fore.GREEN + f"  ✅✅✅ Batch {batch_num} is perfect!")
+                verify_queue.put((batch_result, output_path, batch_source))
         
         except Exception as e:
             print(Fore.RED + f"\n❌ Error migrating batch {batch_num}: {e}")
@@ -114,6 +145,9 @@ def main():
                 'error': str(e)
             })
     
+    verify_queue.put(None)
+    verifier.join()
+    
     # Summary
     print("\n" + "="*80)
     print(Fore.CYAN + "FINAL MIGRATION SUMMARY")
@@ -125,12 +159,9 @@ def main():
     print(f"\n✅ Successful batches: {len(successful)}/{total_batches}")
     total_products = 0
     for r in successful:
-        if Path(r['output_file']).exists():
-            df = pd.read_csv(r['output_file'], dtype=str, keep_default_na=False, low_memory=False)
-            parent_rows = df[df['Title'].astype(str).str.strip() != '']
-            products = len(parent_rows['Handle'].unique())
-            total_products += products
-            print(f"   Batch {r['batch']}: {products} products, {len(df):,} total rows")
+        # Counts were recorded by the verify pass, so no output re-reads here
+        total_products += r['products']
+        print(f"   Batch {r['batch']}: {r['products']} products, {r['rows']:,} total rows")
     
     print(f"\n📊 TOTAL NEW PRODUCTS MIGRATED: {total_products:,}")
     
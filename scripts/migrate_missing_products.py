@@ -6,24 +6,13 @@ Migrate missing products and create CSV with batch 1 field structure.
 import sys
 import pandas as pd
 from pathlib import Path
-import yaml
-from colorama import init, Fore
+from colorama import Fore
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.migration import MigrationOrchestrator, normalize_product_name, determine_product_group_id
 from src.csv_handler import CSVHandler
-
-init(autoreset=True)
-
-
-def load_config(config_path: str = "config/config.yaml") -> dict:
-    """Load configuration from YAML file."""
-    try:
-        with open(config_path, 'r') as f:
-            return yaml.safe_load(f)
-    except FileNotFoundError:
-        return {}
+from scripts._cli_common import load_config, print_header, fast_read
 
 
 def main():
@@ -37,16 +26,14 @@ def main():
     mapping_config = config.get('files', {}).get('mapping_config') or 'config/field_mapping.json'
     output_file = 'data/output/missing_products_with_batch1_fields.csv'
     
-    print(Fore.CYAN + "="*80)
-    print(Fore.CYAN + "MIGRATING MISSING PRODUCTS WITH BATCH 1 FIELD STRUCTURE")
-    print(Fore.CYAN + "="*80)
+    print_header("MIGRATING MISSING PRODUCTS WITH BATCH 1 FIELD STRUCTURE")
     print()
     
     handler = CSVHandler()
     
     # Read missing products
     print(f"Reading missing products from: {missing_file}")
-    missing_df = pd.read_csv(missing_file)
+    missing_df = fast_read(missing_file)
     missing_names = set(missing_df['Product Name'].str.strip().str.lower())
     print(f"Missing products: {Fore.GREEN + f'{len(missing_names):,}'}")
     print()
@@ -1,23 +1,14 @@
 import pandas as pd
+import os
 import sys
-import re
 import math
 from pathlib import Path
 from loguru import logger
-import yaml
 
 # Import migration functions
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from src.migration import normalize_product_name, determine_product_group_id
-
-def load_config(config_path: str = "config/config.yaml") -> dict:
-    """Load configuration from YAML file."""
-    try:
-        with open(config_path, 'r') as f:
-            return yaml.safe_load(f)
-    except FileNotFoundError:
-        logger.error(f"Config file not found: {config_path}")
-        return {}
+from scripts._cli_common import load_config, fast_read, fast_write, PRICE_STRIP
 
 def get_already_migrated_products():
     """Get list of products already migrated in batches 1-5."""
@@ -36,18 +27,30 @@ def get_already_migrated_products():
     print("IDENTIFYING ALREADY MIGRATED PRODUCTS")
     print("="*80)
     
+    # One directory listing instead of a stat per batch file
+    try:
+        with os.scandir('data/output') as entries:
+            present = {entry.name for entry in entries if entry.is_file()}
+    except FileNotFoundError:
+        present = set()
+    
     for batch_file in batch_files:
-        if not Path(batch_file).exists():
+        if Path(batch_file).name not in present:
             continue
         
-        df = pd.read_csv(batch_file, dtype=str, keep_default_na=False, low_memory=False)
-        parent_rows = df[df['Title'].astype(str).str.strip() != '']
+        df = fast_read(batch_file, dtype=str, keep_default_na=False, usecols=['Handle', 'Title'])
+        titles = df['Title'].str.strip()
+        parent_mask = titles != ''
+        
+        handles = df.loc[parent_mask, 'Handle'].str.strip()
+        handles = handles[(handles != '') & (handles.str.lower() != 'nan')]
+        titles = titles[parent_mask & (titles.str.lower() != 'nan')].unique()
         
-        handles = {h for h in parent_rows['Handle'].astype(str).str.strip().unique() if h and h.lower() != 'nan'}
-        titles = {t for t in parent_rows['Title'].astype(str).str.strip().unique() if t and t.lower() != 'nan'}
-        base_names = {normalize_product_name(t) for t in titles if normalize_product_name(t)}
+        # Normalize each distinct title once
+        base_names = {normalize_product_name(t) for t in titles}
+        base_names.discard('')
         
-        migrated_handles.update(handles)
+        migrated_handles.update(handles.tolist())
         migrated_base_names.update(base_names)
     
     print(f"Found {len(migrated_handles):,} already migrated products (by Handle)")
@@ -56,7 +59,12 @@ def get_already_migrated_products():
     return migrated_handles, migrated_base_names
 
 def find_remaining_products(source_file: str, migrated_handles: set, migrated_base_names: set):
-    """Find products in source that haven't been migrated yet."""
+    """
+    Find products in source that haven't been migrated yet.
+    
+    The returned DataFrame keeps the __BaseName and __ProductGroupID helper
+    columns so split_into_batches can reuse them; they are dropped per batch.
+    """
     print("\n" + "="*80)
     print("FINDING REMAINING PRODUCTS FROM SOURCE")
     print("="*80)
@@ -65,96 +73,77 @@ def find_remaining_products(source_file: str, migrated_handles: set, migrated_ba
         print(f"❌ ERROR: Source file not found: {source_file}")
         return pd.DataFrame()
     
-    df = pd.read_csv(source_file, low_memory=False)
+    df = fast_read(source_file)
     print(f"Total rows in source: {len(df):,}")
     
     # Compute base names and product group IDs
     df['__BaseName'] = df['Name'].apply(normalize_product_name)
     df['__ProductGroupID'] = df.apply(determine_product_group_id, axis=1)
     
+    # Row-level checks computed once as column masks instead of per-row apply
+    def text_present(series: pd.Series) -> pd.Series:
+        text = series.astype(str).str.strip()
+        return series.notna() & (text != '') & (text.str.lower() != 'nan')
+    
     # Check for price
-    def row_has_price(row: pd.Series) -> bool:
-        for field in ['Regular price', 'Sale price', 'Price']:
-            if field in row and pd.notna(row[field]):
-                try:
-                    price_str = str(row[field]).replace('$', '').replace(',', '').replace('₹', '').strip()
-                    if price_str and price_str.lower() != 'nan':
-                        price = float(price_str)
-                        if price > 0:
-                            return True
-                except Exception:
-                    continue
-        return False
+    has_price_row = pd.Series(False, index=df.index)
+    for field in ['Regular price', 'Sale price', 'Price']:
+        if field in df.columns:
+            prices = df[field]
+            if not pd.api.types.is_numeric_dtype(prices):
+                prices = pd.to_numeric(prices.astype(str).str.replace(PRICE_STRIP, '', regex=True), errors='coerce')
+            has_price_row |= prices.gt(0)
     
     # Check for image
-    def row_has_image(row: pd.Series) -> bool:
-        for field in ['Images', 'Image', 'images', 'image']:
-            if field in row:
-                img = row.get(field, '')
-                if pd.notna(img):
-                    img_str = str(img).strip()
-                    if img_str and img_str.lower() != 'nan':
-                        return True
-        return False
+    has_image_row = pd.Series(False, index=df.index)
+    for field in ['Images', 'Image', 'images', 'image']:
+        if field in df.columns:
+            has_image_row |= text_present(df[field])
     
     # Check for description
-    def row_has_description(row: pd.Series) -> bool:
-        desc_fields = ['Description', 'Short description', 'Body (HTML)', 'description', 'short_description']
-        for field in desc_fields:
-            if field in row:
-                desc = row.get(field, '')
-                if pd.notna(desc):
-                    desc_str = str(desc).strip()
-                    if desc_str and desc_str.lower() != 'nan' and desc_str.lower() != '':
-                        return True
-        return False
-    
-    # Group by product group
-    remaining_groups = []
-    already_migrated_groups = set()
-    
-    for group_id, group_df in df.groupby('__ProductGroupID', sort=False):
-        # Check if this group is already migrated
-        base_name = group_df['__BaseName'].iloc[0] if not group_df['__BaseName'].empty else ''
-        
-        # Check if base name is in migrated list
-        if base_name in migrated_base_names:
-            already_migrated_groups.add(group_id)
-            continue
-        
-        # Check if group has price, image, and description
-        has_price = group_df.apply(row_has_price, axis=1).any()
-        has_image = group_df.apply(row_has_image, axis=1).any()
-        has_description = group_df.apply(row_has_description, axis=1).any()
-        
-        # Only include if has ALL: price, image, AND description
-        if has_price and has_image and has_description:
-            remaining_groups.append((group_id, group_df.copy()))
-        else:
-            # Log why it's being skipped
-            missing = []
-            if not has_price:
-                missing.append("price")
-            if not has_image:
-                missing.append("image")
-            if not has_description:
-                missing.append("description")
-            logger.debug(f"Skipping group {group_id}: missing {', '.join(missing)}")
+    has_description_row = pd.Series(False, index=df.index)
+    desc_fields = ['Description', 'Short description', 'Body (HTML)', 'description', 'short_description']
+    for field in desc_fields:
+        if field in df.columns:
+            has_description_row |= text_present(df[field])
+    
+    # Roll all three row flags up to their product group in one groupby pass
+    flags = pd.DataFrame({
+        'price': has_price_row,
+        'image': has_image_row,
+        'description': has_description_row
+    }).groupby(df['__ProductGroupID'], sort=False).any()
+    
+    # Skip groups whose base name (taken from the group's first row) is already migrated
+    group_base_names = df.drop_duplicates('__ProductGroupID').set_index('__ProductGroupID')['__BaseName']
+    migrated = group_base_names.reindex(flags.index).isin(migrated_base_names)
+    already_migrated_groups = flags.index[migrated]
+    candidates = flags[~migrated]
+    
+    # Only include if has ALL: price, image, AND description
+    complete = candidates.all(axis=1)
+    keep_ids = candidates.index[complete]
+    
+    # Log why the rest are being skipped
+    for group_id, has_price, has_image, has_description in candidates[~complete].itertuples():
+        missing = []
+        if not has_price:
+            missing.append("price")
+        if not has_image:
+            missing.append("image")
+        if not has_description:
+            missing.append("description")
+        logger.debug(f"Skipping group {group_id}: missing {', '.join(missing)}")
     
     print(f"Already migrated groups: {len(already_migrated_groups):,}")
-    print(f"Remaining valid groups (with price, image, description): {len(remaining_groups):,}")
+    print(f"Remaining valid groups (with price, image, description): {len(keep_ids):,}")
     
-    if not remaining_groups:
+    if len(keep_ids) == 0:
         print("❌ No remaining products found that meet all requirements!")
         return pd.DataFrame()
     
-    # Combine remaining groups into one DataFrame
-    remaining_df = pd.concat([group_df for _, group_df in remaining_groups]).sort_index()
-    
-    # Remove helper columns
-    for col in ['__BaseName', '__ProductGroupID']:
-        if col in remaining_df.columns:
-            remaining_df = remaining_df.drop(columns=[col])
+    # Slice remaining groups out in one pass (rows stay in source order)
+    remaining_df = df.loc[df['__ProductGroupID'].isin(keep_ids)]
     
     print(f"Total rows in remaining products: {len(remaining_df):,}")
     
@@ -166,39 +155,27 @@ def split_into_batches(df: pd.DataFrame, num_batches: int = 5):
     print(f"SPLITTING INTO {num_batches} BATCHES")
     print("="*80)
     
-    # Re-compute grouping (since we removed helper columns)
-    df['__BaseName'] = df['Name'].apply(normalize_product_name)
-    df['__ProductGroupID'] = df.apply(determine_product_group_id, axis=1)
-    
-    # Group by product group
-    valid_groups = []
-    for group_id, group_df in df.groupby('__ProductGroupID', sort=False):
-        first_idx = group_df.index.min()
-        valid_groups.append((first_idx, group_id, group_df.copy()))
+    # Reuse the grouping from find_remaining_products; compute it only for bare frames
+    if '__ProductGroupID' not in df.columns:
+        df = df.copy()
+        df['__BaseName'] = df['Name'].apply(normalize_product_name)
+        df['__ProductGroupID'] = df.apply(determine_product_group_id, axis=1)
     
-    valid_groups.sort(key=lambda item: item[0])
+    # Number groups in order of first appearance, then bucket consecutive groups
+    group_rank = df.groupby('__ProductGroupID', sort=False).ngroup()
+    num_groups = int(group_rank.max()) + 1 if len(df) else 0
+    groups_per_batch = math.ceil(num_groups / num_batches) if num_groups else 0
+    bucket = group_rank // groups_per_batch if groups_per_batch else group_rank
     
     # Split into batches
     batch_dfs = []
-    groups_per_batch = math.ceil(len(valid_groups) / num_batches) if valid_groups else 0
     
     for i in range(num_batches):
-        start = i * groups_per_batch
-        end = min((i + 1) * groups_per_batch, len(valid_groups))
-        batch_groups = valid_groups[start:end]
-        
-        if not batch_groups:
-            batch_df = pd.DataFrame(columns=df.columns)
-        else:
-            batch_df = pd.concat([group_df for _, _, group_df in batch_groups]).sort_index()
-        
-        # Remove helper columns
-        for col in ['__BaseName', '__ProductGroupID']:
-            if col in batch_df.columns:
-                batch_df = batch_df.drop(columns=[col])
+        batch_groups = max(0, min(groups_per_batch, num_groups - i * groups_per_batch))
+        batch_df = df.loc[bucket == i].drop(columns=['__BaseName', '__ProductGroupID'])
         
         batch_dfs.append(batch_df)
-        print(f"Batch {i+1}: {len(batch_df):,} rows across {len(batch_groups)} product groups")
+        print(f"Batch {i+1}: {len(batch_df):,} rows across {batch_groups} product groups")
     
     return batch_dfs
 
@@ -223,7 +200,7 @@ def main():
     # Determine number of batches needed
     # Estimate: if we have ~10,000 products and want ~300 per batch, we need ~33 batches
     # But let's start with 5 batches and see how many products we have
-    estimated_products = len(remaining_df.groupby(remaining_df['Name'].apply(normalize_product_name)))
+    estimated_products = remaining_df['__BaseName'].nunique()
     num_batches = max(5, math.ceil(estimated_products / 300))  # ~300 products per batch
     
     print(f"\nEstimated {estimated_products:,} products remaining")
@@ -241,7 +218,7 @@ def main():
         if batch_df.empty:
             continue
         batch_file = temp_dir / f"batch_{i}_source.csv"
-        batch_df.to_csv(batch_file, index=False)
+        fast_write(batch_df, str(batch_file))
         batch_files.append((i, str(batch_file)))
         print(f"Saved batch {i} source: {batch_file} ({len(batch_df)} rows)")
     
@@ -9,7 +9,6 @@ import sys
 import argparse
 from pathlib import Path
 from dotenv import load_dotenv
-import yaml
 import os
 from loguru import logger
 from colorama import init, Fore, Style
@@ -20,19 +19,16 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.migration import MigrationOrchestrator
 from src.csv_handler import CSVHandler
+from scripts._cli_common import load_config, PRICE_STRIP
 
 # Initialize colorama for colored output
 init(autoreset=True)
 
+# Columns needed to find the product, analyze it and determine its product group
+LOOKUP_COLUMNS = ['Name', 'SKU', 'Regular price', 'Sale price', 'Images', 'Description', 'Parent', 'Type']
 
-def load_config(config_path: str = "config/config.yaml") -> dict:
-    """Load configuration from YAML file."""
-    try:
-        with open(config_path, 'r') as f:
-            return yaml.safe_load(f)
-    except FileNotFoundError:
-        logger.warning(f"Config file not found: {config_path}")
-        return {}
+# Identifier columns read as text in both reads, so codes like 0004 keep their leading zeros
+IDENTIFIER_DTYPES = {'SKU': str, 'Parent': str}
 
 
 def get_file_paths(args, config: dict) -> tuple:
@@ -67,6 +63,16 @@ def get_file_paths(args, config: dict) -> tuple:
     return source_csv, shopify_template, output_dir, mapping_config
 
 
+def _parse_price(value) -> float:
+    """Parse a price cell, returning 0.0 when it is empty or not numeric."""
+    if pd.isna(value):
+        return 0.0
+    try:
+        return float(PRICE_STRIP.sub('', str(value)))
+    except ValueError:
+        return 0.0
+
+
 def analyze_product_fields(row: pd.Series) -> dict:
     """Analyze a product row to identify missing fields."""
     analysis = {
@@ -93,23 +99,10 @@ def analyze_product_fields(row: pd.Series) -> dict:
         analysis['missing_fields'].append('SKU')
     
     # Check Price
-    regular_price = row.get('Regular price', '')
-    sale_price = row.get('Sale price', '')
-    has_price = False
-    if pd.notna(regular_price):
-        try:
-            price_val = float(str(regular_price).replace('$', '').replace(',', '').strip())
-            if price_val > 0:
-                has_price = True
-        except:
-            pass
-    if not has_price and pd.notna(sale_price):
-        try:
-            price_val = float(str(sale_price).replace('$', '').replace(',', '').strip())
-            if price_val > 0:
-                has_price = True
-        except:
-            pass
+    has_price = (
+        _parse_price(row.get('Regular price', '')) > 0 or
+        _parse_price(row.get('Sale price', '')) > 0
+    )
     if has_price:
         analysis['has_price'] = True
     else:
@@ -132,6 +125,29 @@ def analyze_product_fields(row: pd.Series) -> dict:
     return analysis
 
 
+def analyze_product_fields_df(df: pd.DataFrame) -> pd.DataFrame:
+    """Vectorized analyze_product_fields: one boolean column per check for every row."""
+    def text(column: str) -> pd.Series:
+        if column not in df.columns:
+            return pd.Series('', index=df.index)
+        return df[column].astype(str).str.strip().where(df[column].notna(), '')
+    
+    def price(column: str) -> pd.Series:
+        if column not in df.columns:
+            return pd.Series(0.0, index=df.index)
+        return pd.to_numeric(df[column].astype(str).str.replace(PRICE_STRIP, '', regex=True), errors='coerce')
+    
+    images = text('Images')
+    description = text('Description')
+    return pd.DataFrame({
+        'has_name': text('Name') != '',
+        'has_sku': text('SKU') != '',
+        'has_price': price('Regular price').gt(0) | price('Sale price').gt(0),
+        'has_image': (images != '') & (images.str.lower() != 'nan'),
+        'has_description': (description != '') & (description.str.lower() != 'nan'),
+    })
+
+
 def main():
     """Main migration function."""
     parser = argparse.ArgumentParser(
@@ -215,19 +231,23 @@ def main():
         level=log_level
     )
     
-    # Load source CSV to find product
+    # Load only the lookup columns of the source CSV to find the product
     handler = CSVHandler()
-    source_df = handler.read_csv(source_csv, low_memory=False)
+    source_df = handler.read_csv(
+        source_csv, usecols=lambda col: col in LOOKUP_COLUMNS, dtype=IDENTIFIER_DTYPES, low_memory=False
+    )
     
     # Find the product to migrate
     if args.product_name:
         # Find by product name
-        matching_rows = source_df[source_df['Name'].str.contains(args.product_name, case=False, na=False)]
-        if len(matching_rows) == 0:
+        # Plain substring match: no regex compilation, and names with '(' or '+' work
+        matches = source_df['Name'].str.contains(args.product_name, case=False, na=False, regex=False)
+        if not matches.any():
             print(Fore.RED + f"ERROR: No product found with name containing: {args.product_name}")
             sys.exit(1)
-        row_index = matching_rows.index[0]
-        product_row = matching_rows.iloc[0]
+        # First match straight from the mask, without slicing out every matching row
+        row_index = matches.idxmax()
+        product_row = source_df.loc[row_index]
     else:
         # Use row index
         if args.row_index >= len(source_df):
@@ -262,34 +282,42 @@ def main():
         print(Fore.GREEN + "Note: Product will be migrated with empty/default values for missing fields")
         print()
     
-    # Create a temporary CSV with just this product
-    temp_csv = Path(output_dir) / "temp_single_product_test.csv"
-    temp_csv.parent.mkdir(parents=True, exist_ok=True)
-    
     # Get all rows that belong to the same product group (for variants)
-    from src.migration import normalize_product_name, determine_product_group_id
+    from src.migration import determine_product_group_id, determine_product_group_ids
     
     product_group_id = determine_product_group_id(product_row)
-    source_df['__ProductGroupID'] = source_df.apply(determine_product_group_id, axis=1)
-    product_group_df = source_df[source_df['__ProductGroupID'] == product_group_id].copy()
-    
-    # Save to temp CSV
-    handler.write_csv(product_group_df.drop(columns=['__ProductGroupID']), str(temp_csv))
+    # Categorical IDs: the equality test below compares integer codes, not strings
+    source_df['__ProductGroupID'] = determine_product_group_ids(source_df).astype('category')
+    group_index = source_df.index[source_df['__ProductGroupID'] == product_group_id]
+    
+    # Read every column for just the header and this group's rows in one call, so
+    # column types are inferred from the same rows however large the file is
+    # (file row 0 is the header, so data row i is file row i + 1)
+    keep_rows = set(group_index + 1) | {0}
+    product_group_df = handler.read_csv(
+        source_csv,
+        encoding=handler.detected_encoding,
+        skiprows=lambda file_row: file_row not in keep_rows,
+        dtype=IDENTIFIER_DTYPES,
+        low_memory=False
+    )
+    product_group_df.index = group_index
     
-    print(Fore.CYAN + f"Created temporary CSV with {len(product_group_df)} rows (including variants)")
+    print(Fore.CYAN + f"Selected {len(product_group_df)} rows (including variants)")
     print()
     
     # Create output path
     output_path = Path(output_dir) / "shopify_single_product_test.csv"
+    output_path.parent.mkdir(parents=True, exist_ok=True)
     
     try:
-        # Initialize orchestrator with temp CSV
-        orchestrator = MigrationOrchestrator(
-            source_csv_path=str(temp_csv),
+        # Hand the product group straight to the orchestrator, no temp CSV round-trip
+        orchestrator = MigrationOrchestrator.from_dataframe(
+            product_group_df,
             shopify_template_path=shopify_template,
             output_path=str(output_path),
             mapping_config_path=mapping_config,
-            sample_size=None  # Migrate all rows in the temp CSV
+            sample_size=None  # Migrate every row of the product group
         )
         
         # Execute migration
@@ -322,18 +350,9 @@ def main():
             print("2. Check that missing fields are handled correctly (empty/default values)")
             print("3. If everything looks good, proceed with full batch migration")
         
-        # Clean up temp file
-        if temp_csv.exists():
-            temp_csv.unlink()
-            print()
-            print(Fore.GREEN + f"✓ Cleaned up temporary file: {temp_csv}")
-        
     except Exception as e:
         logger.exception("Migration failed with error")
         print(Fore.RED + f"\nERROR: Migration failed: {e}")
-        # Clean up temp file on error
-        if temp_csv.exists():
-            temp_csv.unlink()
         sys.exit(1)
 
 
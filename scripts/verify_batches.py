@@ -3,53 +3,140 @@
 Verify all batch files and ensure no products are missed.
 """
 
+import io
+import os
 import sys
 import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-import glob
-from colorama import init, Fore
+from colorama import init, Fore, Style
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from scripts._cli_common import PRICE_STRIP, iter_csv_chunks
 
 init(autoreset=True)
 
 
+# Rows per chunk when scanning a batch file; bounds memory regardless of batch size
+CHUNK_SIZE = 1_000_000
+
+# Known Shopify schema for the columns verification needs: all read as text, no inference
+BATCH_DTYPES = {'Title': str, 'Handle': str, 'Variant Price': str}
+
+
+def notna_and_nonempty(series: pd.Series) -> pd.Series:
+    """Mask of cells that hold a non-empty value (parent rows when applied to Title)."""
+    return series.notna() & series.ne('')
+
+
+def parse_prices(series: pd.Series) -> pd.Series:
+    """
+    Parse a text price column to floats, NaN where unparseable.
+    
+    Plain numbers (the usual case in Shopify output) convert directly; only the
+    cells that fail go through the currency/separator regex strip.
+    """
+    prices = pd.to_numeric(series, errors='coerce')
+    retry = prices.isna() & series.notna()
+    if retry.any():
+        stripped = series[retry].str.replace(PRICE_STRIP, '', regex=True)
+        prices[retry] = pd.to_numeric(stripped, errors='coerce')
+    return prices
+
+
+def scan_batch(batch_file: Path) -> dict:
+    """
+    Count rows and zero prices in one batch file with a single chunked pass.
+    
+    Args:
+        batch_file: Path to a Shopify batch CSV
+        
+    Returns:
+        Dictionary with rows, parents, variants and zero_prices counts
+    """
+    stats = {'rows': 0, 'parents': 0, 'variants': 0, 'zero_prices': 0}
+    variant_handles = set()
+    zero_price_parent_handles = []
+    
+    for chunk in iter_csv_chunks(batch_file, list(BATCH_DTYPES), CHUNK_SIZE, dtype=BATCH_DTYPES):
+        # One parent/variant mask per chunk, reused for counts and price checks
+        is_parent = notna_and_nonempty(chunk['Title'])
+        is_variant = ~is_parent
+        
+        stats['rows'] += len(chunk)
+        stats['parents'] += int(is_parent.sum())
+        stats['variants'] += int(is_variant.sum())
+        
+        is_zero = parse_prices(chunk['Variant Price']).eq(0)
+        
+        # Variant prices are checked directly; parents only count when they turn
+        # out to be single products (no variants anywhere in the file)
+        stats['zero_prices'] += int((is_zero & is_variant).sum())
+        variant_handles.update(chunk.loc[is_variant, 'Handle'].unique())
+        zero_price_parent_handles.extend(chunk.loc[is_zero & is_parent, 'Handle'])
+    
+    single_zero = ~pd.Series(zero_price_parent_handles, dtype=object).isin(list(variant_handles))
+    stats['zero_prices'] += int(single_zero.sum())
+    return stats
+
+
 def verify_batches(output_dir: str = "data/output", num_batches: int = 5):
     """Verify all batch files."""
-    print(Fore.CYAN + "=" * 80)
-    print(Fore.CYAN + "BATCH VERIFICATION")
-    print(Fore.CYAN + "=" * 80)
-    print()
+    # Collect the report and write it to stdout once, instead of one print per line
+    report = io.StringIO()
+    
+    def emit(text: str = '') -> None:
+        # autoreset only fires per stdout write, so reset colours at each line end
+        report.write(text + Style.RESET_ALL + '\n')
+    
+    try:
+        return _verify_batches(output_dir, num_batches, emit)
+    finally:
+        sys.stdout.write(report.getvalue())
+        sys.stdout.flush()
+
+
+def _verify_batches(output_dir: str, num_batches: int, emit) -> bool:
+    """Scan the batch files and emit the verification report line by line."""
+    emit(Fore.CYAN + "=" * 80)
+    emit(Fore.CYAN + "BATCH VERIFICATION")
+    emit(Fore.CYAN + "=" * 80)
+    emit()
     
     # Find all batch files
-    batch_files = sorted(glob.glob(f"{output_dir}/shopify_products_batch_*_of_{num_batches}.csv"))
+    batch_files = sorted(Path(output_dir).glob(f"shopify_products_batch_*_of_{num_batches}.csv"))
     
     if not batch_files:
-        print(Fore.RED + f"❌ No batch files found in {output_dir}")
-        print(f"Expected files: shopify_products_batch_1_of_{num_batches}.csv through shopify_products_batch_{num_batches}_of_{num_batches}.csv")
+        emit(Fore.RED + f"❌ No batch files found in {output_dir}")
+        emit(f"Expected files: shopify_products_batch_1_of_{num_batches}.csv through shopify_products_batch_{num_batches}_of_{num_batches}.csv")
         return False
     
-    print(f"Found {len(batch_files)} batch files:")
-    print()
+    emit(f"Found {len(batch_files)} batch files:")
+    emit()
     
     total_rows = 0
     total_parents = 0
     total_variants = 0
+    zero_price_count = 0
     batch_stats = []
     
-    for batch_file in batch_files:
-        df = pd.read_csv(batch_file, low_memory=False)
-        parent_rows = df[pd.notna(df['Title']) & (df['Title'] != '')]
-        variant_rows = df[pd.isna(df['Title']) | (df['Title'] == '')]
-        
-        batch_rows = len(df)
-        batch_parents = len(parent_rows)
-        batch_variants = len(variant_rows)
+    # Batch files are independent, so scan them in parallel; results come back
+    # in file order, keeping the report below sequential
+    with ProcessPoolExecutor(max_workers=min(len(batch_files), os.cpu_count() or 1)) as executor:
+        all_stats = list(executor.map(scan_batch, batch_files))
+    
+    for batch_file, stats in zip(batch_files, all_stats):
+        batch_rows = stats['rows']
+        batch_parents = stats['parents']
+        batch_variants = stats['variants']
+        zero_price_count += stats['zero_prices']
         
         total_rows += batch_rows
         total_parents += batch_parents
         total_variants += batch_variants
         
-        file_size = Path(batch_file).stat().st_size / 1024 / 1024
-        batch_name = Path(batch_file).name
+        file_size = batch_file.stat().st_size / (1024 * 1024)
+        batch_name = batch_file.name
         
         batch_stats.append({
             'file': batch_name,
@@ -59,57 +146,39 @@ def verify_batches(output_dir: str = "data/output", num_batches: int = 5):
             'size_mb': file_size
         })
         
-        print(Fore.GREEN + f"✓ {batch_name}")
-        print(f"  Rows: {batch_rows:,} (Parents: {batch_parents:,}, Variants: {batch_variants:,})")
-        print(f"  Size: {file_size:.2f} MB")
-        print()
+        emit(Fore.GREEN + f"✓ {batch_name}")
+        emit(f"  Rows: {batch_rows:,} (Parents: {batch_parents:,}, Variants: {batch_variants:,})")
+        emit(f"  Size: {file_size:.2f} MB")
+        emit()
     
     # Check for zero prices
-    print(Fore.CYAN + "Checking for zero prices...")
-    zero_price_count = 0
-    for batch_file in batch_files:
-        df = pd.read_csv(batch_file, low_memory=False)
-        variant_rows = df[pd.isna(df['Title']) | (df['Title'] == '')]
-        parent_rows = df[pd.notna(df['Title']) & (df['Title'] != '')]
-        single_products = parent_rows[~parent_rows['Handle'].isin(variant_rows['Handle'].unique())]
-        
-        # Check variant prices
-        variant_prices = variant_rows['Variant Price'].astype(str).str.replace('$', '').str.replace(',', '').str.strip()
-        variant_prices_numeric = pd.to_numeric(variant_prices, errors='coerce')
-        zero_variant = len(variant_prices_numeric[variant_prices_numeric == 0])
-        
-        # Check single product prices
-        single_prices = single_products['Variant Price'].astype(str).str.replace('$', '').str.replace(',', '').str.strip()
-        single_prices_numeric = pd.to_numeric(single_prices, errors='coerce')
-        zero_single = len(single_prices_numeric[single_prices_numeric == 0])
-        
-        zero_price_count += zero_variant + zero_single
-    
+    # Zero prices were counted during the same pass
+    emit(Fore.CYAN + "Checking for zero prices...")
     if zero_price_count == 0:
-        print(Fore.GREEN + f"✓ No zero prices found across all batches")
+        emit(Fore.GREEN + f"✓ No zero prices found across all batches")
     else:
-        print(Fore.RED + f"❌ Found {zero_price_count} rows with zero prices")
+        emit(Fore.RED + f"❌ Found {zero_price_count} rows with zero prices")
     
-    print()
+    emit()
     
     # Summary
-    print(Fore.CYAN + "=" * 80)
-    print(Fore.CYAN + "BATCH VERIFICATION SUMMARY")
-    print(Fore.CYAN + "=" * 80)
-    print()
-    print(f"Total batches: {len(batch_files)}")
-    print(f"Total rows: {Fore.GREEN + f'{total_rows:,}'}")
-    print(f"Total parent products: {Fore.GREEN + f'{total_parents:,}'}")
-    print(f"Total variant rows: {Fore.GREEN + f'{total_variants:,}'}")
-    print(f"Zero prices: {Fore.GREEN + '0' if zero_price_count == 0 else Fore.RED + str(zero_price_count)}")
-    print()
+    emit(Fore.CYAN + "=" * 80)
+    emit(Fore.CYAN + "BATCH VERIFICATION SUMMARY")
+    emit(Fore.CYAN + "=" * 80)
+    emit()
+    emit(f"Total batches: {len(batch_files)}")
+    emit(f"Total rows: {Fore.GREEN + f'{total_rows:,}'}")
+    emit(f"Total parent products: {Fore.GREEN + f'{total_parents:,}'}")
+    emit(f"Total variant rows: {Fore.GREEN + f'{total_variants:,}'}")
+    emit(f"Zero prices: {Fore.GREEN + '0' if zero_price_count == 0 else Fore.RED + str(zero_price_count)}")
+    emit()
     
     if zero_price_count == 0:
-        print(Fore.GREEN + "✅✅✅ ALL BATCHES VERIFIED - READY FOR SHOPIFY IMPORT! ✅✅✅")
+        emit(Fore.GREEN + "✅✅✅ ALL BATCHES VERIFIED - READY FOR SHOPIFY IMPORT! ✅✅✅")
     else:
-        print(Fore.YELLOW + "⚠️  Some batches have zero prices - review before import")
+        emit(Fore.YELLOW + "⚠️  Some batches have zero prices - review before import")
     
-    print()
+    emit()
     return zero_price_count == 0
 
 
@@ -4,12 +4,87 @@ Comprehensive Migration Verification Script
 Checks all critical aspects of the Shopify migration output.
 """
 
+import argparse
+import re
+import numpy as np
 import pandas as pd
 import sys
 from pathlib import Path
 
-def verify_migration(output_file: str):
-    """Perform comprehensive verification of migration output."""
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from scripts._cli_common import read_header, iter_csv_chunks
+
+# Columns the checks below read; everything else in the Shopify export is skipped
+NEEDED_COLUMNS = [
+    'Title', 'Handle', 'Body (HTML)', 'Image Src', 'Option1 Name', 'Option1 Value',
+    'Variant Price', 'Variant SKU', 'Variant Inventory Tracker', 'Variant Inventory Qty',
+    'Variant Inventory Policy', 'Variant Fulfillment Service', 'Product category'
+]
+
+# Low-cardinality columns (a Handle repeats on every variant row) are converted to
+# categoricals so isin/value_counts/equality run on integer codes
+CATEGORICAL_COLUMNS = [
+    'Handle', 'Variant Inventory Tracker', 'Variant Inventory Policy',
+    'Variant Fulfillment Service', 'Product category'
+]
+
+# Wide HTML/URL columns are only checked for presence, so each chunk reduces them
+# to boolean flags before any of it becomes Python strings
+PRESENCE_COLUMNS = ['Body (HTML)', 'Image Src']
+CHUNK_SIZE = 200_000
+
+# Placeholder category text left behind by WooCommerce ("Uncategorised"/"Uncategorized")
+UNCATEGORISED_RE = re.compile(r'uncategori[sz]ed', re.IGNORECASE)
+
+# Markers of the tabbed description template, found in one scan of the HTML
+DESCRIPTION_FEATURES_RE = re.compile(
+    'tabs-container|tab active|@media|max-width|addEventListener|querySelectorAll'
+)
+
+def read_output(output_file: str) -> tuple:
+    """
+    Stream the output CSV in chunks, keeping short columns and presence flags.
+    
+    The needed columns are read as text block by block by pyarrow's streaming
+    reader (pandas' chunked reader without it), so only one chunk of the wide
+    HTML and image columns is held before it is reduced to flags.
+    
+    Returns:
+        (DataFrame, sample description) where the sample is the first parent
+        row's non-empty Body (HTML), or None
+    """
+    chunks = []
+    sample_description = None
+    
+    # Needed columns are read as text so no type inference runs
+    usecols = [col for col in read_header(output_file) if col in NEEDED_COLUMNS]
+    for chunk in iter_csv_chunks(output_file, usecols, CHUNK_SIZE, dtype=str):
+        for column in PRESENCE_COLUMNS:
+            if column not in chunk.columns:
+                continue
+            present = chunk[column].notna() & (chunk[column] != '')
+            if column == 'Body (HTML)' and sample_description is None:
+                parent_present = present & chunk['Title'].notna() & (chunk['Title'] != '')
+                if parent_present.any():
+                    sample_description = str(chunk.loc[parent_present, column].iloc[0])
+            chunk[column] = present
+        chunks.append(chunk)
+    
+    df = pd.concat(chunks, ignore_index=True)
+    for column in CATEGORICAL_COLUMNS:
+        if column in df.columns:
+            df[column] = df[column].astype('category')
+    
+    return df, sample_description
+
+def verify_migration(output_file: str, fail_fast: bool = False):
+    """
+    Perform comprehensive verification of migration output.
+    
+    Args:
+        output_file: Shopify CSV to verify
+        fail_fast: Stop after the first section that fails
+    """
     
     print("=" * 80)
     print("COMPREHENSIVE MIGRATION VERIFICATION")
@@ -17,7 +92,7 @@ def verify_migration(output_file: str):
     print()
     
     try:
-        df = pd.read_csv(output_file)
+        df, sample_description = read_output(output_file)
     except Exception as e:
         print(f"❌ ERROR: Could not read output file: {e}")
         return False
@@ -25,385 +100,420 @@ def verify_migration(output_file: str):
     print(f"Total rows in output: {len(df)}")
     print()
     
-    # Get parent rows (rows with Title)
-    parent_rows = df[pd.notna(df['Title']) & (df['Title'] != '')]
-    variant_rows = df[pd.isna(df['Title']) | (df['Title'] == '')]
-    
-    print(f"Parent products: {len(parent_rows)}")
-    print(f"Variant rows: {len(variant_rows)}")
+    def nonempty(column: str) -> np.ndarray:
+        """Boolean array of rows whose column holds a non-empty value."""
+        if column in PRESENCE_COLUMNS:
+            return df[column].to_numpy(dtype=bool)
+        values = df[column]
+        return (values.notna() & (values != '')).to_numpy()
+    
+    # Get parent rows (rows with Title); the masks are built once and reused by every section
+    is_parent = nonempty('Title')
+    is_variant = ~is_parent
+    parent_rows = df[is_parent]
+    variant_rows = df[is_variant]
+    parent_count = len(parent_rows)
+    variant_count = len(variant_rows)
+    
+    print(f"Parent products: {parent_count}")
+    print(f"Variant rows: {variant_count}")
     print()
     
-    all_checks_passed = True
+    # One groupby pass gives the per-Handle row counts every handle-level check reads
+    handle_flags = {'parents': is_parent, 'variants': is_variant}
+    if 'Image Src' in df.columns:
+        handle_flags['images'] = nonempty('Image Src')
+    per_handle = pd.DataFrame(handle_flags, index=df.index).groupby(df['Handle'], observed=True, sort=False).sum()
     
-    # ========== 1. PRICE CHECKS ==========
-    print("=" * 80)
-    print("1. PRICE VERIFICATION")
-    print("=" * 80)
+    # A parent has variants when some variant row shares its Handle
+    has_variants = per_handle['variants'].reindex(parent_rows['Handle']).gt(0).to_numpy()
+    single_products = parent_rows.index[~has_variants]
     
-    if 'Variant Price' in df.columns:
-        # Check parent rows with variants (should have empty Variant Price)
-        parents_with_variants = []
-        for idx, parent in parent_rows.iterrows():
-            handle = parent.get('Handle', '')
-            if handle:
-                variants = df[(df['Handle'] == handle) & (df.index != idx) & 
-                             (pd.isna(df['Title']) | (df['Title'] == ''))]
-                if len(variants) > 0:
-                    parents_with_variants.append(idx)
-        
-        # Check variant rows have prices
-        variant_prices = variant_rows['Variant Price'].notna() & (variant_rows['Variant Price'] != '')
-        variant_prices_valid = variant_rows[variant_prices]
-        
-        # Check for zero prices
-        zero_prices = []
-        for idx, row in variant_prices_valid.iterrows():
-            try:
-                price_str = str(row['Variant Price']).replace('₹', '').replace(',', '').strip()
-                price_val = float(price_str)
-                if price_val <= 0:
-                    zero_prices.append((idx, row.get('Handle', 'N/A'), price_val))
-            except:
-                pass
-        
-        # Check single products have prices
-        single_products = [idx for idx in parent_rows.index if idx not in parents_with_variants]
-        single_product_prices = []
-        for idx in single_products:
-            row = df.loc[idx]
-            price = row.get('Variant Price', '')
-            if not price or str(price).strip() == '':
-                single_product_prices.append((idx, row.get('Title', 'N/A')))
-            else:
-                try:
-                    price_str = str(price).replace('₹', '').replace(',', '').strip()
-                    price_val = float(price_str)
-                    if price_val <= 0:
-                        zero_prices.append((idx, row.get('Handle', 'N/A'), price_val))
-                except:
-                    pass
-        
-        print(f"  ✓ Variant rows with prices: {len(variant_prices_valid)}/{len(variant_rows)}")
-        print(f"  ✓ Zero prices found: {len(zero_prices)}")
-        if zero_prices:
-            print(f"    ⚠️  Products with zero price:")
-            for idx, handle, price in zero_prices[:5]:
-                print(f"      - {handle}: ${price}")
-            all_checks_passed = False
-        print(f"  ✓ Single products with prices: {len(single_products) - len(single_product_prices)}/{len(single_products)}")
-        if single_product_prices:
-            print(f"    ⚠️  Single products missing prices: {len(single_product_prices)}")
-            all_checks_passed = False
-    else:
-        print("  ❌ Variant Price column not found")
-        all_checks_passed = False
+    # Rows carrying variant data (a price or SKU), shared by the fulfillment and policy checks
+    has_price_or_sku = np.zeros(len(df), dtype=bool)
+    for column in ('Variant Price', 'Variant SKU'):
+        if column in df.columns:
+            has_price_or_sku |= df[column].notna().to_numpy()
+    variant_data_count = int(has_price_or_sku.sum())
     
-    print()
+    # ========== 1. PRICE CHECKS ==========
+    def check_prices() -> bool:
+        passed = True
+        
+        print("=" * 80)
+        print("1. PRICE VERIFICATION")
+        print("=" * 80)
+        
+        if 'Variant Price' in df.columns:
+            # Parse every price once (unparseable prices become NaN and are not flagged)
+            price_text = df['Variant Price'].str.replace(r'[₹,]', '', regex=True).str.strip()
+            prices = pd.to_numeric(price_text, errors='coerce').astype(float)
+            is_zero_price = prices <= 0
+            
+            # Check variant rows have prices
+            variant_prices_valid = df.index[is_variant & nonempty('Variant Price')]
+            
+            # Check single products have prices (whitespace-only text counts as missing)
+            single_missing_price = df.loc[single_products, 'Variant Price'].str.strip().eq('')
+            
+            # Check for zero prices: variant rows first, then single products
+            variant_zero = variant_prices_valid[is_zero_price.loc[variant_prices_valid].to_numpy()]
+            single_zero = single_products[(~single_missing_price & is_zero_price.loc[single_products]).to_numpy()]
+            zero_price_index = variant_zero.append(single_zero)
+            
+            print(f"  ✓ Variant rows with prices: {len(variant_prices_valid)}/{variant_count}")
+            print(f"  ✓ Zero prices found: {len(zero_price_index)}")
+            if len(zero_price_index) > 0:
+                print(f"    ⚠️  Products with zero price:")
+                for idx in zero_price_index[:5]:
+                    print(f"      - {df.at[idx, 'Handle']}: ${prices[idx]}")
+                passed = False
+            missing_price_count = int(single_missing_price.sum())
+            print(f"  ✓ Single products with prices: {len(single_products) - missing_price_count}/{len(single_products)}")
+            if missing_price_count:
+                print(f"    ⚠️  Single products missing prices: {missing_price_count}")
+                passed = False
+        else:
+            print("  ❌ Variant Price column not found")
+            passed = False
+        
+        print()
+        
+        return passed
     
     # ========== 2. DESCRIPTION CHECKS ==========
-    print("=" * 80)
-    print("2. DESCRIPTION VERIFICATION")
-    print("=" * 80)
-    
-    if 'Body (HTML)' in df.columns:
-        parent_descriptions = parent_rows['Body (HTML)'].notna() & (parent_rows['Body (HTML)'] != '')
-        missing_descriptions = parent_rows[~parent_descriptions]
+    def check_descriptions() -> bool:
+        passed = True
         
-        print(f"  ✓ Products with descriptions: {len(parent_rows[parent_descriptions])}/{len(parent_rows)}")
+        print("=" * 80)
+        print("2. DESCRIPTION VERIFICATION")
+        print("=" * 80)
         
-        if len(missing_descriptions) > 0:
-            print(f"    ⚠️  Products missing descriptions: {len(missing_descriptions)}")
-            all_checks_passed = False
+        if 'Body (HTML)' in df.columns:
+            parent_descriptions = is_parent & nonempty('Body (HTML)')
+            description_count = int(parent_descriptions.sum())
+            missing_descriptions = parent_count - description_count
+            
+            print(f"  ✓ Products with descriptions: {description_count}/{parent_count}")
+            
+            if missing_descriptions > 0:
+                print(f"    ⚠️  Products missing descriptions: {missing_descriptions}")
+                passed = False
+            
+            # Check tab styling
+            if description_count > 0:
+                desc = sample_description
+                found = set(DESCRIPTION_FEATURES_RE.findall(desc))
+                has_tabs = {'tabs-container', 'tab active'} <= found
+                has_responsive = {'@media', 'max-width'} <= found
+                has_js = bool(found & {'addEventListener', 'querySelectorAll'})
+                
+                print(f"  ✓ Tab styling present: {has_tabs}")
+                print(f"  ✓ Responsive design: {has_responsive}")
+                print(f"  ✓ JavaScript functionality: {has_js}")
+                
+                if not (has_tabs and has_responsive and has_js):
+                    print(f"    ⚠️  Some descriptions missing styling features")
+                    passed = False
+        else:
+            print("  ❌ Body (HTML) column not found")
+            passed = False
         
-        # Check tab styling
-        if len(parent_rows[parent_descriptions]) > 0:
-            sample = parent_rows[parent_descriptions].iloc[0]
-            desc = str(sample['Body (HTML)'])
-            has_tabs = 'tabs-container' in desc and 'tab active' in desc
-            has_responsive = '@media' in desc and 'max-width' in desc
-            has_js = 'addEventListener' in desc or 'querySelectorAll' in desc
-            
-            print(f"  ✓ Tab styling present: {has_tabs}")
-            print(f"  ✓ Responsive design: {has_responsive}")
-            print(f"  ✓ JavaScript functionality: {has_js}")
-            
-            if not (has_tabs and has_responsive and has_js):
-                print(f"    ⚠️  Some descriptions missing styling features")
-                all_checks_passed = False
-    else:
-        print("  ❌ Body (HTML) column not found")
-        all_checks_passed = False
-    
-    print()
+        print()
+        
+        return passed
     
     # ========== 3. IMAGE CHECKS ==========
-    print("=" * 80)
-    print("3. IMAGE VERIFICATION")
-    print("=" * 80)
-    
-    if 'Image Src' in df.columns:
-        parent_images = parent_rows['Image Src'].notna() & (parent_rows['Image Src'] != '')
-        missing_images = parent_rows[~parent_images]
+    def check_images() -> bool:
+        passed = True
         
-        print(f"  ✓ Products with images: {len(parent_rows[parent_images])}/{len(parent_rows)}")
+        print("=" * 80)
+        print("3. IMAGE VERIFICATION")
+        print("=" * 80)
         
-        if len(missing_images) > 0:
-            print(f"    ⚠️  Products missing images: {len(missing_images)}")
-            all_checks_passed = False
+        if 'Image Src' in df.columns:
+            has_image = handle_flags['images']
+            image_count = int((is_parent & has_image).sum())
+            missing_images = parent_count - image_count
+            
+            print(f"  ✓ Products with images: {image_count}/{parent_count}")
+            
+            if missing_images > 0:
+                print(f"    ⚠️  Products missing images: {missing_images}")
+                passed = False
+            
+            # Check for multiple images (additional image rows)
+            multiple_image_handles = int((per_handle['images'] > 1).sum())
+            
+            print(f"  ✓ Products with multiple images: {multiple_image_handles}")
+        else:
+            print("  ❌ Image Src column not found")
+            passed = False
         
-        # Check for multiple images (additional image rows)
-        handles_with_images = df[df['Image Src'].notna() & (df['Image Src'] != '')]['Handle'].unique()
-        handles_with_multiple = []
-        for handle in handles_with_images:
-            image_count = len(df[(df['Handle'] == handle) & (df['Image Src'].notna() & (df['Image Src'] != ''))])
-            if image_count > 1:
-                handles_with_multiple.append((handle, image_count))
+        print()
         
-        print(f"  ✓ Products with multiple images: {len(handles_with_multiple)}")
-    else:
-        print("  ❌ Image Src column not found")
-        all_checks_passed = False
-    
-    print()
+        return passed
     
     # ========== 4. VARIANT CHECKS ==========
-    print("=" * 80)
-    print("4. VARIANT VERIFICATION")
-    print("=" * 80)
-    
-    # Check variant rows have Option1 Value
-    if 'Option1 Value' in df.columns:
-        variant_options = variant_rows['Option1 Value'].notna() & (variant_rows['Option1 Value'] != '')
-        missing_options = variant_rows[~variant_options]
+    def check_variants() -> bool:
+        passed = True
         
-        print(f"  ✓ Variants with Option1 Value: {len(variant_rows[variant_options])}/{len(variant_rows)}")
+        print("=" * 80)
+        print("4. VARIANT VERIFICATION")
+        print("=" * 80)
         
-        if len(missing_options) > 0:
-            print(f"    ⚠️  Variants missing Option1 Value: {len(missing_options)}")
-            all_checks_passed = False
-    
-    # Check parent rows with variants have Option1 Name but empty Option1 Value
-    if 'Option1 Name' in df.columns and 'Option1 Value' in df.columns:
-        parents_with_variants_correct = 0
-        parents_with_variants_incorrect = 0
-        
-        for idx, parent in parent_rows.iterrows():
-            handle = parent.get('Handle', '')
-            if handle:
-                variants = df[(df['Handle'] == handle) & (df.index != idx) & 
-                             (pd.isna(df['Title']) | (df['Title'] == ''))]
-                if len(variants) > 0:
-                    # Parent with variants should have Option1 Name but empty Option1 Value
-                    option1_name = parent.get('Option1 Name', '')
-                    option1_value = parent.get('Option1 Value', '')
-                    # Check if Option1 Value is truly empty (handle NaN, empty string, 'nan' string)
-                    is_empty = (pd.isna(option1_value) or str(option1_value).strip() == '' or str(option1_value).strip().lower() == 'nan')
-                    if option1_name and is_empty:
-                        parents_with_variants_correct += 1
-                    else:
-                        parents_with_variants_incorrect += 1
-        
-        print(f"  ✓ Parents with variants correctly configured: {parents_with_variants_correct}")
-        if parents_with_variants_incorrect > 0:
-            print(f"    ⚠️  Parents with variants incorrectly configured: {parents_with_variants_incorrect}")
-            all_checks_passed = False
-    
-    # Check variant rows have empty Title
-    variant_titles_empty = variant_rows[pd.isna(variant_rows['Title']) | (variant_rows['Title'] == '')]
-    print(f"  ✓ Variant rows with empty Title: {len(variant_titles_empty)}/{len(variant_rows)}")
-    
-    if len(variant_titles_empty) != len(variant_rows):
-        print(f"    ⚠️  Some variant rows have non-empty Title")
-        all_checks_passed = False
-    
-    print()
-    
-    # ========== 5. INVENTORY CHECKS ==========
-    print("=" * 80)
-    print("5. INVENTORY VERIFICATION")
-    print("=" * 80)
-    
-    if 'Variant Inventory Tracker' in df.columns and 'Variant Inventory Qty' in df.columns:
-        # Check variants have inventory tracker set
-        variant_trackers = variant_rows['Variant Inventory Tracker'].notna() & (variant_rows['Variant Inventory Tracker'] != '')
-        variant_trackers_shopify = variant_rows[variant_rows['Variant Inventory Tracker'] == 'shopify']
+        # Check variant rows have Option1 Value
+        if 'Option1 Value' in df.columns:
+            option_count = int((is_variant & nonempty('Option1 Value')).sum())
+            missing_options = variant_count - option_count
+            
+            print(f"  ✓ Variants with Option1 Value: {option_count}/{variant_count}")
+            
+            if missing_options > 0:
+                print(f"    ⚠️  Variants missing Option1 Value: {missing_options}")
+                passed = False
         
-        print(f"  ✓ Variants with inventory tracker: {len(variant_trackers_shopify)}/{len(variant_rows)}")
+        # Check parent rows with variants have Option1 Name but empty Option1 Value
+        if 'Option1 Name' in df.columns and 'Option1 Value' in df.columns:
+            parents_with_variants = parent_rows[has_variants]
+            
+            # Parent with variants should have Option1 Name but empty Option1 Value
+            option1_name = parents_with_variants['Option1 Name']
+            option1_value = parents_with_variants['Option1 Value']
+            # Check if Option1 Value is truly empty (handle NaN, empty string, 'nan' string)
+            is_empty = option1_value.isna() | option1_value.astype(str).str.strip().str.lower().isin(['', 'nan'])
+            correct = option1_name.ne('') & is_empty
+            
+            parents_with_variants_correct = int(correct.sum())
+            parents_with_variants_incorrect = len(parents_with_variants) - parents_with_variants_correct
+            
+            print(f"  ✓ Parents with variants correctly configured: {parents_with_variants_correct}")
+            if parents_with_variants_incorrect > 0:
+                print(f"    ⚠️  Parents with variants incorrectly configured: {parents_with_variants_incorrect}")
+                passed = False
         
-        # Check single products have inventory tracker
-        single_product_trackers = []
-        for idx in single_products:
-            row = df.loc[idx]
-            tracker = row.get('Variant Inventory Tracker', '')
-            if tracker != 'shopify':
-                single_product_trackers.append((idx, row.get('Title', 'N/A')))
+        # Check variant rows have empty Title
+        variant_titles_empty = int((is_variant & ~nonempty('Title')).sum())
+        print(f"  ✓ Variant rows with empty Title: {variant_titles_empty}/{variant_count}")
         
-        print(f"  ✓ Single products with inventory tracker: {len(single_products) - len(single_product_trackers)}/{len(single_products)}")
-        if single_product_trackers:
-            print(f"    ⚠️  Single products missing inventory tracker: {len(single_product_trackers)}")
-            all_checks_passed = False
+        if variant_titles_empty != variant_count:
+            print(f"    ⚠️  Some variant rows have non-empty Title")
+            passed = False
         
-        # Check inventory quantities
-        variant_qtys = variant_rows['Variant Inventory Qty'].notna() & (variant_rows['Variant Inventory Qty'] != '')
-        variant_qtys_positive = []
-        for idx in variant_rows[variant_qtys].index:
-            row = df.loc[idx]
-            try:
-                qty = int(float(str(row['Variant Inventory Qty']).strip()))
-                if qty > 0:
-                    variant_qtys_positive.append(idx)
-            except:
-                pass
-        
-        print(f"  ✓ Variants with positive inventory: {len(variant_qtys_positive)}/{len(variant_rows)}")
-    else:
-        print("  ❌ Inventory columns not found")
-        all_checks_passed = False
-    
-    print()
-    
-    # ========== 6. CATEGORY CHECKS ==========
-    print("=" * 80)
-    print("6. CATEGORY VERIFICATION")
-    print("=" * 80)
+        print()
+        
+        return passed
     
-    if 'Product category' in df.columns:
-        parent_categories = parent_rows['Product category'].notna() & (parent_rows['Product category'] != '')
-        missing_categories = parent_rows[~parent_categories]
-        uncategorised = parent_rows[parent_rows['Product category'].str.contains('uncategorised|Uncategorised|uncategorized|Uncategorized', case=False, na=False)]
+    # ========== 5. INVENTORY CHECKS ==========
+    def check_inventory() -> bool:
+        passed = True
         
-        print(f"  ✓ Products with categories: {len(parent_rows[parent_categories])}/{len(parent_rows)}")
+        print("=" * 80)
+        print("5. INVENTORY VERIFICATION")
+        print("=" * 80)
         
-        if len(missing_categories) > 0:
-            print(f"    ⚠️  Products missing categories: {len(missing_categories)}")
-            all_checks_passed = False
+        if 'Variant Inventory Tracker' in df.columns and 'Variant Inventory Qty' in df.columns:
+            # Check variants have inventory tracker set
+            shopify_trackers = (df['Variant Inventory Tracker'] == 'shopify').to_numpy()
+            
+            print(f"  ✓ Variants with inventory tracker: {int((is_variant & shopify_trackers).sum())}/{variant_count}")
+            
+            # Check single products have inventory tracker
+            missing_trackers = int(df.loc[single_products, 'Variant Inventory Tracker'].ne('shopify').sum())
+            
+            print(f"  ✓ Single products with inventory tracker: {len(single_products) - missing_trackers}/{len(single_products)}")
+            if missing_trackers:
+                print(f"    ⚠️  Single products missing inventory tracker: {missing_trackers}")
+                passed = False
+            
+            # Check inventory quantities
+            # Quantities are whole units, so a fractional 0.5 does not count as stock
+            qtys = pd.to_numeric(variant_rows['Variant Inventory Qty'].str.strip(), errors='coerce').astype(float)
+            variant_qtys_positive = int((np.trunc(qtys[np.isfinite(qtys)]) > 0).sum())
+            
+            print(f"  ✓ Variants with positive inventory: {variant_qtys_positive}/{variant_count}")
+        else:
+            print("  ❌ Inventory columns not found")
+            passed = False
         
-        if len(uncategorised) > 0:
-            print(f"    ⚠️  Products with 'uncategorised' text: {len(uncategorised)}")
-            all_checks_passed = False
+        print()
         
-        # Show category distribution
-        if len(parent_rows[parent_categories]) > 0:
-            unique_cats = parent_rows[parent_categories]['Product category'].unique()
-            print(f"  ✓ Unique categories: {len(unique_cats)}")
-    else:
-        print("  ❌ Product category column not found")
-        all_checks_passed = False
+        return passed
     
-    print()
+    # ========== 6. CATEGORY CHECKS ==========
+    def check_categories() -> bool:
+        passed = True
+        
+        print("=" * 80)
+        print("6. CATEGORY VERIFICATION")
+        print("=" * 80)
+        
+        if 'Product category' in df.columns:
+            parent_categories = is_parent & nonempty('Product category')
+            category_count = int(parent_categories.sum())
+            missing_categories = parent_count - category_count
+            uncategorised = int(parent_rows['Product category'].str.contains(UNCATEGORISED_RE, na=False).sum())
+            
+            print(f"  ✓ Products with categories: {category_count}/{parent_count}")
+            
+            if missing_categories > 0:
+                print(f"    ⚠️  Products missing categories: {missing_categories}")
+                passed = False
+            
+            if uncategorised > 0:
+                print(f"    ⚠️  Products with 'uncategorised' text: {uncategorised}")
+                passed = False
+            
+            # Show category distribution
+            if category_count > 0:
+                unique_cats = df.loc[parent_categories, 'Product category'].unique()
+                print(f"  ✓ Unique categories: {len(unique_cats)}")
+        else:
+            print("  ❌ Product category column not found")
+            passed = False
+        
+        print()
+        
+        return passed
     
     # ========== 7. FULFILLMENT SERVICE CHECKS ==========
-    print("=" * 80)
-    print("7. FULFILLMENT SERVICE VERIFICATION")
-    print("=" * 80)
-    
-    if 'Variant Fulfillment Service' in df.columns:
-        # Check variants and single products have fulfillment service
-        rows_with_variants = df[df['Variant Price'].notna() | df['Variant SKU'].notna()]
-        fulfillment_set = rows_with_variants[rows_with_variants['Variant Fulfillment Service'] == 'manual']
+    def check_fulfillment() -> bool:
+        passed = True
         
-        print(f"  ✓ Rows with fulfillment service set: {len(fulfillment_set)}/{len(rows_with_variants)}")
+        print("=" * 80)
+        print("7. FULFILLMENT SERVICE VERIFICATION")
+        print("=" * 80)
         
-        missing_fulfillment = rows_with_variants[rows_with_variants['Variant Fulfillment Service'].isna() | 
-                              (rows_with_variants['Variant Fulfillment Service'] == '')]
-        if len(missing_fulfillment) > 0:
-            print(f"    ⚠️  Rows missing fulfillment service: {len(missing_fulfillment)}")
-            all_checks_passed = False
-    else:
-        print("  ❌ Variant Fulfillment Service column not found")
-        all_checks_passed = False
-    
-    print()
+        if 'Variant Fulfillment Service' in df.columns:
+            # Check variants and single products have fulfillment service
+            fulfillment = df.loc[has_price_or_sku, 'Variant Fulfillment Service']
+            fulfillment_set = int((fulfillment == 'manual').sum())
+            
+            print(f"  ✓ Rows with fulfillment service set: {fulfillment_set}/{variant_data_count}")
+            
+            missing_fulfillment = int((fulfillment.isna() | (fulfillment == '')).sum())
+            if missing_fulfillment > 0:
+                print(f"    ⚠️  Rows missing fulfillment service: {missing_fulfillment}")
+                passed = False
+        else:
+            print("  ❌ Variant Fulfillment Service column not found")
+            passed = False
+        
+        print()
+        
+        return passed
     
     # ========== 8. INVENTORY POLICY CHECKS ==========
-    print("=" * 80)
-    print("8. INVENTORY POLICY VERIFICATION")
-    print("=" * 80)
-    
-    if 'Variant Inventory Policy' in df.columns:
-        rows_with_variants = df[df['Variant Price'].notna() | df['Variant SKU'].notna()]
-        valid_policies = rows_with_variants[rows_with_variants['Variant Inventory Policy'].isin(['deny', 'continue'])]
+    def check_inventory_policy() -> bool:
+        passed = True
         
-        print(f"  ✓ Rows with valid inventory policy: {len(valid_policies)}/{len(rows_with_variants)}")
+        print("=" * 80)
+        print("8. INVENTORY POLICY VERIFICATION")
+        print("=" * 80)
         
-        invalid_policies = rows_with_variants[~rows_with_variants['Variant Inventory Policy'].isin(['deny', 'continue'])]
-        if len(invalid_policies) > 0:
-            print(f"    ⚠️  Rows with invalid inventory policy: {len(invalid_policies)}")
-            all_checks_passed = False
-    else:
-        print("  ❌ Variant Inventory Policy column not found")
-        all_checks_passed = False
-    
-    print()
+        if 'Variant Inventory Policy' in df.columns:
+            valid_policies = int(df.loc[has_price_or_sku, 'Variant Inventory Policy'].isin(['deny', 'continue']).sum())
+            
+            print(f"  ✓ Rows with valid inventory policy: {valid_policies}/{variant_data_count}")
+            
+            invalid_policies = variant_data_count - valid_policies
+            if invalid_policies > 0:
+                print(f"    ⚠️  Rows with invalid inventory policy: {invalid_policies}")
+                passed = False
+        else:
+            print("  ❌ Variant Inventory Policy column not found")
+            passed = False
+        
+        print()
+        
+        return passed
     
     # ========== 9. SKU CHECKS ==========
-    print("=" * 80)
-    print("9. SKU VERIFICATION")
-    print("=" * 80)
-    
-    if 'Variant SKU' in df.columns:
-        variant_skus = variant_rows['Variant SKU'].notna() & (variant_rows['Variant SKU'] != '')
-        single_product_skus = []
-        for idx in single_products:
-            row = df.loc[idx]
-            sku = row.get('Variant SKU', '')
-            if not sku or str(sku).strip() == '':
-                single_product_skus.append((idx, row.get('Title', 'N/A')))
+    def check_skus() -> bool:
+        passed = True
         
-        print(f"  ✓ Variants with SKU: {len(variant_rows[variant_skus])}/{len(variant_rows)}")
-        print(f"  ✓ Single products with SKU: {len(single_products) - len(single_product_skus)}/{len(single_products)}")
-        
-        if len(single_product_skus) > 0:
-            print(f"    ⚠️  Single products missing SKU: {len(single_product_skus)}")
-            all_checks_passed = False
+        print("=" * 80)
+        print("9. SKU VERIFICATION")
+        print("=" * 80)
         
-        # Check for duplicate SKUs
-        all_skus = df[df['Variant SKU'].notna() & (df['Variant SKU'] != '')]['Variant SKU']
-        duplicate_skus = all_skus[all_skus.duplicated()]
-        if len(duplicate_skus) > 0:
-            print(f"    ⚠️  Duplicate SKUs found: {len(duplicate_skus)}")
-            all_checks_passed = False
+        if 'Variant SKU' in df.columns:
+            has_sku = nonempty('Variant SKU')
+            single_skus = df.loc[single_products, 'Variant SKU']
+            missing_skus = int((single_skus.isna() | single_skus.str.strip().eq('')).sum())
+            
+            print(f"  ✓ Variants with SKU: {int((is_variant & has_sku).sum())}/{variant_count}")
+            print(f"  ✓ Single products with SKU: {len(single_products) - missing_skus}/{len(single_products)}")
+            
+            if missing_skus > 0:
+                print(f"    ⚠️  Single products missing SKU: {missing_skus}")
+                passed = False
+            
+            # Check for duplicate SKUs
+            # keep=False flags every row of a duplicate set, not just the repeats
+            duplicate_skus = has_sku & df.duplicated(subset='Variant SKU', keep=False).to_numpy()
+            duplicate_count = int(duplicate_skus.sum())
+            if duplicate_count > 0:
+                print(f"    ⚠️  Duplicate SKUs found: {duplicate_count} rows")
+                for handle, sku in df.loc[duplicate_skus, ['Handle', 'Variant SKU']].head(5).itertuples(index=False):
+                    print(f"      - {handle}: {sku}")
+                passed = False
+            else:
+                print(f"  ✓ No duplicate SKUs")
         else:
-            print(f"  ✓ No duplicate SKUs")
-    else:
-        print("  ❌ Variant SKU column not found")
-        all_checks_passed = False
-    
-    print()
+            print("  ❌ Variant SKU column not found")
+            passed = False
+        
+        print()
+        
+        return passed
     
     # ========== 10. HANDLE CHECKS ==========
-    print("=" * 80)
-    print("10. HANDLE VERIFICATION")
-    print("=" * 80)
-    
-    if 'Handle' in df.columns:
-        parent_handles = parent_rows['Handle'].notna() & (parent_rows['Handle'] != '')
-        variant_handles = variant_rows['Handle'].notna() & (variant_rows['Handle'] != '')
-        
-        print(f"  ✓ Parent products with handles: {len(parent_rows[parent_handles])}/{len(parent_rows)}")
-        print(f"  ✓ Variant rows with handles: {len(variant_rows[variant_handles])}/{len(variant_rows)}")
-        
-        # Check all variants share parent handle
-        handles_with_variants = parent_rows[parent_handles]['Handle'].unique()
-        all_variants_have_parent_handle = True
-        for handle in handles_with_variants:
-            variants = df[(df['Handle'] == handle) & (df.index != parent_rows[parent_rows['Handle'] == handle].index[0])]
-            if len(variants) > 0:
-                variant_handles_match = all(v.get('Handle', '') == handle for _, v in variants.iterrows())
-                if not variant_handles_match:
-                    all_variants_have_parent_handle = False
-                    break
-        
-        if all_variants_have_parent_handle:
-            print(f"  ✓ All variants share parent handle")
+    def check_handles() -> bool:
+        passed = True
+        
+        print("=" * 80)
+        print("10. HANDLE VERIFICATION")
+        print("=" * 80)
+        
+        if 'Handle' in df.columns:
+            has_handle = nonempty('Handle')
+            parent_handles = has_handle[is_parent]
+            
+            print(f"  ✓ Parent products with handles: {int(parent_handles.sum())}/{parent_count}")
+            print(f"  ✓ Variant rows with handles: {int((is_variant & has_handle).sum())}/{variant_count}")
+            
+            # Check all variants share parent handle
+            # A variant shares its parent's handle when some parent row carries that Handle
+            # (rows within a Handle group trivially match, so only orphans can fail)
+            orphan_count = int(per_handle.loc[per_handle['parents'] == 0, 'variants'].sum())
+            all_variants_have_parent_handle = orphan_count == 0
+            
+            if all_variants_have_parent_handle:
+                print(f"  ✓ All variants share parent handle")
+            else:
+                print(f"    ⚠️  Some variants don't share parent handle: {orphan_count} orphaned variant rows")
+                passed = False
         else:
-            print(f"    ⚠️  Some variants don't share parent handle")
-            all_checks_passed = False
-    else:
-        print("  ❌ Handle column not found")
-        all_checks_passed = False
+            print("  ❌ Handle column not found")
+            passed = False
+        
+        print()
+        
+        return passed
     
-    print()
+    sections = [
+        check_prices, check_descriptions, check_images, check_variants, check_inventory,
+        check_categories, check_fulfillment, check_inventory_policy, check_skus, check_handles
+    ]
+    
+    all_checks_passed = True
+    for check in sections:
+        if not check():
+            all_checks_passed = False
+            if fail_fast:
+                print("Stopping after the first failed section (--fail-fast)")
+                print()
+                break
     
     # ========== FINAL SUMMARY ==========
     print("=" * 80)
@@ -422,15 +532,15 @@ def verify_migration(output_file: str):
     return all_checks_passed
 
 if __name__ == "__main__":
-    if len(sys.argv) < 2:
-        print("Usage: python verify_migration.py <output_csv_file>")
-        sys.exit(1)
+    parser = argparse.ArgumentParser(description='Verify a Shopify migration output CSV')
+    parser.add_argument('output_file', help='Path to the migrated Shopify CSV')
+    parser.add_argument('--fail-fast', action='store_true', help='Stop after the first failed section')
+    args = parser.parse_args()
     
-    output_file = sys.argv[1]
+    output_file = args.output_file
     if not Path(output_file).exists():
         print(f"❌ ERROR: Output file not found: {output_file}")
         sys.exit(1)
     
-    success = verify_migration(output_file)
+    success = verify_migration(output_file, fail_fast=args.fail_fast)
     sys.exit(0 if success else 1)
-
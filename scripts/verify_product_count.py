@@ -1,51 +1,83 @@
+import os
+import re
 import pandas as pd
 import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
 from pathlib import Path
 
-def count_unique_products_by_handle():
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from scripts._cli_common import fast_read
+
+OUTPUT_DIR = Path('data/output')
+BATCH_NAME_RE = re.compile(r'batch_(\d+)_of_(\d+)\.csv$')
+
+def find_batch_files() -> dict:
+    """Find every batch CSV in the output directory; returns {'N/M': path} in batch order."""
+    found = []
+    for path in OUTPUT_DIR.glob('shopify_products_batch_*_of_*.csv'):
+        match = BATCH_NAME_RE.search(path.name)
+        if match:
+            batch_num, total = int(match.group(1)), int(match.group(2))
+            found.append(((total, batch_num), f"{batch_num}/{total}", path))
+    return {label: path for _, label, path in sorted(found)}
+
+def scan_batch(batch_file: Path) -> tuple:
+    """Read one batch file once and return its parent-row (handles, titles) sets."""
+    df = fast_read(batch_file, dtype=str, keep_default_na=False, usecols=['Title', 'Handle'])
+    
+    # Parent rows are the rows with a non-empty Title
+    titles = df['Title'].str.strip()
+    parent_mask = titles != ''
+    
+    handles = set(df.loc[parent_mask, 'Handle'].str.strip().unique())
+    titles = set(titles[parent_mask].unique())
+    
+    # Remove empty values; frozensets pickle compactly back from worker processes
+    handles = frozenset(h for h in handles if h and h.lower() != 'nan')
+    titles = frozenset(t for t in titles if t and t.lower() != 'nan')
+    
+    return handles, titles
+
+def scan_batches() -> dict:
+    """Scan every batch file once, in parallel; returns {batch_label: (handles, titles)}."""
+    present = find_batch_files()
+    
+    if not present:
+        print(f"⚠️  Warning: no batch files found in {OUTPUT_DIR}")
+        return {}
+    
+    for batch_label in present:
+        print(f"Reading Batch {batch_label}...")
+    
+    # Files are independent, so parse them in separate processes
+    with ProcessPoolExecutor(max_workers=min(len(present), os.cpu_count() or 1)) as executor:
+        results = executor.map(scan_batch, present.values())
+        return dict(zip(present, results))
+
+def count_unique_products_by_handle(batches: dict):
     """Count unique products by Handle across all batches (Handle is Shopify's unique identifier)."""
-    batch_files = [
-        'data/output/shopify_products_batch_1_of_5.csv',
-        'data/output/shopify_products_batch_2_of_5.csv',
-        'data/output/shopify_products_batch_3_of_5.csv',
-        'data/output/shopify_products_batch_4_of_5.csv',
-        'data/output/shopify_products_batch_5_of_5.csv',
-    ]
-    
-    all_handles = set()
-    batch_handles = {}
-    duplicate_handles = set()
+    batch_handles = {batch_num: handles for batch_num, (handles, _) in batches.items()}
+    
+    # Count in how many batches each handle appears, in one pass over all the sets
+    handle_batch_counts = Counter(chain.from_iterable(batch_handles.values()))
+    all_handles = handle_batch_counts.keys()
+    duplicate_handles = {handle for handle, count in handle_batch_counts.items() if count > 1}
     
     print("="*80)
     print("COUNTING UNIQUE PRODUCTS BY HANDLE (Shopify's Unique Identifier)")
     print("="*80)
     
-    for batch_num, batch_file in enumerate(batch_files, 1):
-        if not Path(batch_file).exists():
-            print(f"⚠️  Warning: {batch_file} not found, skipping...")
-            continue
-            
-        print(f"\nReading Batch {batch_num}...")
-        df = pd.read_csv(batch_file, dtype=str, keep_default_na=False, low_memory=False)
-        
-        # Get unique handles (only from parent rows - rows with non-empty Title)
-        parent_rows = df[df['Title'].astype(str).str.strip() != '']
-        handles = set(parent_rows['Handle'].astype(str).str.strip().unique())
-        
-        # Remove empty handles
-        handles = {h for h in handles if h and h.lower() != 'nan'}
-        
-        batch_handles[batch_num] = handles
+    for batch_num, handles in batch_handles.items():
+        print(f"\nBatch {batch_num}:")
         
         # Check for duplicates
-        duplicates = handles & all_handles
+        duplicates = handles & duplicate_handles
         if duplicates:
-            duplicate_handles.update(duplicates)
-            print(f"  ⚠️  Found {len(duplicates)} duplicate handles with previous batches!")
+            print(f"  ⚠️  Found {len(duplicates)} handles that also appear in other batches!")
         
-        all_handles.update(handles)
         print(f"  Unique handles in this batch: {len(handles):,}")
-        print(f"  Total unique handles so far: {len(all_handles):,}")
     
     print("\n" + "="*80)
     print("SUMMARY")
@@ -55,23 +87,15 @@ def count_unique_products_by_handle():
     if duplicate_handles:
         print(f"\n⚠️  WARNING: Found {len(duplicate_handles)} handles that appear in multiple batches!")
         print("First 10 duplicate handles:")
-        for handle in list(duplicate_handles)[:10]:
+        for handle in sorted(duplicate_handles)[:10]:
             print(f"  - {handle}")
     else:
         print("\n✅ No duplicate handles found across batches")
     
     return len(all_handles), batch_handles, duplicate_handles
 
-def count_products_by_title():
+def count_products_by_title(batches: dict):
     """Count unique products by Title (parent rows only)."""
-    batch_files = [
-        'data/output/shopify_products_batch_1_of_5.csv',
-        'data/output/shopify_products_batch_2_of_5.csv',
-        'data/output/shopify_products_batch_3_of_5.csv',
-        'data/output/shopify_products_batch_4_of_5.csv',
-        'data/output/shopify_products_batch_5_of_5.csv',
-    ]
-    
     all_titles = set()
     batch_titles = {}
     
@@ -79,19 +103,7 @@ def count_products_by_title():
     print("COUNTING UNIQUE PRODUCTS BY TITLE (Parent Rows Only)")
     print("="*80)
     
-    for batch_num, batch_file in enumerate(batch_files, 1):
-        if not Path(batch_file).exists():
-            continue
-            
-        df = pd.read_csv(batch_file, dtype=str, keep_default_na=False, low_memory=False)
-        
-        # Get unique titles (only from parent rows)
-        parent_rows = df[df['Title'].astype(str).str.strip() != '']
-        titles = set(parent_rows['Title'].astype(str).str.strip().unique())
-        
-        # Remove empty strings
-        titles = {t for t in titles if t and t.lower() != 'nan'}
-        
+    for batch_num, (_, titles) in batches.items():
         batch_titles[batch_num] = titles
         all_titles.update(titles)
         print(f"Batch {batch_num}: {len(titles):,} unique titles")
@@ -149,11 +161,14 @@ def main():
     print("COMPREHENSIVE PRODUCT COUNT VERIFICATION")
     print("="*80)
     
+    # Read each batch file once for both counts
+    batches = scan_batches()
+    
     # Count by Handle (most accurate - Shopify's unique identifier)
-    unique_by_handle, batch_handles, duplicates = count_unique_products_by_handle()
+    unique_by_handle, batch_handles, duplicates = count_unique_products_by_handle(batches)
     
     # Count by Title
-    unique_by_title, batch_titles = count_products_by_title()
+    unique_by_title, batch_titles = count_products_by_title(batches)
     
     # Count source
     source_unique, source_total = count_source_products()
@@ -181,7 +196,7 @@ def main():
     print("\n" + "="*80)
     print("PER-BATCH BREAKDOWN (by Handle)")
     print("="*80)
-    for batch_num, handles in sorted(batch_handles.items()):
+    for batch_num, handles in batch_handles.items():
         print(f"Batch {batch_num}: {len(handles):,} unique products")
     
     total_in_batches = sum(len(h) for h in batch_handles.values())
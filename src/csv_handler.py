@@ -3,24 +3,343 @@ CSV Handler Module
 Handles reading and writing CSV files with proper encoding and error handling.
 """
 
+import csv
+import io
+import mmap
+import os
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 import pandas as pd
-import chardet
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, Tuple
 from loguru import logger
 
+# Encoding detectors, fastest first: cchardet and charset-normalizer are optional
+try:
+    import cchardet
+except ImportError:
+    cchardet = None
+
+try:
+    import charset_normalizer
+except ImportError:
+    charset_normalizer = None
+
+try:
+    import chardet
+except ImportError:
+    chardet = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = pacsv = None
+
+DETECTORS = {
+    'cchardet': cchardet,
+    'charset_normalizer': charset_normalizer,
+    'chardet': chardet,
+}
+
+
+# Detection reads at most DETECT_BYTES, fed to the detector DETECT_STEP bytes at a time
+DETECT_BYTES = 10000
+DETECT_STEP = 2048
+
+# Rows per chunk when analyze_csv streams a file
+ANALYZE_CHUNK_SIZE = 100_000
+
+# Bytes compared per step when _fast_row_count scans a file
+COUNT_WINDOW = 64 * 1024 * 1024
+
+# read_csv options that only tune the C engine and can be dropped for pyarrow
+ARROW_IGNORED_KWARGS = {'low_memory'}
+
+# Byte order marks, longest first (the UTF-32-LE mark starts with the UTF-16-LE one)
+BOMS = (
+    (b'\xff\xfe\x00\x00', 'utf-32'),
+    (b'\x00\x00\xfe\xff', 'utf-32'),
+    (b'\xef\xbb\xbf', 'utf-8-sig'),
+    (b'\xff\xfe', 'utf-16'),
+    (b'\xfe\xff', 'utf-16'),
+)
+
+
+def _detect_stream(f, detector: str) -> Tuple[Optional[str], float]:
+    """Run the named detector over the start of a binary file and return (encoding, confidence)."""
+    if detector == 'charset_normalizer':
+        best = charset_normalizer.from_bytes(f.read(DETECT_BYTES)).best()
+        if best is None:
+            return None, 0.0
+        return best.encoding, 1.0 - best.chaos
+    
+    # chardet and cchardet stop early once a BOM or a confident guess is found
+    universal = DETECTORS[detector].UniversalDetector()
+    remaining = DETECT_BYTES
+    while remaining > 0 and not universal.done:
+        chunk = f.read(min(DETECT_STEP, remaining))
+        if not chunk:
+            break
+        universal.feed(chunk)
+        remaining -= len(chunk)
+    universal.close()
+    
+    result = universal.result
+    return result['encoding'], result['confidence'] or 0.0
+
+
+def _merge_dtypes(a, b):
+    """Widen two chunk dtypes the way a single full read would."""
+    if a == b:
+        return a
+    if pd.api.types.is_numeric_dtype(a) and pd.api.types.is_numeric_dtype(b):
+        return np.result_type(a, b)
+    return np.dtype(object)
+
+
+@lru_cache(maxsize=256)
+def _detect_encoding_cached(path: str, mtime_ns: int, size: int, detector: str) -> str:
+    """Detect a file's encoding once per (path, mtime, size); edited files are re-detected."""
+    with open(path, 'rb') as f:
+        head = f.read(DETECT_BYTES)
+    
+    # Shopify/WooCommerce exports are almost always BOM-marked or plain ASCII,
+    # neither of which needs a statistical detector
+    for bom, encoding in BOMS:
+        if head.startswith(bom):
+            logger.info(f"Detected encoding: {encoding} (byte order mark)")
+            return encoding
+    if head.isascii():
+        logger.info("Detected encoding: utf-8 (ASCII prefix)")
+        return 'utf-8'
+    
+    encoding, confidence = _detect_stream(io.BytesIO(head), detector)
+    logger.info(f"Detected encoding: {encoding} (confidence: {confidence:.2%})")
+    return encoding or 'utf-8'
+
+
+def _fast_row_count(path: str) -> int:
+    """
+    Count a file's physical lines by scanning a memory map for line breaks.
+    
+    Like the C parser, \n, \r\n and a bare \r each end a line. Quoted fields
+    may span lines, so this is an upper bound on the number of CSV records
+    (header included), never an undercount.
+    """
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return 0
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            data = np.frombuffer(mm, dtype=np.uint8)
+            lines = 0
+            # Compare in windows so the boolean temporaries stay small; each window
+            # peeks one byte past its end to pair a trailing \r with its \n
+            for start in range(0, len(data), COUNT_WINDOW):
+                window = data[start:start + COUNT_WINDOW + 1]
+                body = window[:COUNT_WINDOW]
+                carriage = window[:-1] == 0x0D
+                lines += int(np.count_nonzero(body == 0x0A)) + int(np.count_nonzero(body == 0x0D))
+                lines -= int(np.count_nonzero(carriage & (window[1:] == 0x0A)))
+            last = int(data[-1])
+            del data, window, body, carriage  # release the buffer exports before the map closes
+    
+    if last not in (0x0A, 0x0D):
+        lines += 1
+    return lines
+
+
+def _arrow_csv_options(
+    file_path,
+    encoding: str,
+    dtype,
+    keep_default_na: bool,
+    usecols: Optional[List[str]]
+) -> Tuple['pacsv.ReadOptions', 'pacsv.ParseOptions', Any]:
+    """
+    Build the pyarrow CSV options that mirror pd.read_csv's for the given arguments.
+    
+    Returns:
+        (read options, parse options, convert_options(**overrides) factory)
+    """
+    column_types = None
+    if dtype is str:
+        with open(file_path, 'r', encoding=encoding, newline='') as f:
+            header = next(csv.reader(f), [])
+        column_types = {col.lstrip('\ufeff'): pa.string() for col in header}
+    elif isinstance(dtype, dict):
+        column_types = {col: pa.string() for col, col_type in dtype.items() if col_type is str}
+    
+    read_options = pacsv.ReadOptions(encoding=encoding)
+    parse_options = pacsv.ParseOptions(newlines_in_values=True)  # Quoted multi-line HTML
+    if keep_default_na:
+        null_values = pacsv.ConvertOptions().null_values + ['None', '<NA>']
+    else:
+        null_values = []
+    
+    def convert_options(**overrides) -> 'pacsv.ConvertOptions':
+        options = dict(
+            column_types=column_types,
+            include_columns=usecols,
+            null_values=null_values,
+            strings_can_be_null=keep_default_na,
+            quoted_strings_can_be_null=keep_default_na
+        )
+        options.update(overrides)
+        return pacsv.ConvertOptions(**options)
+    
+    return read_options, parse_options, convert_options
+
+
+def read_arrow_table(
+    file_path,
+    encoding: str = 'utf-8',
+    dtype=None,
+    keep_default_na: bool = True,
+    usecols: Optional[List[str]] = None
+) -> Optional['pa.Table']:
+    """
+    Parse a whole CSV into a pyarrow Table that converts to what pd.read_csv returns.
+    
+    Shared by CSVHandler.read_csv and the scripts' fast reader.
+    
+    Args:
+        file_path: Path to the CSV file
+        encoding: Text encoding
+        dtype: str to read every column as text, or a dict whose str columns
+            skip type inference (other entries are left to the caller)
+        keep_default_na: Whether pandas' default NA markers and empty cells become null
+        usecols: Optional list of columns to load
+    
+    Returns:
+        pyarrow Table, or None when pyarrow is unavailable or the C engine should
+        read the file instead
+    """
+    if pacsv is None:
+        return None
+    
+    read_options, parse_options, convert_options = _arrow_csv_options(
+        file_path, encoding, dtype, keep_default_na, usecols
+    )
+    
+    try:
+        table = pacsv.read_csv(
+            file_path,
+            read_options=read_options,
+            parse_options=parse_options,
+            convert_options=convert_options()
+        )
+        
+        # The C engine de-duplicates repeated headers (Name, Name.1); leave those files to it
+        if len(set(table.column_names)) != table.num_columns:
+            return None
+        
+        # UTF-8 input is not validated up front; undecodable text comes back as
+        # binary columns, so leave it to the C engine's decoding fallbacks
+        if any(pa.types.is_binary(field.type) for field in table.schema):
+            logger.warning(f"pyarrow found undecodable bytes in {file_path}; falling back to pandas")
+            return None
+        
+        # pyarrow always infers ISO-8601 dates and times; re-read those columns as text
+        timestamp_cols = [field.name for field in table.schema if pa.types.is_temporal(field.type)]
+        if timestamp_cols:
+            text = pacsv.read_csv(
+                file_path,
+                read_options=read_options,
+                parse_options=parse_options,
+                convert_options=convert_options(
+                    include_columns=timestamp_cols,
+                    column_types={col: pa.string() for col in timestamp_cols}
+                )
+            )
+            for col in timestamp_cols:
+                table = table.set_column(table.column_names.index(col), col, text[col])
+    except (pa.ArrowInvalid, UnicodeDecodeError, LookupError) as e:
+        logger.warning(f"pyarrow could not read {file_path} ({e}); falling back to pandas")
+        return None
+    
+    # Entirely empty columns come back as pyarrow nulls; the C engine reads them as float NaN
+    for i, field in enumerate(table.schema):
+        if pa.types.is_null(field.type) and table.num_rows:
+            table = table.set_column(i, field.name, table.column(i).cast(pa.float64()))
+    return table
+
+
+def open_arrow_csv(
+    file_path,
+    usecols: List[str],
+    dtype,
+    encoding: str = 'utf-8',
+    keep_default_na: bool = True
+) -> Optional['pacsv.CSVStreamingReader']:
+    """
+    Open a CSV for block-by-block reading with the same options as read_arrow_table.
+    
+    A streaming reader infers types from its first block only, so this is limited
+    to reads where every loaded column is declared text.
+    
+    Args:
+        file_path: Path to the CSV file
+        usecols: Columns to load
+        dtype: str, or a dict mapping every column in usecols to str
+        encoding: Text encoding
+        keep_default_na: Whether pandas' default NA markers and empty cells become null
+    
+    Returns:
+        Streaming reader yielding record batches, or None when pyarrow is
+        unavailable, a column is not declared text, or the C engine should read
+        the file instead
+    """
+    if pacsv is None:
+        return None
+    if not (dtype is str or (isinstance(dtype, dict) and all(dtype.get(col) is str for col in usecols))):
+        return None
+    
+    read_options, parse_options, convert_options = _arrow_csv_options(
+        file_path, encoding, dtype, keep_default_na, usecols
+    )
+    try:
+        reader = pacsv.open_csv(
+            file_path,
+            read_options=read_options,
+            parse_options=parse_options,
+            convert_options=convert_options()
+        )
+    except (pa.ArrowInvalid, UnicodeDecodeError, LookupError) as e:
+        logger.warning(f"pyarrow could not open {file_path} ({e}); falling back to pandas")
+        return None
+    
+    # The C engine de-duplicates repeated headers (Name, Name.1); leave those files to it
+    if len(set(reader.schema.names)) != len(reader.schema.names):
+        reader.close()
+        return None
+    return reader
+
 
 class CSVHandler:
     """Handle CSV file operations with encoding detection and error handling."""
     
-    def __init__(self, encoding: Optional[str] = None):
+    def __init__(self, encoding: Optional[str] = None, detector: Optional[str] = None):
         """
         Initialize CSV handler.
         
         Args:
             encoding: Optional encoding to use. If None, will auto-detect.
+            detector: Optional detection backend ('cchardet', 'charset_normalizer'
+                or 'chardet'). If None, the fastest installed one is used.
         """
+        if detector is None:
+            detector = next((name for name, module in DETECTORS.items() if module is not None), None)
+            if detector is None:
+                raise ImportError("No encoding detector installed (cchardet, charset-normalizer or chardet)")
+        elif detector not in DETECTORS:
+            raise ValueError(f"Unknown encoding detector: {detector}")
+        elif DETECTORS[detector] is None:
+            raise ImportError(f"Encoding detector not installed: {detector}")
+        
         self.encoding = encoding
+        self.detector = detector
         self.detected_encoding = None
     
     def detect_encoding(self, file_path: str) -> str:
@@ -34,17 +353,16 @@ class CSVHandler:
             Detected encoding string
         """
         try:
-            with open(file_path, 'rb') as f:
-                raw_data = f.read(10000)  # Read first 10KB for detection
-                result = chardet.detect(raw_data)
-                encoding = result['encoding']
-                confidence = result['confidence']
-                
-                logger.info(f"Detected encoding: {encoding} (confidence: {confidence:.2%})")
-                return encoding or 'utf-8'
+            stat = os.stat(file_path)
+            encoding = _detect_encoding_cached(
+                os.path.realpath(file_path), stat.st_mtime_ns, stat.st_size, self.detector
+            )
         except Exception as e:
             logger.warning(f"Could not detect encoding, using UTF-8: {e}")
-            return 'utf-8'
+            encoding = 'utf-8'
+        
+        self.detected_encoding = encoding
+        return encoding
     
     def read_csv(
         self,
@@ -77,46 +395,100 @@ class CSVHandler:
         
         logger.info(f"Reading CSV file: {file_path}")
         
-        try:
-            # Try reading with detected encoding
-            df = pd.read_csv(
-                file_path,
-                encoding=encoding,
-                chunksize=chunk_size,
-                on_bad_lines='skip',  # Skip bad lines instead of failing
-                **kwargs
-            )
-            
-            # If chunk_size is provided, return the iterator
-            if chunk_size:
+        # Whole-file reads go through pyarrow's multithreaded parser when possible
+        dtype = kwargs.get('dtype')
+        if (chunk_size is None and pacsv is not None and set(kwargs) - {'dtype'} <= ARROW_IGNORED_KWARGS
+                and (dtype is None or isinstance(dtype, dict))):
+            df = self._read_csv_arrow(file_path, encoding, dtype=dtype)
+            if df is not None:
+                logger.info(f"Successfully read {len(df)} rows from {file_path}")
                 return df
-            
-            # Otherwise, return the full DataFrame
-            logger.info(f"Successfully read {len(df)} rows from {file_path}")
-            return df
-            
-        except UnicodeDecodeError:
-            # Try UTF-8 with BOM
-            logger.warning("Encoding error, trying UTF-8-BOM")
+        
+        # Detected encoding first, then UTF-8 with BOM; a last lossy UTF-8 pass
+        # replaces undecodable bytes so a misdetected file still loads
+        attempts = [(encoding, 'strict'), ('utf-8-sig', 'strict'), ('utf-8', 'replace')]
+        for attempt, (attempt_encoding, errors) in enumerate(attempts):
             try:
                 df = pd.read_csv(
                     file_path,
-                    encoding='utf-8-sig',
+                    encoding=attempt_encoding,
+                    encoding_errors=errors,
                     chunksize=chunk_size,
-                    on_bad_lines='skip',
+                    on_bad_lines='skip',  # Skip bad lines instead of failing
                     **kwargs
                 )
-                if chunk_size:
-                    return df
-                logger.info(f"Successfully read {len(df)} rows with UTF-8-BOM")
-                return df
+            except UnicodeDecodeError:
+                next_encoding, next_errors = attempts[attempt + 1]
+                logger.warning(f"Encoding error with {attempt_encoding}, trying {next_encoding} (errors={next_errors})")
+                continue
             except Exception as e:
-                logger.error(f"Failed to read CSV file: {e}")
+                logger.error(f"Error reading CSV file: {e}")
                 raise
+            
+            # If chunk_size is provided, return the iterator
+            if chunk_size:
+                return df
+            
+            # Otherwise, return the full DataFrame
+            logger.info(f"Successfully read {len(df)} rows from {file_path}")
+            return df
+    
+    def read_many(
+        self,
+        file_paths: List[str],
+        max_workers: Optional[int] = None,
+        **kwargs
+    ) -> List[pd.DataFrame]:
+        """
+        Read several CSV files concurrently.
         
-        except Exception as e:
-            logger.error(f"Error reading CSV file: {e}")
-            raise
+        File reads, pyarrow and pandas' C parser release the GIL, so encoding
+        detection and parsing of each file run on a thread pool.
+        
+        Args:
+            file_paths: Paths to the CSV files
+            max_workers: Optional thread count (default: one per file, up to the CPU count)
+            **kwargs: Additional arguments to pass to read_csv
+            
+        Returns:
+            DataFrames in the same order as file_paths
+        """
+        file_paths = list(file_paths)
+        if not file_paths:
+            return []
+        
+        max_workers = max_workers or min(len(file_paths), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(lambda path: self.read_csv(path, **kwargs), file_paths))
+    
+    def _read_csv_arrow(
+        self,
+        file_path: Path,
+        encoding: str,
+        dtype: Optional[Dict[str, Any]] = None
+    ) -> Optional[pd.DataFrame]:
+        """
+        Read a whole CSV with pyarrow, matching the C engine's defaults.
+        
+        Malformed rows are not skipped here; pyarrow raises and the caller's
+        C-engine path applies on_bad_lines='skip' (which also pads short rows).
+        
+        Args:
+            file_path: Path to the CSV file
+            encoding: Text encoding
+            dtype: Optional column -> dtype; str columns skip type inference,
+                other dtypes are applied after reading
+        
+        Returns:
+            DataFrame, or None when pyarrow cannot parse or decode the file
+        """
+        table = read_arrow_table(file_path, encoding=encoding, dtype=dtype)
+        if table is None:
+            return None
+        
+        df = table.to_pandas()
+        converted = {col: col_type for col, col_type in (dtype or {}).items() if col_type is not str and col in df.columns}
+        return df.astype(converted) if converted else df
     
     def write_csv(
         self,
@@ -142,55 +514,129 @@ class CSVHandler:
         logger.info(f"Writing CSV file: {file_path} ({len(df)} rows)")
         
         try:
-            # Ensure all columns are strings and handle NaN values properly
-            df = df.copy()
-            for col in df.columns:
-                df[col] = df[col].fillna('').astype(str)
-                # Replace 'nan' string with empty string
-                df[col] = df[col].replace('nan', '')
+            # NaN cells are rendered by to_csv's na_rep; only text columns can hold a
+            # literal 'nan' string, so just those are replaced (no full-frame copy)
+            text_cols = df.select_dtypes(include=['object', 'string']).columns
+            nan_text = {col: df[col].replace('nan', '') for col in text_cols if df[col].eq('nan').any()}
+            if nan_text:
+                df = df.assign(**nan_text)
             
             # CRITICAL: Ensure Option1 Value is never empty for rows with blank titles
             # This prevents "Title can't be blank" errors from Shopify
             if 'Title' in df.columns and 'Option1 Value' in df.columns:
-                for idx in df.index:
-                    title = str(df.at[idx, 'Title']).strip()
-                    option1 = str(df.at[idx, 'Option1 Value']).strip()
-                    handle = str(df.at[idx, 'Handle']).strip() if 'Handle' in df.columns else ''
-                    
-                    # If title is empty, Option1 Value MUST be set
-                    if not title or title == '':
-                        if not option1 or option1 == '':
-                            # Set a default Option1 Value
-                            default_option1 = f"Variant-{idx}" if not handle else f"Variant-{handle}"
-                            df.at[idx, 'Option1 Value'] = default_option1
-                            logger.warning(f"CSV Handler: Set default Option1 Value for row {idx} (Handle: {handle}) to prevent 'Title can't be blank' error")
+                def text(col: str) -> pd.Series:
+                    return df[col].fillna('').astype(str).str.strip()
+                
+                # If title is empty, Option1 Value MUST be set
+                missing = (text('Title') == '') & (text('Option1 Value') == '')
+                if missing.any():
+                    handles = text('Handle') if 'Handle' in df.columns else pd.Series('', index=df.index)
+                    # Set a default Option1 Value
+                    defaults = ('Variant-' + handles).where(handles != '', 'Variant-' + df.index.astype(str))
+                    df = df.assign(**{'Option1 Value': df['Option1 Value'].mask(missing, defaults)})
+                    for idx, handle in handles[missing].items():
+                        logger.warning(f"CSV Handler: Set default Option1 Value for row {idx} (Handle: {handle}) to prevent 'Title can't be blank' error")
             
-            df.to_csv(
-                file_path,
-                encoding=encoding,
-                index=index,
-                lineterminator='\n',  # Use Unix line endings
-                quoting=1,  # QUOTE_ALL - quote all fields to preserve newlines in HTML
-                escapechar=None,  # Don't escape, use quoting instead
-                **kwargs
-            )
+            # All-text frames go through pyarrow's writer, which emits the same bytes
+            arrow_ok = (pacsv is not None and not index and not kwargs
+                        and encoding.lower().replace('_', '-') in ('utf-8', 'utf8'))
+            if not (arrow_ok and self._write_csv_arrow(df, file_path)):
+                df.to_csv(
+                    file_path,
+                    encoding=encoding,
+                    index=index,
+                    lineterminator='\n',  # Use Unix line endings
+                    na_rep='',
+                    quoting=1,  # QUOTE_ALL - quote all fields to preserve newlines in HTML
+                    escapechar=None,  # Don't escape, use quoting instead
+                    **kwargs
+                )
             logger.info(f"Successfully wrote CSV file: {file_path}")
         except Exception as e:
             logger.error(f"Error writing CSV file: {e}")
             raise
     
+    def _write_csv_arrow(self, df: pd.DataFrame, file_path: Path) -> bool:
+        """
+        Write a frame of text columns with pyarrow, quoting every field like to_csv's QUOTE_ALL.
+        
+        Missing cells are written as quoted empty strings, as na_rep='' does.
+        
+        Args:
+            df: DataFrame to write
+            file_path: Output file path
+            
+        Returns:
+            False (nothing written) when a column name or cell is not text
+        """
+        if not all(isinstance(col, str) for col in df.columns):
+            return False
+        try:
+            arrays = [pa.array(df.iloc[:, i].fillna(''), type=pa.string()) for i in range(df.shape[1])]
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            return False
+        table = pa.Table.from_arrays(arrays, names=list(df.columns))
+        pacsv.write_csv(table, file_path, write_options=pacsv.WriteOptions(quoting_style='all_valid'))
+        return True
+    
     def analyze_csv(self, file_path: str) -> Dict[str, Any]:
         """
         Analyze a CSV file and return metadata.
         
+        Files that fit in one chunk are read whole; larger ones are streamed in
+        chunks, so memory stays bounded by the chunk size, and a column whose type
+        differs between chunks is reported with the common numeric type, or object.
+        
         Args:
             file_path: Path to the CSV file
             
         Returns:
             Dictionary with analysis results
         """
-        df = self.read_csv(file_path)
+        # A newline count bounds the record count, so small files skip chunking
+        # and take read_csv's whole-file fast path
+        if _fast_row_count(file_path) - 1 <= ANALYZE_CHUNK_SIZE:
+            return self.analyze_dataframe(self.read_csv(file_path, low_memory=False))
         
+        first = None
+        row_count = 0
+        for chunk in self.read_csv(file_path, chunk_size=ANALYZE_CHUNK_SIZE, low_memory=False):
+            if first is None:
+                first = chunk
+                dtypes = chunk.dtypes.to_dict()
+                missing_values = chunk.isnull().sum()
+            else:
+                for col, dtype in chunk.dtypes.items():
+                    dtypes[col] = _merge_dtypes(dtypes[col], dtype)
+                missing_values += chunk.isnull().sum()
+            row_count += len(chunk)
+        
+        if first is None:
+            # Header-only file: the chunked reader yields nothing
+            return self.analyze_dataframe(self.read_csv(file_path))
+        
+        analysis = {
+            'row_count': row_count,
+            'column_count': len(first.columns),
+            'columns': list(first.columns),
+            'dtypes': dtypes,
+            'missing_values': missing_values.to_dict(),
+            'sample_rows': first.head(10).to_dict('records'),
+        }
+        
+        logger.info(f"CSV Analysis: {analysis['row_count']} rows, {analysis['column_count']} columns")
+        return analysis
+    
+    def analyze_dataframe(self, df: pd.DataFrame) -> Dict[str, Any]:
+        """
+        Analyze an already loaded DataFrame and return metadata.
+        
+        Args:
+            df: DataFrame to analyze
+            
+        Returns:
+            Dictionary with analysis results
+        """
         analysis = {
             'row_count': len(df),
             'column_count': len(df.columns),
@@ -217,7 +663,12 @@ class CSVHandler:
             output_path: Path to output sample CSV file
             sample_size: Number of rows to extract
         """
-        df = self.read_csv(file_path)
+        # Only the leading rows are parsed; the rest of the file is never read.
+        # When the whole file fits in the sample, read it on the fast path instead
+        if _fast_row_count(file_path) - 1 <= sample_size:
+            df = self.read_csv(file_path)
+        else:
+            df = self.read_csv(file_path, nrows=sample_size)
         
         if len(df) < sample_size:
             logger.warning(f"Source file has only {len(df)} rows, using all rows")
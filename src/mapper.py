@@ -4,15 +4,48 @@ Handles mapping of source fields to Shopify fields with various transformation r
 """
 
 import json
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Callable
 from loguru import logger
+import numpy as np
 import pandas as pd
 
+# map_frame's text columns: Arrow-backed strings (vectorized str kernels) when pyarrow is installed
+try:
+    import pyarrow  # noqa: F401
+    TEXT_DTYPE = pd.StringDtype('pyarrow')
+except ImportError:
+    TEXT_DTYPE = pd.StringDtype()
+
+# orjson parses configs several times faster; its JSONDecodeError subclasses json's
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Source fields folded into the description's Specifications section (the last
+# one is listed twice, so its text is appended twice)
+SPEC_FIELDS = ['Meta: features', 'Meta: texhnical_specs', 'Meta: _features', 'Meta: _texhnical_specs', 
+               'Meta: upper_feature', 'Meta: _upper_featureupper_feature', 'Meta: _upper_featureupper_feature']
+
 
 class FieldMapper:
     """Map source fields to Shopify fields using configuration rules."""
     
+    # Condition operators: (prepare compare value once, test(source value, prepared value))
+    _OPS = {
+        '>': (float, lambda source, compare: float(source) > compare),
+        '<': (float, lambda source, compare: float(source) < compare),
+        '>=': (float, lambda source, compare: float(source) >= compare),
+        '<=': (float, lambda source, compare: float(source) <= compare),
+        '==': (str, lambda source, compare: str(source) == compare),
+        '!=': (str, lambda source, compare: str(source) != compare),
+        'contains': (lambda compare: str(compare).lower(), lambda source, compare: compare in str(source).lower()),
+        'empty': (lambda compare: compare, lambda source, compare: source is None or str(source).strip() == ''),
+    }
+    
     def __init__(self, mapping_config_path: Optional[str] = None):
         """
         Initialize field mapper.
@@ -21,6 +54,7 @@ class FieldMapper:
             mapping_config_path: Path to field mapping JSON configuration
         """
         self.mapping_config = {}
+        self._compile_mappings()
         if mapping_config_path:
             self.load_mapping_config(mapping_config_path)
     
@@ -32,8 +66,8 @@ class FieldMapper:
             config_path: Path to mapping configuration JSON file
         """
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                self.mapping_config = json.load(f)
+            with open(config_path, 'rb') as f:
+                self.mapping_config = _json_loads(f.read())
             logger.info(f"Loaded mapping configuration from {config_path}")
         except FileNotFoundError:
             logger.warning(f"Mapping config not found: {config_path}, using empty config")
@@ -41,6 +75,39 @@ class FieldMapper:
         except json.JSONDecodeError as e:
             logger.error(f"Invalid JSON in mapping config: {e}")
             raise
+        self._compile_mappings()
+    
+    def _compile_mappings(self) -> None:
+        """Flatten mapping_config into the tuples map_row and map_frame iterate."""
+        mappings = self.mapping_config.get('mappings', {})
+        
+        self._direct_items = tuple(mappings.get('direct', {}).get('fields', {}).items())
+        self._concat_specs = tuple(
+            (mapping.get('target'), tuple(mapping.get('fields', [])), mapping.get('separator', ' '))
+            for mapping in mappings.get('concatenate', {}).get('fields', {}).values()
+        )
+        self._cond_specs = tuple(
+            (
+                mapping.get('target'),
+                condition.get('field'),
+                condition.get('operator'),
+                condition.get('value'),
+                _memoize_condition(self._compile_condition(condition.get('operator'), condition.get('value'))),
+                condition.get('then'),
+                condition.get('else')
+            )
+            for mapping in mappings.get('conditional', {}).get('fields', {}).values()
+            for condition in [mapping.get('condition', {})]
+        )
+        self._defaults = tuple(mappings.get('default', {}).get('fields', {}).items())
+        
+        # Target for the combined description: the Description/Body (HTML) direct mapping if any
+        desc_target = next(
+            (shopify_field for source_field, shopify_field in self._direct_items
+             if source_field == 'Description' or shopify_field in ['Description', 'Body (HTML)']),
+            None
+        )
+        self._desc_target = desc_target or 'Description'
     
     def map_row(self, source_row: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -55,11 +122,10 @@ class FieldMapper:
         shopify_row = {}
         
         # Apply direct mappings
-        direct_mappings = self.mapping_config.get('mappings', {}).get('direct', {}).get('fields', {})
-        for source_field, shopify_field in direct_mappings.items():
+        for source_field, shopify_field in self._direct_items:
             if source_field in source_row:
                 value = source_row[source_field]
-                if pd.notna(value):  # Check for NaN/None
+                if _notna(value):  # Check for NaN/None
                     shopify_row[shopify_field] = str(value).strip()
         
         # CRITICAL: Ensure Description field is populated from any available source
@@ -68,31 +134,26 @@ class FieldMapper:
         specification_parts = []
         
         # Check Description field (for Overview)
-        if 'Description' in source_row:
-            desc = source_row['Description']
-            if pd.notna(desc) and str(desc).strip() != '' and str(desc).strip().lower() != 'nan':
-                description_parts.append(str(desc).strip())
+        desc = _content(source_row.get('Description'))
+        if desc:
+            description_parts.append(desc)
         
         # Check Short description field (for Overview)
-        if 'Short description' in source_row:
-            short_desc = source_row['Short description']
-            if pd.notna(short_desc) and str(short_desc).strip() != '' and str(short_desc).strip().lower() != 'nan':
-                description_parts.append(str(short_desc).strip())
+        short_desc = _content(source_row.get('Short description'))
+        if short_desc:
+            description_parts.append(short_desc)
         
         # Check Meta: rank_math_description as fallback (for Overview)
-        if 'Meta: rank_math_description' in source_row and len(description_parts) == 0:
-            meta_desc = source_row['Meta: rank_math_description']
-            if pd.notna(meta_desc) and str(meta_desc).strip() != '' and str(meta_desc).strip().lower() != 'nan':
-                description_parts.append(str(meta_desc).strip())
+        if len(description_parts) == 0:
+            meta_desc = _content(source_row.get('Meta: rank_math_description'))
+            if meta_desc:
+                description_parts.append(meta_desc)
         
         # Check for specification fields (Meta: features, Meta: texhnical_specs, etc.)
-        spec_fields = ['Meta: features', 'Meta: texhnical_specs', 'Meta: _features', 'Meta: _texhnical_specs', 
-                       'Meta: upper_feature', 'Meta: _upper_featureupper_feature', 'Meta: _upper_featureupper_feature']
-        for spec_field in spec_fields:
-            if spec_field in source_row:
-                spec = source_row[spec_field]
-                if pd.notna(spec) and str(spec).strip() != '' and str(spec).strip().lower() != 'nan':
-                    specification_parts.append(str(spec).strip())
+        for spec_field in SPEC_FIELDS:
+            spec = _content(source_row.get(spec_field))
+            if spec:
+                specification_parts.append(spec)
         
         # Combine description parts for Overview
         overview_content = '\n\n'.join(description_parts) if description_parts else ''
@@ -112,60 +173,181 @@ class FieldMapper:
         
         # Set to Description field if we have any content
         if combined_description:
-            # Find the target field for Description
-            desc_target = None
-            for source_field, shopify_field in direct_mappings.items():
-                if source_field == 'Description' or shopify_field in ['Description', 'Body (HTML)']:
-                    desc_target = shopify_field
-                    break
-            
-            if desc_target:
-                shopify_row[desc_target] = combined_description
-            else:
-                # Description not in direct mappings, add it directly
-                shopify_row['Description'] = combined_description
+            shopify_row[self._desc_target] = combined_description
         
         # Apply concatenation mappings
-        concat_mappings = self.mapping_config.get('mappings', {}).get('concatenate', {}).get('fields', {})
-        for mapping in concat_mappings.values():
-            target = mapping.get('target')
-            fields = mapping.get('fields', [])
-            separator = mapping.get('separator', ' ')
-            
+        for target, fields, separator in self._concat_specs:
             values = []
             for field in fields:
                 if field in source_row:
                     value = source_row[field]
-                    if pd.notna(value):
+                    if _notna(value):
                         values.append(str(value).strip())
             
             if values:
                 shopify_row[target] = separator.join(values)
         
         # Apply conditional mappings
-        conditional_mappings = self.mapping_config.get('mappings', {}).get('conditional', {}).get('fields', {})
-        for mapping in conditional_mappings.values():
-            target = mapping.get('target')
-            condition = mapping.get('condition', {})
-            field = condition.get('field')
-            operator = condition.get('operator')
-            value = condition.get('value')
-            then_value = condition.get('then')
-            else_value = condition.get('else')
-            
+        for target, field, operator, value, test, then_value, else_value in self._cond_specs:
             if field and field in source_row:
-                source_value = source_row[field]
-                condition_met = self._evaluate_condition(source_value, operator, value)
+                condition_met = _run_condition(test, source_row[field])
                 shopify_row[target] = then_value if condition_met else else_value
         
         # Apply default values
-        default_values = self.mapping_config.get('mappings', {}).get('default', {}).get('fields', {})
-        for field, default_value in default_values.items():
+        for field, default_value in self._defaults:
             if field not in shopify_row:
                 shopify_row[field] = default_value
         
         return shopify_row
     
+    def map_frame(self, source_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Map a whole source DataFrame to Shopify format with column operations.
+        
+        Row for row this gives the same values as map_row; fields map_row would
+        leave out of a row's dict are NaN.
+        
+        Args:
+            source_df: Source rows
+            
+        Returns:
+            DataFrame of Shopify-formatted rows, indexed like source_df
+        """
+        index = source_df.index
+        columns = {}
+        present = {}
+        
+        def assign(field: str, values: pd.Series, mask: pd.Series) -> None:
+            # Later mappings overwrite earlier ones only where they produced a value
+            if field in columns:
+                values = values.where(mask, columns[field])
+                mask = mask | present[field]
+            columns[field] = values
+            present[field] = mask
+        
+        texts = {}
+        
+        def text(field: str) -> pd.Series:
+            # Stripped text of a source column, NA where missing (each column converted once)
+            if field not in texts:
+                texts[field] = source_df[field].astype(TEXT_DTYPE).str.strip()
+            return texts[field]
+        
+        # Apply direct mappings
+        for source_field, shopify_field in self._direct_items:
+            if source_field in source_df.columns:
+                values = text(source_field)
+                assign(shopify_field, values, values.notna())
+        
+        # Description: Description and Short description for the Overview, the
+        # rank_math meta description as fallback, then the specification fields
+        def content(fields: List[str]) -> pd.Series:
+            parts = []
+            for field in fields:
+                if field in source_df.columns:
+                    values = text(field)
+                    # Only three-character cells can spell 'nan', so long HTML is never lowercased
+                    short = values.str.len().eq(3).fillna(False)
+                    blank = values.eq('').fillna(False) | (short & values.where(short).str.lower().eq('nan').fillna(False))
+                    parts.append(values.mask(blank))
+            if not parts:
+                return pd.Series(pd.NA, index=index, dtype=TEXT_DTYPE)
+            return _join(parts, '\n\n')
+        
+        overview = content(['Description', 'Short description']).fillna(content(['Meta: rank_math_description']))
+        specs = content(SPEC_FIELDS)
+        
+        combined = overview.where(
+            specs.isna(),
+            (overview + '\n\n---SPECIFICATIONS---\n\n' + specs).fillna('---SPECIFICATIONS---\n\n' + specs)
+        )
+        assign(self._desc_target, combined, combined.notna())
+        
+        # Apply concatenation mappings
+        for target, fields, separator in self._concat_specs:
+            fields = [field for field in fields if field in source_df.columns]
+            if fields:
+                values = _join([text(field) for field in fields], separator)
+                assign(target, values, values.notna())
+        
+        # Apply conditional mappings
+        for target, field, operator, value, test, then_value, else_value in self._cond_specs:
+            if field and field in source_df.columns:
+                condition_met = self._condition_mask(source_df[field], operator, value)
+                values = pd.Series(np.where(condition_met, then_value, else_value), index=index, dtype=object)
+                assign(target, values, pd.Series(True, index=index))
+        
+        # Apply default values
+        for field, default_value in self._defaults:
+            if field in columns:
+                columns[field] = columns[field].where(present[field], default_value)
+            else:
+                columns[field] = pd.Series(default_value, index=index, dtype=object)
+            present[field] = pd.Series(True, index=index)
+        
+        return pd.DataFrame(
+            {field: values.where(present[field]) for field, values in columns.items()},
+            index=index
+        )
+    
+    def map_records(self, source_df: pd.DataFrame) -> List[Dict[str, Any]]:
+        """
+        Map a whole source DataFrame with map_frame and return one dict per row.
+        
+        Each dict holds the same fields and values map_row returns for that row.
+        
+        Args:
+            source_df: Source rows
+            
+        Returns:
+            List of Shopify-formatted row dicts, in source_df order
+        """
+        return frame_records(self.map_frame(source_df))
+    
+    def _condition_mask(self, source_values: pd.Series, operator: str, compare_value: Any) -> pd.Series:
+        """
+        Evaluate a condition for every value of a column, like _evaluate_condition.
+        
+        Args:
+            source_values: Column from source data
+            operator: Comparison operator (>, <, ==, !=, >=, <=, contains, empty)
+            compare_value: Value to compare against
+            
+        Returns:
+            Boolean Series of condition results
+        """
+        missing = source_values.isna()
+        
+        if operator in ('>', '<', '>=', '<='):
+            try:
+                compare_number = float(compare_value)
+            except (ValueError, TypeError) as e:
+                logger.warning(f"Error evaluating condition: {e}")
+                return pd.Series(False, index=source_values.index)
+            numbers = pd.to_numeric(source_values, errors='coerce')
+            # float() accepts a few spellings to_numeric rejects; retry only those cells
+            retry = numbers.isna() & ~missing
+            if retry.any():
+                numbers[retry] = source_values[retry].map(_to_float)
+            return {
+                '>': numbers.gt, '<': numbers.lt, '>=': numbers.ge, '<=': numbers.le
+            }[operator](compare_number)
+        
+        if operator in ('==', '!=', 'contains'):
+            # str(None) is 'None', which is what missing values compare as
+            text = source_values.astype(str).where(~missing, 'None')
+            if operator == '==':
+                return text.eq(str(compare_value))
+            if operator == '!=':
+                return text.ne(str(compare_value))
+            return text.str.lower().str.contains(str(compare_value).lower(), regex=False)
+        
+        if operator == 'empty':
+            return missing | source_values.astype(str).str.strip().eq('')
+        
+        logger.warning(f"Unknown operator: {operator}")
+        return pd.Series(False, index=source_values.index)
+    
     def _evaluate_condition(
         self,
         source_value: Any,
@@ -183,32 +365,31 @@ class FieldMapper:
         Returns:
             Boolean result of condition evaluation
         """
-        if pd.isna(source_value):
-            source_value = None
+        return _run_condition(self._compile_condition(operator, compare_value), source_value)
+    
+    def _compile_condition(self, operator: str, compare_value: Any) -> Callable[[Any], bool]:
+        """
+        Resolve a condition's operator and compare value once into a test function.
+        
+        Args:
+            operator: Comparison operator (>, <, ==, !=, >=, <=, contains, empty)
+            compare_value: Value to compare against
+            
+        Returns:
+            Function of the source value (None when missing); raises ValueError or
+            TypeError when the source value cannot be compared
+        """
+        if operator not in self._OPS:
+            logger.warning(f"Unknown operator: {operator}")
+            return lambda source_value: False
         
+        prepare, test = self._OPS[operator]
         try:
-            if operator == '>':
-                return float(source_value) > float(compare_value)
-            elif operator == '<':
-                return float(source_value) < float(compare_value)
-            elif operator == '>=':
-                return float(source_value) >= float(compare_value)
-            elif operator == '<=':
-                return float(source_value) <= float(compare_value)
-            elif operator == '==':
-                return str(source_value) == str(compare_value)
-            elif operator == '!=':
-                return str(source_value) != str(compare_value)
-            elif operator == 'contains':
-                return str(compare_value).lower() in str(source_value).lower()
-            elif operator == 'empty':
-                return pd.isna(source_value) or str(source_value).strip() == ''
-            else:
-                logger.warning(f"Unknown operator: {operator}")
-                return False
+            prepared = prepare(compare_value)
         except (ValueError, TypeError) as e:
             logger.warning(f"Error evaluating condition: {e}")
-            return False
+            return lambda source_value: False
+        return lambda source_value: test(source_value, prepared)
     
     def get_required_fields(self) -> List[str]:
         """
@@ -228,3 +409,83 @@ class FieldMapper:
         """
         return self.mapping_config.get('optional_fields', [])
 
+
+def frame_records(frame: pd.DataFrame) -> List[Dict[str, Any]]:
+    """
+    Convert a mapped or transformed DataFrame back to per-row dicts.
+    
+    NaN cells mark fields the row does not have, so they are left out.
+    
+    Args:
+        frame: DataFrame from map_frame or DataTransformer.transform_frame
+        
+    Returns:
+        List of row dicts, in frame order
+    """
+    fields = frame.columns.tolist()
+    present = frame.notna().to_numpy()
+    return [
+        {field: value for field, value, keep in zip(fields, values, row_present) if keep}
+        for values, row_present in zip(frame.itertuples(index=False, name=None), present)
+    ]
+
+
+def _notna(value: Any) -> bool:
+    """Scalar pd.notna without pandas' dispatch: None, pd.NA and NaN/NaT (unequal to themselves) are missing."""
+    return value is not None and value is not pd.NA and value == value
+
+
+def _content(value: Any) -> Optional[str]:
+    """Stripped text of a description-like value, or None if it is missing, blank or 'nan'."""
+    if not _notna(value):
+        return None
+    text = str(value).strip()
+    if text == '' or text.lower() == 'nan':
+        return None
+    return text
+
+
+def _memoize_condition(test: Callable[[Any], bool]) -> Callable[[Any], bool]:
+    """
+    Cache a compiled condition per source value.
+    
+    Conditions usually test low-cardinality columns (stock status, published
+    flags), so most rows hit the cache. typed=True keeps 1, 1.0 and True apart
+    since they stringify differently; unhashable values skip the cache.
+    """
+    cached = lru_cache(maxsize=16384, typed=True)(test)
+    
+    def memoized(source_value: Any) -> bool:
+        try:
+            return cached(source_value)
+        except TypeError:
+            return test(source_value)
+    
+    return memoized
+
+
+def _run_condition(test: Callable[[Any], bool], source_value: Any) -> bool:
+    """Apply a compiled condition; missing values are passed as None and errors count as False."""
+    if not _notna(source_value):
+        source_value = None
+    try:
+        return test(source_value)
+    except (ValueError, TypeError) as e:
+        logger.warning(f"Error evaluating condition: {e}")
+        return False
+
+
+def _join(parts: List[pd.Series], separator: str) -> pd.Series:
+    """Join Series element-wise with separator, skipping NaN parts (NaN where all are)."""
+    joined = parts[0]
+    for part in parts[1:]:
+        joined = joined.where(part.isna(), (joined + separator + part).fillna(part))
+    return joined
+
+
+def _to_float(value: Any) -> float:
+    """float(value), or NaN where float() fails."""
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return np.nan
@@ -3,21 +3,70 @@ Migration Orchestrator Module
 Coordinates the entire migration process.
 """
 
+import csv
+import numpy as np
 import pandas as pd
 import re
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 from decimal import Decimal, InvalidOperation
 from datetime import datetime
 from loguru import logger
 from tqdm import tqdm
 
 from .csv_handler import CSVHandler
-from .mapper import FieldMapper
+from .mapper import FieldMapper, frame_records
 from .transformer import DataTransformer
 from .validator import DataValidator
 
 
+# Description column names that stand in for each other between transformer output and template
+DESCRIPTION_ALIASES = {'Description': 'Body (HTML)', 'Body (HTML)': 'Description'}
+
+# Template column names -> the column names Shopify's product import accepts
+COLUMN_MAPPING = {
+    'URL handle': 'Handle',
+    'Description': 'Body (HTML)',
+    'Published on online store': 'Published',
+    'SKU': 'Variant SKU',
+    'Price': 'Variant Price',
+    'Compare-at price': 'Variant Compare At Price',
+    'Product image URL': 'Image Src',
+    'Option1 name': 'Option1 Name',
+    'Option1 value': 'Option1 Value',
+    'Option2 name': 'Option2 Name',
+    'Option2 value': 'Option2 Value',
+    'Option3 name': 'Option3 Name',
+    'Option3 value': 'Option3 Value',
+    'Inventory tracker': 'Variant Inventory Tracker',
+    'Inventory quantity': 'Variant Inventory Qty',
+    'Continue selling when out of stock': 'Variant Inventory Policy',
+    'Fulfillment service': 'Variant Fulfillment Service',
+    'Weight value (grams)': 'Variant Grams',
+    'Requires shipping': 'Variant Requires Shipping',
+    'Charge tax': 'Variant Taxable',
+    'Image alt text': 'Image Alt Text',
+    'Variant image URL': 'Variant Image',
+    'SEO title': 'SEO Title',
+    'SEO description': 'SEO Description'
+}
+
+# Columns Shopify's product import recognises, in output order
+SHOPIFY_ACCEPTED_COLUMNS = (
+    'Handle', 'Title', 'Body (HTML)', 'Vendor', 'Product category', 'Type', 'Tags', 'Published',
+    'Option1 Name', 'Option1 Value', 'Option2 Name', 'Option2 Value',
+    'Option3 Name', 'Option3 Value', 'Variant SKU', 'Variant Grams',
+    'Variant Inventory Tracker', 'Variant Inventory Qty', 'Variant Inventory Policy',
+    'Variant Fulfillment Service', 'Variant Price', 'Variant Compare At Price',
+    'Variant Requires Shipping', 'Variant Taxable', 'Variant Barcode',
+    'Image Src', 'Image Alt Text', 'Variant Image', 'Gift Card',
+    'SEO Title', 'SEO Description'
+)
+
+# Columns of the error report CSV written next to the output file
+ERROR_REPORT_FIELDS = ['row_number', 'error_type', 'errors', 'warnings']
+
+
 def normalize_product_name(product_name: str) -> str:
     """
     Normalize product name by stripping variant suffixes (size, color, numeric).
@@ -105,6 +154,36 @@ def determine_product_group_id(row: pd.Series) -> str:
     return ""
 
 
+def determine_product_group_ids(df: pd.DataFrame) -> pd.Series:
+    """
+    Vectorized determine_product_group_id over a whole DataFrame.
+    
+    Parent and SKU keys are resolved with column operations; the name
+    normalizer only runs once per distinct name among the remaining rows.
+    """
+    parent = _cell_text(df, 'Parent')
+    sku = _cell_text(df, 'SKU')
+    row_type = _cell_text(df, 'Type').str.lower()
+    
+    has_parent = (parent != '') & ~parent.str.lower().isin(['nan', 'none', '0'])
+    has_sku = (sku != '') & ~sku.str.lower().isin(['nan', 'none'])
+    use_sku = ~has_parent & has_sku & row_type.isin(['variation', 'variable', 'simple', 'grouped'])
+    
+    group_ids = pd.Series('', index=df.index, dtype=object)
+    group_ids[has_parent] = parent[has_parent]
+    group_ids[use_sku] = sku[use_sku]
+    
+    by_name = ~(has_parent | use_sku)
+    if by_name.any() and 'Name' in df.columns:
+        names = df.loc[by_name, 'Name']
+        base_names = {name: normalize_product_name(name) for name in names.dropna().unique()}
+        base = names.map(base_names).fillna('')
+        raw = names.astype(object).map(str).str.strip().where(names.notna(), '')
+        group_ids[by_name] = base.where(base != '', raw)
+    
+    return group_ids
+
+
 def clean_price_value(value: Any) -> Optional[str]:
     """
     Normalize a price value from the source row to a Shopify-compatible string.
@@ -130,32 +209,218 @@ def clean_price_value(value: Any) -> Optional[str]:
         return None
     
     return f"{price_decimal.quantize(Decimal('0.01'))}"
+
+
+def _cell_text(df: pd.DataFrame, column: str) -> pd.Series:
+    """Render a column like str(value).strip() per cell; missing columns act as ''."""
+    if column not in df.columns:
+        return pd.Series('', index=df.index, dtype=object)
+    return df[column].astype(object).map(str).str.strip()
+
+
+def _missing(value: Any) -> bool:
+    """
+    True for None, NaN and values that are blank or 'nan' once stripped.
+    
+    Plain-Python form of the pd.isna(...) / str(...).strip() checks the group
+    loop runs on every row, without pandas' scalar dispatch.
+    """
+    if value is None or value is pd.NA or (isinstance(value, float) and value != value):
+        return True
+    text = str(value).strip()
+    return text == '' or text.lower() == 'nan'
+
+
+def _iter_rows(df: pd.DataFrame) -> Iterator[Tuple[Any, Dict[str, Any]]]:
+    """Yield (index, row dict) pairs like iterrows(), without building a Series per row."""
+    columns = list(df.columns)
+    for idx, *values in df.itertuples(name=None):
+        yield idx, dict(zip(columns, values))
+
+
+def _holds_inventory(quantity: str) -> Optional[bool]:
+    """
+    Classify the text of an inventory quantity.
+    
+    Returns:
+        True for a number above zero, False for text that is not a number,
+        None for blank, 'nan', zero or negative quantities
+    """
+    if quantity in ('', 'nan', '0'):
+        return None
+    try:
+        return True if float(quantity) > 0 else None
+    except ValueError:
+        return False
+
+
+def fix_inventory_tracker(shopify_df: pd.DataFrame) -> int:
+    """
+    Set Variant Inventory Tracker to "shopify" on every row that holds inventory.
+    
+    Rows with a positive quantity get the tracker unless it already is "shopify";
+    rows whose quantity does not parse always get it.
+    
+    Returns:
+        Number of rows updated
+    """
+    quantity = _cell_text(shopify_df, 'Variant Inventory Qty')
+    holds = quantity.map({text: _holds_inventory(text) for text in quantity.unique()})
+    tracker = _cell_text(shopify_df, 'Variant Inventory Tracker').str.lower()
+    
+    fix = (holds.eq(True) & (tracker != 'shopify')) | holds.eq(False)
+    shopify_df.loc[fix, 'Variant Inventory Tracker'] = "shopify"
+    return int(fix.sum())
+
+
+def fix_fulfillment_service(shopify_df: pd.DataFrame) -> int:
+    """
+    Set Variant Fulfillment Service to "manual" on single products and variant rows.
+    
+    A handle's parent is its first titled row; every other row of the handle is a
+    variant row. Handles with one row, or no titled row, are single products.
+    Parent rows of handles with variants are left alone.
+    
+    Returns:
+        Number of rows updated
+    """
+    if 'Handle' not in shopify_df.columns or 'Title' not in shopify_df.columns:
+        return 0
+    
+    handles = shopify_df['Handle']
+    titled = shopify_df['Title'].notna() & (shopify_df['Title'] != '')
+    is_parent = titled & ~handles.where(titled).duplicated()
+    has_parent = handles.isin(handles[titled])
+    is_single = ~has_parent | handles.map(handles.value_counts()).eq(1)
+    
+    needs_service = handles.notna() & (handles != '') & (is_single | (has_parent & ~is_parent))
+    fix = needs_service & (_cell_text(shopify_df, 'Variant Fulfillment Service').str.lower() != 'manual')
+    shopify_df.loc[fix, 'Variant Fulfillment Service'] = 'manual'
+    return int(fix.sum())
+
+
+def fix_inventory_policy(shopify_df: pd.DataFrame) -> int:
+    """
+    Coerce Variant Inventory Policy to "deny" or "continue" where a policy is required.
+    
+    Variant rows (blank Title) and rows with a price, SKU or non-zero inventory
+    need a policy; allow-style values become "continue", anything else "deny".
+    
+    Returns:
+        Number of rows updated
+    """
+    def filled(column: str, blanks: List[str]) -> pd.Series:
+        # Truthy cell whose text is not one of the blank spellings
+        if column not in shopify_df.columns:
+            return pd.Series(False, index=shopify_df.index)
+        return shopify_df[column].astype(object).map(bool) & ~_cell_text(shopify_df, column).isin(blanks)
+    
+    title = shopify_df['Title'] if 'Title' in shopify_df.columns else pd.Series('', index=shopify_df.index)
+    is_variant_row = title.isna() | (_cell_text(shopify_df, 'Title') == '')
+    has_variant_fields = (
+        filled('Variant Price', ['', 'nan']) |
+        filled('Variant SKU', ['', 'nan']) |
+        filled('Variant Inventory Qty', ['', 'nan', '0'])
+    )
+    
+    policy = _cell_text(shopify_df, 'Variant Inventory Policy').str.lower()
+    fix = (is_variant_row | has_variant_fields) & ~policy.isin(['deny', 'continue'])
+    allow = policy.isin(['true', '1', 'yes', 'y', 'allow', 'allow_continue'])
+    shopify_df.loc[fix & allow, 'Variant Inventory Policy'] = 'continue'
+    shopify_df.loc[fix & ~allow, 'Variant Inventory Policy'] = 'deny'
+    return int(fix.sum())
+
+
+def fill_variant_option1(shopify_df: pd.DataFrame) -> int:
+    """
+    Give every variant row (blank Title) a non-empty Option1 Value.
+    
+    Missing values are copied from the first variant of the same Handle that has
+    one, otherwise taken from Variant SKU, otherwise generated from the row index.
+    Handles are indexed in one pass instead of re-filtering the frame per row.
+    
+    Returns:
+        Number of rows updated
+    """
+    is_variant_row = shopify_df['Title'].isna() | (_cell_text(shopify_df, 'Title') == '')
+    option1 = _cell_text(shopify_df, 'Option1 Value')
+    has_option1 = shopify_df['Option1 Value'].notna() & (option1 != '') & (option1.str.lower() != 'nan')
+    to_fix = is_variant_row & ~has_option1
+    if not to_fix.any():
+        return 0
+    
+    # Handle -> (position, value) of the first variant row carrying an Option1 Value
+    first_option1: Dict[Any, Tuple[int, Any]] = {}
+    handles = shopify_df['Handle'].tolist()
+    values = shopify_df['Option1 Value'].tolist()
+    for pos in np.flatnonzero((is_variant_row & has_option1).to_numpy()):
+        first_option1.setdefault(handles[pos], (pos, values[pos]))
+    
+    skus = shopify_df['Variant SKU'].tolist() if 'Variant SKU' in shopify_df.columns else None
+    if 'Option1 Name' in shopify_df.columns:
+        names = shopify_df['Option1 Name'].tolist()
+    else:
+        names = None
+    option1_col = shopify_df.columns.get_loc('Option1 Value')
+    name_col = shopify_df.columns.get_loc('Option1 Name') if names is not None else None
+    
+    fixes = 0
+    for pos in np.flatnonzero(to_fix.to_numpy()):
+        idx = shopify_df.index[pos]
+        handle = handles[pos]
+        has_handle = bool(handle) and pd.notna(handle) and str(handle).strip() != ''
+        if has_handle and handle in first_option1:
+            value = str(first_option1[handle][1]).strip()
+        else:
+            variant_sku = skus[pos] if skus is not None else ''
+            if variant_sku and pd.notna(variant_sku) and str(variant_sku).strip() != '':
+                value = str(variant_sku).strip()
+            else:
+                value = f"Variant-{idx}"
+                logger.warning(f"Generated default Option1 Value for row {idx} (Handle: {handle}) - this should be rare")
+        shopify_df.iat[pos, option1_col] = value
+        fixes += 1
+        
+        # A filled row becomes a source for later rows of the same handle
+        if value.lower() != 'nan' and (handle not in first_option1 or pos < first_option1[handle][0]):
+            first_option1[handle] = (pos, value)
+        
+        if names is not None and _missing(names[pos]):
+            shopify_df.iat[pos, name_col] = 'Size'
+    return fixes
+
+
 class MigrationOrchestrator:
     """Orchestrate the complete migration process."""
     
     def __init__(
         self,
-        source_csv_path: str,
+        source_csv_path: Optional[str],
         shopify_template_path: str,
         output_path: str,
         mapping_config_path: Optional[str] = None,
-        sample_size: Optional[int] = None
+        sample_size: Optional[int] = None,
+        dtype_overrides: Optional[Dict[str, Any]] = None
     ):
         """
         Initialize migration orchestrator.
         
         Args:
-            source_csv_path: Path to source products CSV
+            source_csv_path: Path to source products CSV (None with from_dataframe)
             shopify_template_path: Path to Shopify template CSV
             output_path: Path for output CSV
             mapping_config_path: Path to field mapping configuration
             sample_size: Optional sample size for testing
+            dtype_overrides: Optional source column -> dtype used when reading the CSV,
+                e.g. str to skip inference or 'category' for low-cardinality columns
         """
-        self.source_csv_path = Path(source_csv_path)
+        self.source_csv_path = Path(source_csv_path) if source_csv_path else None
+        self.source_df: Optional[pd.DataFrame] = None
         self.shopify_template_path = Path(shopify_template_path)
         self.output_path = Path(output_path)
         self.mapping_config_path = mapping_config_path
         self.sample_size = sample_size
+        self.dtype_overrides = dtype_overrides
         
         # Initialize components
         self.csv_handler = CSVHandler()
@@ -181,6 +446,10 @@ class MigrationOrchestrator:
         self.transformer = DataTransformer(category_mapping_path=category_mapping_path)
         self.validator = DataValidator()
         
+        # Error report file and writer, opened when the first error is recorded
+        self._error_report_file = None
+        self._error_report_writer = None
+        
         # Statistics
         self.stats = {
             'total_rows': 0,
@@ -191,6 +460,54 @@ class MigrationOrchestrator:
             'warnings': []
         }
     
+    @classmethod
+    def from_dataframe(
+        cls,
+        source_df: pd.DataFrame,
+        shopify_template_path: str,
+        output_path: str,
+        mapping_config_path: Optional[str] = None,
+        sample_size: Optional[int] = None
+    ) -> 'MigrationOrchestrator':
+        """
+        Create an orchestrator that migrates an in-memory source DataFrame.
+        
+        Skips writing the rows to a temporary CSV only to have migrate() parse
+        them back.
+        
+        Args:
+            source_df: Source product rows (same columns as the source CSV)
+            shopify_template_path: Path to Shopify template CSV
+            output_path: Path for output CSV
+            mapping_config_path: Path to field mapping configuration
+            sample_size: Optional sample size for testing
+            
+        Returns:
+            MigrationOrchestrator bound to the DataFrame
+        """
+        orchestrator = cls(
+            source_csv_path=None,
+            shopify_template_path=shopify_template_path,
+            output_path=output_path,
+            mapping_config_path=mapping_config_path,
+            sample_size=sample_size
+        )
+        orchestrator.source_df = source_df
+        return orchestrator
+    
+    def load_source(self) -> pd.DataFrame:
+        """
+        Load the source rows, from the in-memory DataFrame when one was given.
+        
+        Returns:
+            Source DataFrame (a copy, so migrate() can add helper columns)
+        """
+        if self.source_df is not None:
+            return self.source_df.copy()
+        if self.dtype_overrides:
+            return self.csv_handler.read_csv(str(self.source_csv_path), dtype=self.dtype_overrides)
+        return self.csv_handler.read_csv(str(self.source_csv_path))
+    
     def _extract_source_price(self, row: pd.Series) -> Optional[str]:
         """
         Extract the best available price from the source row.
@@ -220,7 +537,10 @@ class MigrationOrchestrator:
             Analysis dictionary
         """
         logger.info("Analyzing source CSV file...")
-        analysis = self.csv_handler.analyze_csv(str(self.source_csv_path))
+        if self.source_df is not None:
+            analysis = self.csv_handler.analyze_dataframe(self.source_df)
+        else:
+            analysis = self.csv_handler.analyze_csv(str(self.source_csv_path))
         self.stats['total_rows'] = analysis['row_count']
         return analysis
     
@@ -347,35 +667,117 @@ class MigrationOrchestrator:
         """
         Execute the complete migration process with variant grouping.
         
+        The error report is closed however the migration ends.
+        
+        Returns:
+            Migration statistics dictionary
+        """
+        try:
+            return self._run_migration()
+        finally:
+            self._generate_error_report()
+    
+    def _run_migration(self) -> Dict[str, Any]:
+        """
+        Run the migration steps; errors are streamed to the error report as they occur.
+        
         Returns:
             Migration statistics dictionary
         """
         logger.info("Starting migration process...")
+        errors = []
         
         # Load source data
-        source_df = self.csv_handler.read_csv(str(self.source_csv_path))
+        source_df = self.load_source()
         
         # Apply sample size if specified
         if self.sample_size and len(source_df) > self.sample_size:
             logger.info(f"Using sample size: {self.sample_size} rows")
             source_df = source_df.head(self.sample_size)
+        total_rows = len(source_df)
+        
+        # Drop completely empty source rows with one frame-wide check, recording
+        # each as a validation error (row numbers count data rows from 1)
+        source_df = source_df.reset_index(drop=True)
+        valid_rows, source_errors = self.validator.validate_source_frame(source_df)
+        if not valid_rows.all():
+            for idx, row_errors in source_errors.items():
+                error = {
+                    'row_number': idx + 1,
+                    'type': 'validation_error',
+                    'errors': row_errors
+                }
+                errors.append(error)
+                self._report_error(error)
+            self.stats['failed_rows'] += len(source_errors)
+            logger.warning(f"Skipping {len(source_errors)} completely empty source rows")
+            source_df = source_df[valid_rows]
         
         # Load Shopify template to get column structure
         template_df = self.load_shopify_template()
         shopify_columns = list(template_df.columns)
         
+        # Template columns the product loop writes to, resolved once instead of
+        # searching shopify_columns again for every product and variant
+        shopify_column_set = frozenset(shopify_columns)
+        desc_col = next((col for col in ['Description', 'Body (HTML)'] if col in shopify_column_set), None)
+        # If no image column is in the template, add it anyway (Shopify needs it)
+        image_col = next((col for col in ['Product image URL', 'Image Src'] if col in shopify_column_set), 'Product image URL')
+        product_category_col = next(
+            (col for col in shopify_columns if 'Product category' in col or ('category' in col.lower() and 'Product' in col)),
+            None
+        )
+        inventory_col = next(
+            (col for col in shopify_columns if 'Inventory quantity' in col or ('Inventory' in col and 'quantity' in col.lower())),
+            None
+        )
+        inventory_cols = [
+            col for col in shopify_columns
+            if 'Inventory quantity' in col or ('Inventory' in col and 'quantity' in col.lower() and 'tracker' not in col.lower())
+        ]
+        tracker_col = next(
+            (col for col in shopify_columns if 'Inventory tracker' in col or ('Inventory' in col and 'tracker' in col.lower())),
+            None
+        )
+        option1_value_cols = [col for col in shopify_columns if col in ('Option1 value', 'Option1 Value')]
+        # Last Option1 value/name column wins, as Shopify templates only carry one of each
+        option1_value_col = None
+        option1_name_col = None
+        for col in shopify_columns:
+            col_lower = col.lower()
+            if 'option1' in col_lower:
+                if 'value' in col_lower:
+                    option1_value_col = col
+                elif 'name' in col_lower:
+                    option1_name_col = col
+        
         # Get required fields from mapper
         required_fields = self.mapper.get_required_fields()
         self.validator.required_fields = required_fields
         
         # Group products by base name for variant handling
         logger.info("Grouping products by base name/parent for variant handling...")
-        source_df['BaseName'] = source_df['Name'].apply(normalize_product_name)
-        source_df['ProductGroupID'] = source_df.apply(determine_product_group_id, axis=1)
+        # Normalize each distinct name once and resolve group ids with column
+        # operations, rather than building a Series per row with apply(axis=1)
+        names = source_df['Name']
+        base_names = {name: normalize_product_name(name) for name in names.dropna().unique()}
+        source_df['BaseName'] = names.map(base_names).fillna('')
+        source_df['ProductGroupID'] = determine_product_group_ids(source_df)
+        
+        # Positional index so each row's dict can be looked up by label; rows are
+        # converted to dicts once here instead of through iterrows() per group
+        source_df = source_df.reset_index(drop=True)
+        source_records = source_df.to_dict('records')
+        
+        # Variant rows are mapped and transformed exactly as read, so do every row
+        # up front with column operations; parents are still handled per group
+        # because their Name, Images and Description are rewritten first
+        transformed_records = frame_records(
+            self.transformer.transform_frame(self.mapper.map_frame(source_df))
+        )
         
         # Process products grouped by base name
         shopify_rows = []
-        errors = []
         
         logger.info(f"Processing {len(source_df)} rows, grouped into products...")
         
@@ -383,8 +785,14 @@ class MigrationOrchestrator:
         # Even if they have identical names, they should be variants if they have different SKUs or other attributes
         grouped = source_df.groupby('ProductGroupID')
         
-        for group_id, group_df in tqdm(grouped, total=len(grouped), desc="Migrating"):
+        # Redraw the progress bar at most ~200 times and twice a second, not per group
+        progress = tqdm(
+            grouped, total=len(grouped), desc="Migrating",
+            miniters=max(1, len(grouped) // 200), mininterval=0.5
+        )
+        for group_id, group_df in progress:
             try:
+                group_rows = [(idx, source_records[idx]) for idx in group_df.index]
                 base_name = ""
                 if 'BaseName' in group_df.columns:
                     base_name = str(group_df['BaseName'].iloc[0]).strip()
@@ -394,7 +802,7 @@ class MigrationOrchestrator:
                 # CRITICAL FIX: If multiple rows have the same exact Name (not just base name),
                 # they MUST be variants of the same product, not separate products
                 # Find parent product (Type='variable' or has no price/variant info)
-                parent_row = None
+                parent_idx, parent_row = None, None
                 variants = []
                 
                 # IMPROVED VARIANT DETECTION LOGIC
@@ -408,56 +816,56 @@ class MigrationOrchestrator:
                 if len(group_df) > 1:
                     # Multiple rows with same base name = likely variants
                     # Find parent: prefer row with image, then row with Type='variable', then first row
-                    for idx, row in group_df.iterrows():
+                    for idx, row in group_rows:
                         row_image = row.get('Images', '')
-                        has_image = pd.notna(row_image) and str(row_image).strip() != '' and str(row_image).strip() != 'nan'
+                        has_image = not _missing(row_image)
                         row_type = str(row.get('Type', '')).lower()
                         has_price = pd.notna(row.get('Regular price')) and str(row.get('Regular price', '')).strip()
                         
                         # Priority 1: Row with image and Type='variable' or no price
                         if has_image and (row_type == 'variable' or not has_price) and parent_row is None:
-                            parent_row = row
+                            parent_idx, parent_row = idx, row
                         # Priority 2: Row with image
                         elif has_image and parent_row is None:
-                            parent_row = row
+                            parent_idx, parent_row = idx, row
                         # Priority 3: Row with Type='variable' and no price
                         elif row_type == 'variable' and not has_price and parent_row is None:
-                            parent_row = row
+                            parent_idx, parent_row = idx, row
                     
                     # If no parent found yet, use first row
                     if parent_row is None:
-                        parent_row = group_df.iloc[0]
+                        parent_idx, parent_row = group_rows[0]
                     
                     # All other rows are variants
-                    variants = [(idx, row) for idx, row in group_df.iterrows() if idx != parent_row.name]
+                    variants = [(idx, row) for idx, row in group_rows if idx != parent_idx]
                     
                     # If only one row, it's a single product (no variants)
                     if len(group_df) == 1:
                         # Single row = single product
-                        parent_row = group_df.iloc[0]
+                        parent_idx, parent_row = group_rows[0]
                         variants = []
                 
                 if parent_row is None:
                     continue
                 
                 # Process parent product
-                parent_dict = parent_row.to_dict()
+                parent_dict = dict(parent_row)
                 parent_dict['Name'] = base_name  # Use base name for parent
                 
                 # CRITICAL: Ensure parent has images - preserve from source row
                 # Check if parent row has Images field and preserve it
                 parent_images_source = parent_row.get('Images', '')
                 # Also check all rows in group for images (in case parent row doesn't have it)
-                if not parent_images_source or pd.isna(parent_images_source) or str(parent_images_source).strip() == '' or str(parent_images_source).strip().lower() == 'nan':
+                if _missing(parent_images_source):
                     # Try to get images from any row in the group
-                    for _, check_row in group_df.iterrows():
+                    for _, check_row in group_rows:
                         check_images = check_row.get('Images', '')
-                        if check_images and pd.notna(check_images) and str(check_images).strip() != '' and str(check_images).strip().lower() != 'nan':
+                        if not _missing(check_images):
                             parent_images_source = str(check_images).strip()
                             break
                 
-                if parent_images_source and pd.notna(parent_images_source) and str(parent_images_source).strip() != '' and str(parent_images_source).strip().lower() != 'nan':
-                    # Ensure Images field is in parent_dict (it should be from to_dict(), but make sure)
+                if not _missing(parent_images_source):
+                    # Ensure Images field is in parent_dict (it should be from the source row, but make sure)
                     parent_dict['Images'] = str(parent_images_source).strip()
                     logger.debug(f"Preserved images for parent: {base_name} - {str(parent_images_source)[:50]}...")
                 
@@ -484,7 +892,7 @@ class MigrationOrchestrator:
                 # CRITICAL: Double-check that images were mapped - if not, add them directly
                 if 'Product image URL' not in mapped_parent or not mapped_parent.get('Product image URL') or pd.isna(mapped_parent.get('Product image URL')):
                     # Images weren't mapped, add them directly
-                    if parent_images_source and pd.notna(parent_images_source) and str(parent_images_source).strip() != '' and str(parent_images_source).strip().lower() != 'nan':
+                    if not _missing(parent_images_source):
                         mapped_parent['Product image URL'] = str(parent_images_source).strip()
                         logger.debug(f"Directly added images to parent product: {base_name}")
                 
@@ -499,28 +907,26 @@ class MigrationOrchestrator:
                 parent_image_str = transformed_parent.get('Product image URL', '')
                 
                 # CRITICAL: If images were lost during transformation, restore them from source
-                if not parent_image_str or pd.isna(parent_image_str) or str(parent_image_str).strip() == '' or str(parent_image_str).strip().lower() == 'nan':
+                if _missing(parent_image_str):
                     # Try to restore from parent_images_source (we saved it earlier)
-                    if parent_images_source and pd.notna(parent_images_source) and str(parent_images_source).strip() != '' and str(parent_images_source).strip().lower() != 'nan':
+                    if not _missing(parent_images_source):
                         parent_image_str = str(parent_images_source).strip()
                         transformed_parent['Product image URL'] = parent_image_str
                         logger.debug(f"Restored images after transformation for: {base_name}")
                 
                 # If still no image, try to get from variants
-                if not parent_image_str or pd.isna(parent_image_str) or str(parent_image_str).strip() == '' or str(parent_image_str).strip().lower() == 'nan':
-                    for _, variant_row in variants:
-                        variant_dict = variant_row.to_dict()
-                        variant_mapped = self.mapper.map_row(variant_dict)
-                        variant_transformed = self.transformer.transform_row(variant_mapped)
+                if _missing(parent_image_str):
+                    for variant_idx, _ in variants:
+                        variant_transformed = transformed_records[variant_idx]
                         variant_image = variant_transformed.get('Product image URL', '')
-                        if variant_image and pd.notna(variant_image) and str(variant_image).strip() and str(variant_image).strip().lower() != 'nan':
+                        if not _missing(variant_image):
                             parent_image_str = variant_image
                             transformed_parent['Product image URL'] = parent_image_str
                             break
                 
                 # Parse multiple images (comma-separated)
                 parent_images = []
-                if parent_image_str and pd.notna(parent_image_str) and str(parent_image_str).strip() != '':
+                if not _missing(parent_image_str):
                     # Split by comma and clean up
                     image_urls = [url.strip() for url in str(parent_image_str).split(',') if url.strip()]
                     parent_images = [url for url in image_urls if url and url != 'nan']
@@ -528,12 +934,10 @@ class MigrationOrchestrator:
                 # FIX: If parent has no image, try to get from variants (don't skip entire product group)
                 if not parent_images:
                     # Try to get image from variants
-                    for _, variant_row in variants:
-                        variant_dict = variant_row.to_dict()
-                        variant_mapped = self.mapper.map_row(variant_dict)
-                        variant_transformed = self.transformer.transform_row(variant_mapped)
+                    for variant_idx, _ in variants:
+                        variant_transformed = transformed_records[variant_idx]
                         variant_image = variant_transformed.get('Product image URL', '')
-                        if variant_image and pd.notna(variant_image) and str(variant_image).strip() != '':
+                        if not _missing(variant_image):
                             # Split by comma and clean up
                             image_urls = [url.strip() for url in str(variant_image).split(',') if url.strip()]
                             parent_images = [url for url in image_urls if url and url != 'nan']
@@ -552,60 +956,32 @@ class MigrationOrchestrator:
                     handle = self.transformer._transform_handle(base_name) if base_name else ""
                 
                 # Create parent row (first row with full info) - use first image
-                parent_shopify_row = {}
-                for col in shopify_columns:
-                    if col in transformed_parent:
-                        parent_shopify_row[col] = transformed_parent[col]
-                    else:
-                        # CRITICAL: Check for description field mapping
-                        # Transformer may create "Body (HTML)" or "Description" depending on field name
-                        # Template may have "Description" or "Body (HTML)" - map between them
-                        if col == 'Description':
-                            # Template has "Description", check if transformer created "Body (HTML)"
-                            if 'Body (HTML)' in transformed_parent:
-                                parent_shopify_row[col] = transformed_parent['Body (HTML)']
-                            elif 'Description' in transformed_parent:
-                                parent_shopify_row[col] = transformed_parent['Description']
-                            else:
-                                parent_shopify_row[col] = ""
-                        elif col == 'Body (HTML)':
-                            # Template has "Body (HTML)", check if transformer created "Description"
-                            if 'Description' in transformed_parent:
-                                parent_shopify_row[col] = transformed_parent['Description']
-                            elif 'Body (HTML)' in transformed_parent:
-                                parent_shopify_row[col] = transformed_parent['Body (HTML)']
-                            else:
-                                parent_shopify_row[col] = ""
-                        else:
-                            # For other columns not in transformed_parent, set empty
-                            parent_shopify_row[col] = ""
+                # Transformer may create "Body (HTML)" or "Description" depending on field name,
+                # and the template may use either; each stands in for the other when missing
+                parent_shopify_row = {
+                    col: transformed_parent[col] if col in transformed_parent
+                    else transformed_parent.get(DESCRIPTION_ALIASES.get(col), "")
+                    for col in shopify_columns
+                }
                 
                 # CRITICAL: Ensure Description/Body (HTML) is set - if still empty, try to get from variants
-                desc_col = None
-                for col in ['Description', 'Body (HTML)']:
-                    if col in shopify_columns:
-                        desc_col = col
-                        break
-                
                 if desc_col and (desc_col not in parent_shopify_row or not parent_shopify_row.get(desc_col) or str(parent_shopify_row.get(desc_col, '')).strip() == ''):
                     # Description is still empty, try to get from variants (check ALL variants, not just first)
-                    for _, variant_row in variants:
-                        variant_dict = variant_row.to_dict()
-                        variant_mapped = self.mapper.map_row(variant_dict)
-                        variant_transformed = self.transformer.transform_row(variant_mapped)
+                    for variant_idx, _ in variants:
+                        variant_transformed = transformed_records[variant_idx]
                         variant_desc = variant_transformed.get('Description') or variant_transformed.get('Body (HTML)', '')
-                        if variant_desc and pd.notna(variant_desc) and str(variant_desc).strip() != '' and str(variant_desc).strip().lower() != 'nan':
+                        if not _missing(variant_desc):
                             parent_shopify_row[desc_col] = str(variant_desc).strip()
                             break
                     # If still empty after checking variants, try to get from group_df (all rows in group)
                     if desc_col not in parent_shopify_row or not parent_shopify_row.get(desc_col) or str(parent_shopify_row.get(desc_col, '')).strip() == '':
-                        for idx, row in group_df.iterrows():
-                            if idx == parent_row.name:
+                        for idx, row in group_rows:
+                            if idx == parent_idx:
                                 continue
                             row_desc = row.get('Description', '')
                             row_short_desc = row.get('Short description', '')
-                            if row_desc and pd.notna(row_desc) and str(row_desc).strip() != '' and str(row_desc).strip().lower() != 'nan':
-                                parent_dict_temp = row.to_dict()
+                            if not _missing(row_desc):
+                                parent_dict_temp = dict(row)
                                 parent_dict_temp['Name'] = base_name
                                 mapped_temp = self.mapper.map_row(parent_dict_temp)
                                 transformed_temp = self.transformer.transform_row(mapped_temp)
@@ -613,8 +989,8 @@ class MigrationOrchestrator:
                                 if temp_desc and pd.notna(temp_desc) and str(temp_desc).strip() != '':
                                     parent_shopify_row[desc_col] = str(temp_desc).strip()
                                     break
-                            elif row_short_desc and pd.notna(row_short_desc) and str(row_short_desc).strip() != '' and str(row_short_desc).strip().lower() != 'nan':
-                                parent_dict_temp = row.to_dict()
+                            elif not _missing(row_short_desc):
+                                parent_dict_temp = dict(row)
                                 parent_dict_temp['Name'] = base_name
                                 mapped_temp = self.mapper.map_row(parent_dict_temp)
                                 transformed_temp = self.transformer.transform_row(mapped_temp)
@@ -628,17 +1004,7 @@ class MigrationOrchestrator:
                 
                 # Set first image for parent row (if available)
                 # CRITICAL: Ensure Product image URL column exists in parent_shopify_row
-                # Check both 'Product image URL' and 'Image Src' (template might use either)
-                image_col = None
-                for col in ['Product image URL', 'Image Src']:
-                    if col in shopify_columns:
-                        image_col = col
-                        break
-                
-                # If column not found in shopify_columns, add it anyway (Shopify needs it)
-                if not image_col:
-                    image_col = 'Product image URL'
-                
+                # Template might use 'Product image URL' or 'Image Src' (image_col, resolved before the loop)
                 # Set the image value
                 if parent_images:
                     parent_shopify_row[image_col] = parent_images[0]
@@ -652,13 +1018,6 @@ class MigrationOrchestrator:
                 default_cat = getattr(self.transformer, 'default_category', '')
                 fallback_strategy = getattr(self.transformer, 'fallback_strategy', 'clear')
                 
-                # Find the Product category column name
-                product_category_col = None
-                for col in shopify_columns:
-                    if 'Product category' in col or ('category' in col.lower() and 'Product' in col):
-                        product_category_col = col
-                        break
-                
                 # Ensure Product category field exists and has a value
                 if product_category_col:
                     category_value = parent_shopify_row.get(product_category_col, '')
@@ -734,18 +1093,12 @@ class MigrationOrchestrator:
                             inventory_value = "10"
                     
                     # Set inventory quantity in all possible column names
-                    for col in shopify_columns:
-                        if 'Inventory quantity' in col or ('Inventory' in col and 'quantity' in col.lower() and 'tracker' not in col.lower()):
-                            if col in parent_shopify_row:
-                                parent_shopify_row[col] = inventory_value
+                    for col in inventory_cols:
+                        parent_shopify_row[col] = inventory_value
                     
                     # CRITICAL: Set inventory tracker to "shopify" for single products with inventory
-                    if inventory_value and str(inventory_value).strip() != '' and str(inventory_value).strip() != '0':
-                        for col in shopify_columns:
-                            if 'Inventory tracker' in col or ('Inventory' in col and 'tracker' in col.lower()):
-                                if col in parent_shopify_row:
-                                    parent_shopify_row[col] = "shopify"
-                                    break
+                    if tracker_col and inventory_value and str(inventory_value).strip() != '' and str(inventory_value).strip() != '0':
+                        parent_shopify_row[tracker_col] = "shopify"
                     
                     # CRITICAL: Set fulfillment service for single products (Shopify requirement)
                     # Shopify does not allow blank fulfillment service
@@ -778,7 +1131,7 @@ class MigrationOrchestrator:
                         if price_field in parent_shopify_row:
                             price_val = parent_shopify_row[price_field]
                             # Check if price is not empty, not NaN, and not 'nan' string
-                            if price_val is not None and pd.notna(price_val) and str(price_val).strip() != '' and str(price_val).strip().lower() != 'nan':
+                            if not _missing(price_val):
                                 try:
                                     price_float = float(str(price_val).replace('₹', '').replace(',', '').replace('$', '').strip())
                                     if price_float > 0:
@@ -793,7 +1146,7 @@ class MigrationOrchestrator:
                         for price_field in price_fields_to_check:
                             if price_field in transformed_parent:
                                 price_val = transformed_parent[price_field]
-                                if price_val is not None and pd.notna(price_val) and str(price_val).strip() != '' and str(price_val).strip().lower() != 'nan':
+                                if not _missing(price_val):
                                     try:
                                         price_float = float(str(price_val).replace('₹', '').replace(',', '').replace('$', '').strip())
                                         if price_float > 0:
@@ -838,9 +1191,8 @@ class MigrationOrchestrator:
                     # CRITICAL: Parent should NOT have Option1 Value (that's only for variants)
                     # If parent has Option1 Value, Shopify creates a "Default" variant
                     # Explicitly set to empty string to avoid NaN issues
-                    for col in shopify_columns:
-                        if col == 'Option1 value' or col == 'Option1 Value':
-                            parent_shopify_row[col] = ""
+                    for col in option1_value_cols:
+                        parent_shopify_row[col] = ""
                     # Also check transformed_parent in case it was set there
                     if 'Option1 value' in transformed_parent:
                         parent_shopify_row['Option1 value'] = ""
@@ -868,8 +1220,6 @@ class MigrationOrchestrator:
                 parent_image_first = parent_images[0] if parent_images else ""
                 
                 for variant_idx, variant_row in variants:
-                    variant_dict = variant_row.to_dict()
-                    
                     # Skip if this is actually the parent product (Type='variable' and no price)
                     variant_type = str(variant_row.get('Type', '')).lower()
                     variant_has_price = pd.notna(variant_row.get('Regular price')) and str(variant_row.get('Regular price', '')).strip()
@@ -877,16 +1227,13 @@ class MigrationOrchestrator:
                     if variant_type == 'variable' and not variant_has_price:
                         continue  # Skip parent product, don't create a "Default" variant
                     
-                    # Map variant fields
-                    mapped_variant = self.mapper.map_row(variant_dict)
-                    
-                    # Transform variant
-                    transformed_variant = self.transformer.transform_row(mapped_variant)
+                    # Mapped and transformed up front
+                    transformed_variant = transformed_records[variant_idx]
                     
                     # Handle variant images - parse multiple images
                     variant_image_str = transformed_variant.get('Product image URL', '')
                     variant_images = []
-                    if variant_image_str and pd.notna(variant_image_str) and str(variant_image_str).strip() != '':
+                    if not _missing(variant_image_str):
                         # Split by comma and clean up
                         image_urls = [url.strip() for url in str(variant_image_str).split(',') if url.strip()]
                         variant_images = [url for url in image_urls if url and url != 'nan']
@@ -952,39 +1299,15 @@ class MigrationOrchestrator:
                             # Fallback: use base name with variant indicator
                             variant_title = base_name
                     
-                    variant_shopify_row = {}
-                    # Find Option1 columns first
-                    option1_value_col = None
-                    option1_name_col = None
-                    for col in shopify_columns:
-                        col_lower = col.lower()
-                        if 'option1' in col_lower:
-                            if 'value' in col_lower:
-                                option1_value_col = col
-                            elif 'name' in col_lower:
-                                option1_name_col = col
-                    
                     # Build variant row
                     # CRITICAL: In Shopify CSV format, variant rows should have EMPTY Title field
                     # Only the parent row should have a Title
                     # Variant rows are identified by: same Handle + Option1 Value set
-                    for col in shopify_columns:
-                        if col == 'Title':
-                            # CRITICAL: Variant rows MUST have empty Title (not "Product Name - Variant")
-                            # Shopify uses Handle + Option1 Value to identify variants
-                            variant_shopify_row[col] = ""  # Empty Title for variants
-                        elif col == 'URL handle':
-                            variant_shopify_row[col] = handle  # Same handle as parent
-                        elif col == option1_value_col:
-                            # Set Option1 Value using the exact column name
-                            variant_shopify_row[col] = variant_option if variant_option else ""
-                        elif col == option1_name_col:
-                            # Set Option1 Name using the exact column name (same as parent)
-                            variant_shopify_row[col] = 'Size' if variant_option else ""
-                        elif col in transformed_variant:
-                            variant_shopify_row[col] = transformed_variant[col]
-                        else:
-                            variant_shopify_row[col] = ""
+                    variant_overrides = {'Title': "", 'URL handle': handle}
+                    variant_shopify_row = {
+                        col: variant_overrides[col] if col in variant_overrides else transformed_variant.get(col, "")
+                        for col in shopify_columns
+                    }
                     
                     # CRITICAL: Force set Option1 values (ensure they're always set)
                     if option1_value_col:
@@ -1029,14 +1352,8 @@ class MigrationOrchestrator:
                     if isinstance(in_stock, str):
                         in_stock_val = 1 if in_stock.strip() == '1' else 0
                     
-                    # Find the inventory quantity column in shopify_columns (before mapping)
-                    inventory_col = None
-                    for col in shopify_columns:
-                        if 'Inventory quantity' in col or ('Inventory' in col and 'quantity' in col.lower()):
-                            inventory_col = col
-                            break
-                    
-                    if inventory_col and inventory_col in variant_shopify_row:
+                    # inventory_col is the template's inventory quantity column (before mapping)
+                    if inventory_col:
                         # Use actual Stock value from source data
                         inventory_value = "100"  # Default when in stock
                         
@@ -1064,25 +1381,9 @@ class MigrationOrchestrator:
                         variant_shopify_row[inventory_col] = inventory_value
                         
                         # CRITICAL: When inventory quantity is set, ensure inventory tracker is "shopify"
-                        # Find inventory tracker column
-                        tracker_col = None
-                        for col in shopify_columns:
-                            if 'Inventory tracker' in col or ('Inventory' in col and 'tracker' in col.lower()):
-                                tracker_col = col
-                                break
-                        
-                        if tracker_col and tracker_col in variant_shopify_row:
+                        if tracker_col:
                             # Set to "shopify" to track inventory
                             variant_shopify_row[tracker_col] = "shopify"
-                        
-                        # DOUBLE CHECK: Ensure inventory tracker is "shopify" if inventory quantity is set
-                        # Check all possible tracker column names
-                        for col in shopify_columns:
-                            if 'Inventory tracker' in col or ('Inventory' in col and 'tracker' in col.lower()):
-                                if col in variant_shopify_row:
-                                    if inventory_value and str(inventory_value).strip() != '' and str(inventory_value).strip() != '0':
-                                        variant_shopify_row[col] = "shopify"
-                                    break
                     
                     # ALLOW variants without prices - set default minimum price (0.01)
                     variant_price = self._extract_source_price(variant_row)
@@ -1123,16 +1424,23 @@ class MigrationOrchestrator:
                 
             except Exception as e:
                 logger.error(f"Error processing product group '{base_name}': {e}")
-                errors.append({
+                error = {
                     'row_number': 'group',
                     'type': 'processing_error',
-                    'error': str(e),
-                    'row_data': {'base_name': base_name}
-                })
+                    'error': str(e)
+                }
+                errors.append(error)
+                self._report_error(error)
                 self.stats['failed_rows'] += len(group_df)
                 if not self._should_continue_on_error():
                     break
         
+        # Source rows are not read after the group loop. Keep a zero-column frame
+        # for the row count in the validation report and let the source data go
+        # before the output frame is built and post-processed
+        source_df = source_df[[]]
+        source_records = transformed_records = grouped = None
+        
         # ALLOW all products - ensure single products without prices get default price
         # This is a final safety check - do it AFTER all rows are collected
         # First, build a map of handles to see which products have variants
@@ -1165,7 +1473,7 @@ class MigrationOrchestrator:
                     price = None
                     for price_field in ['Price', 'Variant Price', 'Regular price']:
                         price_val = row.get(price_field, '')
-                        if price_val and pd.notna(price_val) and str(price_val).strip() != '' and str(price_val).strip().lower() != 'nan':
+                        if not _missing(price_val):
                             try:
                                 price_float = float(str(price_val).replace('₹', '').replace(',', '').replace('$', '').strip())
                                 if price_float > 0:
@@ -1187,52 +1495,41 @@ class MigrationOrchestrator:
         
         # Create output DataFrame
         if shopify_rows:
-            # Ensure all rows have all columns (fill missing with empty string to avoid NaN)
-            for row in shopify_rows:
-                for col in shopify_columns:
-                    if col not in row:
-                        row[col] = ""
-                    # Convert None to empty string
-                    if row[col] is None:
-                        row[col] = ""
-            
-            shopify_df = pd.DataFrame(shopify_rows, columns=shopify_columns)
+            # Gather one list per template column (missing and None become empty
+            # strings) so the frame is built column-wise rather than transposed
+            # from a list of row dicts
+            output_columns = {}
+            for col in shopify_columns:
+                values = [row.get(col, "") for row in shopify_rows]
+                output_columns[col] = ["" if value is None else value for value in values]
             
-            # Map template column names to Shopify's actual accepted column names
-            # The template uses different names than what Shopify import accepts
-            column_mapping = {
-                'URL handle': 'Handle',
-                'Description': 'Body (HTML)',
-                'Published on online store': 'Published',
-                'SKU': 'Variant SKU',
-                'Price': 'Variant Price',
-                'Compare-at price': 'Variant Compare At Price',
-                'Product image URL': 'Image Src',
-                'Option1 name': 'Option1 Name',
-                'Option1 value': 'Option1 Value',
-                'Option2 name': 'Option2 Name',
-                'Option2 value': 'Option2 Value',
-                'Option3 name': 'Option3 Name',
-                'Option3 value': 'Option3 Value',
-                'Inventory tracker': 'Variant Inventory Tracker',
-                'Inventory quantity': 'Variant Inventory Qty',
-                'Continue selling when out of stock': 'Variant Inventory Policy',
-                'Fulfillment service': 'Variant Fulfillment Service',
-                'Weight value (grams)': 'Variant Grams',
-                'Requires shipping': 'Variant Requires Shipping',
-                'Charge tax': 'Variant Taxable',
-                'Image alt text': 'Image Alt Text',
-                'Variant image URL': 'Variant Image',
-                'SEO title': 'SEO Title',
-                'SEO description': 'SEO Description'
-            }
+            shopify_df = pd.DataFrame(output_columns, columns=shopify_columns)
+            output_columns = None
+            shopify_rows.clear()
             
             # Apply column mapping (only rename columns that exist)
-            rename_dict = {old: new for old, new in column_mapping.items() if old in shopify_df.columns}
+            column_set = set(shopify_df.columns)
+            rename_dict = {old: new for old, new in COLUMN_MAPPING.items() if old in column_set}
             if rename_dict:
                 shopify_df = shopify_df.rename(columns=rename_dict)
                 logger.info(f"Renamed {len(rename_dict)} columns to Shopify standard format")
             
+            # Shopify only accepts specific columns - remove columns that Shopify doesn't recognize
+            # Done straight after the rename so the fixes below only work on columns that are written
+            
+            # Keep only columns that exist in the dataframe and are accepted by Shopify
+            column_set = set(shopify_df.columns)
+            columns_to_keep = [col for col in SHOPIFY_ACCEPTED_COLUMNS if col in column_set]
+            
+            # Also keep any columns that start with "Google Shopping" as they might be accepted
+            google_shopping_cols = [col for col in shopify_df.columns if col.startswith('Google Shopping')]
+            columns_to_keep.extend(google_shopping_cols)
+            
+            # Select only the accepted columns
+            removed_count = len(shopify_df.columns) - len(columns_to_keep)
+            shopify_df = shopify_df[columns_to_keep]
+            logger.info(f"Filtered to {len(columns_to_keep)} Shopify-accepted columns (removed {removed_count} unrecognized columns)")
+            
             # CRITICAL FIX: After column mapping, ensure parent rows WITH VARIANTS have ALL variant fields EMPTY
             # This prevents Shopify from creating "Default Title" variant with $0.00
             # Single products (no variants) MUST keep variant fields populated
@@ -1246,21 +1543,24 @@ class MigrationOrchestrator:
                 # But Option1 Value MUST be empty for parent
             ]
             
-            for idx, row in shopify_df.iterrows():
+            # Row counts per handle and per (handle, title), built once instead of
+            # rescanning the whole frame for every parent row
+            if 'Handle' in shopify_df.columns:
+                handle_counts = shopify_df['Handle'].value_counts().to_dict()
+                handle_title_counts = shopify_df.groupby(['Handle', 'Title']).size().to_dict()
+            
+            for idx, row in _iter_rows(shopify_df):
                 # Check if this is a parent row (has Title)
                 if pd.notna(row.get('Title')) and str(row.get('Title', '')).strip() != '':
                     # Check if this parent has variants (if no variants, it's a single product and should keep variant fields)
                     handle = row.get('Handle', '')
                     if handle:
-                        # Check if there are variant rows for this handle
-                        # Variant rows are those with same Handle but different Title (or empty Title)
-                        variant_rows = shopify_df[(shopify_df['Handle'] == handle) & 
-                                                  (shopify_df.index != idx) &  # Exclude current row
-                                                  ((shopify_df['Title'].isna()) | (shopify_df['Title'] == '') | 
-                                                   (shopify_df['Title'] != row.get('Title')))]
+                        # Variant rows are those with same Handle but different Title (or empty Title):
+                        # every row under the handle minus those sharing this row's title
+                        other_titles = handle_counts.get(handle, 0) - handle_title_counts.get((handle, row.get('Title')), 0)
                         
                         # Only clear variant fields if this parent HAS variants
-                        if len(variant_rows) > 0:
+                        if other_titles > 0:
                             # CRITICAL: Clear ALL variant-specific fields from parent WITH VARIANTS
                             # If ANY variant field is populated, Shopify creates a "Default" variant
                             for field in variant_field_names:
@@ -1285,54 +1585,42 @@ class MigrationOrchestrator:
             shopify_df = shopify_df.fillna('')
             shopify_df = shopify_df.replace('nan', '')
             
+            # Handles that own variant rows (empty Title). The fixes below never change
+            # Title or Handle, so this set replaces a per-row scan of the whole frame
+            variant_handles = set()
+            if 'Handle' in shopify_df.columns and 'Title' in shopify_df.columns:
+                variant_handles = set(shopify_df.loc[shopify_df['Title'] == '', 'Handle'])
+            
             # CRITICAL FIXES: Ensure all data quality issues are resolved
             
             # 1. CRITICAL FIX: Ensure all rows with inventory quantity have inventory tracker set to "shopify"
             if 'Variant Inventory Qty' in shopify_df.columns and 'Variant Inventory Tracker' in shopify_df.columns:
-                rows_fixed = 0
-                for idx, row in shopify_df.iterrows():
-                    inventory_qty = row.get('Variant Inventory Qty', '')
-                    inventory_tracker = row.get('Variant Inventory Tracker', '')
-                    
-                    # If inventory quantity is set (not empty and not zero), ensure tracker is "shopify"
-                    if inventory_qty and str(inventory_qty).strip() != '' and str(inventory_qty).strip() != 'nan' and str(inventory_qty).strip() != '0':
-                        try:
-                            qty_val = float(str(inventory_qty).strip())
-                            if qty_val > 0:
-                                # Inventory is tracked, so tracker must be "shopify"
-                                if not inventory_tracker or str(inventory_tracker).strip().lower() != 'shopify':
-                                    shopify_df.at[idx, 'Variant Inventory Tracker'] = "shopify"
-                                    rows_fixed += 1
-                        except:
-                            # If we can't parse, but it's not empty, set to shopify
-                            if str(inventory_qty).strip() != '' and str(inventory_qty).strip() != 'nan':
-                                shopify_df.at[idx, 'Variant Inventory Tracker'] = "shopify"
-                                rows_fixed += 1
+                rows_fixed = fix_inventory_tracker(shopify_df)
                 
                 if rows_fixed > 0:
                     logger.info(f"Fixed {rows_fixed} rows with inventory tracker set to 'shopify'")
             
             # 2. Ensure variants have parent images if they don't have their own
             if 'Variant Image' in shopify_df.columns and 'Image Src' in shopify_df.columns:
-                # Group by Handle to find parent-child relationships
-                for handle in shopify_df['Handle'].unique():
-                    handle_rows = shopify_df[shopify_df['Handle'] == handle]
-                    parent_row = handle_rows[handle_rows['Title'].notna() & (handle_rows['Title'] != '')]
-                    variant_rows = handle_rows[handle_rows['Title'].isna() | (handle_rows['Title'] == '')]
-                    
-                    if len(parent_row) > 0 and len(variant_rows) > 0:
-                        parent_image = parent_row.iloc[0].get('Image Src', '')
-                        if parent_image and str(parent_image).strip() != '' and str(parent_image).strip() != 'nan':
-                            # Update variants that don't have Variant Image
-                            for idx in variant_rows.index:
-                                variant_image = shopify_df.at[idx, 'Variant Image']
-                                if not variant_image or str(variant_image).strip() == '' or str(variant_image).strip() == 'nan':
-                                    shopify_df.at[idx, 'Variant Image'] = str(parent_image).strip()
+                # First titled (parent) row's image per handle, applied to blank-title
+                # rows with no Variant Image in one masked assignment
+                is_variant_row = shopify_df['Title'] == ''
+                parent_image = (
+                    shopify_df.loc[~is_variant_row].groupby('Handle', sort=False)['Image Src'].first()
+                    .astype(str).str.strip()
+                )
+                parent_image = parent_image[(parent_image != '') & (parent_image != 'nan')]
+                variant_image = shopify_df['Variant Image'].astype(str).str.strip()
+                needs_image = (
+                    is_variant_row & ((variant_image == '') | (variant_image == 'nan')) &
+                    shopify_df['Handle'].isin(parent_image.index)
+                )
+                shopify_df.loc[needs_image, 'Variant Image'] = shopify_df.loc[needs_image, 'Handle'].map(parent_image)
             
             # 3. ALLOW rows with zero/missing prices - set default minimum price (0.01) instead of removing
             if 'Variant Price' in shopify_df.columns:
                 rows_fixed = 0
-                for idx, row in shopify_df.iterrows():
+                for idx, row in _iter_rows(shopify_df):
                     variant_price = row.get('Variant Price', '')
                     # Only process rows that need price (variants and single products, not parent rows with variants)
                     is_variant = pd.isna(row.get('Title')) or str(row.get('Title', '')).strip() == ''
@@ -1340,10 +1628,7 @@ class MigrationOrchestrator:
                     
                     # Check if this is a parent row with variants (should not have Variant Price)
                     if not is_variant and handle:
-                        variant_rows = shopify_df[(shopify_df['Handle'] == handle) & 
-                                                  (shopify_df.index != idx) &
-                                                  (shopify_df['Title'].isna() | (shopify_df['Title'] == ''))]
-                        if len(variant_rows) > 0:
+                        if handle in variant_handles:
                             continue  # Skip parent rows with variants
                     
                     # For variants and single products, ensure they have a price
@@ -1368,56 +1653,7 @@ class MigrationOrchestrator:
             # Variant rows (empty Title) MUST have Option1 Value set
             # For image rows, copy Option1 Value from parent variant instead of generating defaults
             if 'Option1 Value' in shopify_df.columns and 'Title' in shopify_df.columns and 'Handle' in shopify_df.columns:
-                option1_fixes = 0
-                for idx, row in shopify_df.iterrows():
-                    title = row.get('Title', '')
-                    option1_val = row.get('Option1 Value', '')
-                    handle = row.get('Handle', '')
-                    
-                    # Check if this is a variant row (empty Title)
-                    is_variant_row = pd.isna(title) or str(title).strip() == ''
-                    
-                    if is_variant_row:
-                        # This is a variant row - it MUST have Option1 Value
-                        if pd.isna(option1_val) or str(option1_val).strip() == '' or str(option1_val).strip().lower() == 'nan':
-                            # First, try to get Option1 Value from another variant with the same handle
-                            option1_found = False
-                            if handle and pd.notna(handle) and str(handle).strip() != '':
-                                handle_rows = shopify_df[shopify_df['Handle'] == handle]
-                                # Find variant rows with Option1 Value (excluding current row)
-                                variants_with_option1 = handle_rows[
-                                    (handle_rows.index != idx) &
-                                    (handle_rows['Title'].isna() | (handle_rows['Title'].astype(str).str.strip() == '')) &
-                                    (handle_rows['Option1 Value'].notna()) &
-                                    (handle_rows['Option1 Value'].astype(str).str.strip() != '') &
-                                    (handle_rows['Option1 Value'].astype(str).str.strip().str.lower() != 'nan')
-                                ]
-                                if len(variants_with_option1) > 0:
-                                    # Copy Option1 Value from first parent variant
-                                    parent_option1 = variants_with_option1.iloc[0]['Option1 Value']
-                                    shopify_df.at[idx, 'Option1 Value'] = str(parent_option1).strip()
-                                    option1_found = True
-                                    option1_fixes += 1
-                            
-                            # If still not found, try to extract from Variant SKU
-                            if not option1_found:
-                                variant_sku = row.get('Variant SKU', '')
-                                if variant_sku and pd.notna(variant_sku) and str(variant_sku).strip() != '':
-                                    # Use SKU as Option1 Value if available
-                                    shopify_df.at[idx, 'Option1 Value'] = str(variant_sku).strip()
-                                    option1_fixes += 1
-                                else:
-                                    # Last resort: Generate a default value based on row index
-                                    # But this should rarely happen if image rows are created correctly
-                                    shopify_df.at[idx, 'Option1 Value'] = f"Variant-{idx}"
-                                    option1_fixes += 1
-                                    logger.warning(f"Generated default Option1 Value for row {idx} (Handle: {handle}) - this should be rare")
-                            
-                            # Also set Option1 Name if not set
-                            if 'Option1 Name' in shopify_df.columns:
-                                option1_name = row.get('Option1 Name', '')
-                                if pd.isna(option1_name) or str(option1_name).strip() == '' or str(option1_name).strip().lower() == 'nan':
-                                    shopify_df.at[idx, 'Option1 Name'] = 'Size'
+                option1_fixes = fill_variant_option1(shopify_df)
                 
                 if option1_fixes > 0:
                     logger.info(f"Fixed {option1_fixes} variant/image rows by setting Option1 Value (copied from parent variants or generated)")
@@ -1425,25 +1661,7 @@ class MigrationOrchestrator:
             # 5. FINAL DOUBLE CHECK: Ensure inventory tracker is "shopify" for ALL rows with inventory
             # This includes both single products and variants
             if 'Variant Inventory Qty' in shopify_df.columns and 'Variant Inventory Tracker' in shopify_df.columns:
-                final_fixes = 0
-                for idx, row in shopify_df.iterrows():
-                    inventory_qty = row.get('Variant Inventory Qty', '')
-                    inventory_tracker = row.get('Variant Inventory Tracker', '')
-                    
-                    # Check if inventory quantity is set (not empty and not zero)
-                    if inventory_qty and str(inventory_qty).strip() != '' and str(inventory_qty).strip() != 'nan' and str(inventory_qty).strip() != '0':
-                        try:
-                            qty_val = float(str(inventory_qty).strip())
-                            if qty_val > 0:
-                                # Inventory is set, so tracker must be "shopify"
-                                if not inventory_tracker or str(inventory_tracker).strip().lower() != 'shopify':
-                                    shopify_df.at[idx, 'Variant Inventory Tracker'] = "shopify"
-                                    final_fixes += 1
-                        except:
-                            # If we can't parse but it's not empty, set to shopify
-                            if str(inventory_qty).strip() != '' and str(inventory_qty).strip() != 'nan':
-                                shopify_df.at[idx, 'Variant Inventory Tracker'] = "shopify"
-                                final_fixes += 1
+                final_fixes = fix_inventory_tracker(shopify_df)
                 
                 if final_fixes > 0:
                     logger.info(f"Final check: Fixed {final_fixes} more rows (including single products) with inventory tracker")
@@ -1451,18 +1669,14 @@ class MigrationOrchestrator:
             # 6. CRITICAL: Ensure single products (with Title) have price set
             if 'Variant Price' in shopify_df.columns:
                 single_products_no_price = []
-                for idx, row in shopify_df.iterrows():
+                for idx, row in _iter_rows(shopify_df):
                     # Check single products (rows with Title)
                     if pd.notna(row.get('Title')) and str(row.get('Title', '')).strip() != '':
                         # Check if this product has variants (if no variants, it should have Variant Price)
                         handle = row.get('Handle', '')
                         if handle:
-                            # Check if there are variant rows for this handle
-                            variant_rows = shopify_df[(shopify_df['Handle'] == handle) & 
-                                                      (shopify_df['Title'].isna() | (shopify_df['Title'] == ''))]
-                            
                             # If no variants, this single product MUST have Variant Price
-                            if len(variant_rows) == 0:
+                            if handle not in variant_handles:
                                 variant_price = row.get('Variant Price', '')
                                 if not variant_price or pd.isna(variant_price) or str(variant_price).strip() == '' or str(variant_price).strip() == 'nan':
                                     try:
@@ -1482,35 +1696,17 @@ class MigrationOrchestrator:
             # 7. CRITICAL FIX: Ensure image rows (variant rows without SKU/Option1) inherit prices from their parent variant
             # Image rows are variant rows (no title) that don't have SKU or Option1 Value
             if 'Variant Price' in shopify_df.columns and 'Handle' in shopify_df.columns:
-                image_rows_fixed = 0
-                for handle in shopify_df['Handle'].unique():
-                    handle_rows = shopify_df[shopify_df['Handle'] == handle]
-                    # Find variant rows with prices (these are the actual variants)
-                    variant_rows_with_price = handle_rows[
-                        (handle_rows['Title'].isna() | (handle_rows['Title'] == '')) &
-                        (handle_rows['Variant Price'].notna()) &
-                        (handle_rows['Variant Price'].astype(str).str.strip() != '') &
-                        (handle_rows['Variant Price'].astype(str).str.strip() != 'nan')
-                    ]
-                    
-                    if len(variant_rows_with_price) > 0:
-                        # Get the first variant's price to use for image rows
-                        first_variant_price = variant_rows_with_price.iloc[0]['Variant Price']
-                        
-                        # Find image rows (variant rows without price)
-                        image_rows = handle_rows[
-                            (handle_rows['Title'].isna() | (handle_rows['Title'] == '')) &
-                            (
-                                (handle_rows['Variant Price'].isna()) |
-                                (handle_rows['Variant Price'].astype(str).str.strip() == '') |
-                                (handle_rows['Variant Price'].astype(str).str.strip() == 'nan')
-                            )
-                        ]
-                        
-                        # Set price for image rows from parent variant
-                        for idx in image_rows.index:
-                            shopify_df.at[idx, 'Variant Price'] = first_variant_price
-                            image_rows_fixed += 1
+                # Image rows are blank-title rows without a price; they take the price
+                # of the first priced blank-title row under the same handle
+                is_variant_row = shopify_df['Title'] == ''
+                variant_price = shopify_df['Variant Price'].astype(str).str.strip()
+                has_price = (variant_price != '') & (variant_price != 'nan')
+                first_variant_price = (
+                    shopify_df.loc[is_variant_row & has_price].groupby('Handle', sort=False)['Variant Price'].first()
+                )
+                image_rows = is_variant_row & ~has_price & shopify_df['Handle'].isin(first_variant_price.index)
+                shopify_df.loc[image_rows, 'Variant Price'] = shopify_df.loc[image_rows, 'Handle'].map(first_variant_price)
+                image_rows_fixed = int(image_rows.sum())
                 
                 if image_rows_fixed > 0:
                     logger.info(f"Fixed {image_rows_fixed} image rows by inheriting prices from parent variants")
@@ -1519,17 +1715,14 @@ class MigrationOrchestrator:
             # ALLOW all products - set default price instead of removing
             if 'Variant Price' in shopify_df.columns:
                 rows_fixed_final = 0
-                for idx, row in shopify_df.iterrows():
+                for idx, row in _iter_rows(shopify_df):
                     title = row.get('Title', '')
                     handle = row.get('Handle', '')
                     is_parent_row = pd.notna(title) and str(title).strip() != ''
                     
                     # Check if this parent has variants (if yes, it shouldn't have Variant Price - skip check)
                     if is_parent_row and handle:
-                        variant_rows = shopify_df[(shopify_df['Handle'] == handle) & 
-                                                  (shopify_df.index != idx) &
-                                                  ((shopify_df['Title'].isna()) | (shopify_df['Title'] == ''))]
-                        if len(variant_rows) > 0:
+                        if handle in variant_handles:
                             # This is a parent with variants - it shouldn't have Variant Price, skip price check
                             continue
                     
@@ -1565,7 +1758,7 @@ class MigrationOrchestrator:
             if desc_col:
                 missing_desc_count = 0
                 wrapped_desc_count = 0
-                for idx, row in shopify_df.iterrows():
+                for idx, row in _iter_rows(shopify_df):
                     # Only check parent rows (rows with Title)
                     if pd.notna(row.get('Title')) and str(row.get('Title', '')).strip() != '':
                         product_name = str(row.get('Title', 'Product')).strip()
@@ -1595,39 +1788,7 @@ class MigrationOrchestrator:
             # - Variant rows (same Handle as parent but not the parent) MUST have fulfillment service set
             # - Parent rows WITH variants should have empty variant fields (don't set fulfillment service)
             if 'Variant Fulfillment Service' in shopify_df.columns:
-                fulfillment_fixes = 0
-                for idx, row in shopify_df.iterrows():
-                    title = row.get('Title', '')
-                    handle = row.get('Handle', '')
-                    
-                    if not handle or pd.isna(handle):
-                        continue
-                    
-                    # Find all rows with the same handle
-                    handle_rows = shopify_df[shopify_df['Handle'] == handle]
-                    
-                    # Identify parent row (first row with Title, or first row if no Title rows)
-                    parent_rows = handle_rows[pd.notna(handle_rows['Title']) & (handle_rows['Title'] != '')]
-                    if len(parent_rows) > 0:
-                        parent_idx = parent_rows.index[0]
-                        # Variant rows are all other rows with the same handle
-                        is_variant_row = (idx != parent_idx)
-                        is_single_product = (len(handle_rows) == 1)
-                    else:
-                        # No parent row found, treat as single product
-                        is_variant_row = False
-                        is_single_product = True
-                    
-                    # Set fulfillment service for single products and variant rows (NOT parent rows with variants)
-                    if is_single_product or is_variant_row:
-                        fulfillment = row.get('Variant Fulfillment Service', '')
-                        # Check if fulfillment is empty or invalid
-                        if (pd.isna(fulfillment) or 
-                            str(fulfillment).strip() == '' or 
-                            str(fulfillment).strip().lower() == 'nan' or
-                            str(fulfillment).strip().lower() != 'manual'):
-                            shopify_df.at[idx, 'Variant Fulfillment Service'] = 'manual'
-                            fulfillment_fixes += 1
+                fulfillment_fixes = fix_fulfillment_service(shopify_df)
                 
                 if fulfillment_fixes > 0:
                     logger.info(f"Fixed {fulfillment_fixes} rows (single products + variants) with fulfillment service set to 'manual'")
@@ -1638,73 +1799,17 @@ class MigrationOrchestrator:
             # - Rows with variant fields (Price, SKU, Inventory Qty) MUST have inventory policy set
             # - Parent rows WITH variants should have empty variant fields (no inventory policy needed)
             if 'Variant Inventory Policy' in shopify_df.columns:
-                policy_fixes = 0
-                for idx, row in shopify_df.iterrows():
-                    # Check if this is a variant row (no title or empty title)
-                    title = row.get('Title', '')
-                    is_variant_row = pd.isna(title) or str(title).strip() == ''
-                    
-                    # Check if this row has any variant fields populated
-                    variant_price = row.get('Variant Price', '')
-                    variant_sku = row.get('Variant SKU', '')
-                    variant_inventory = row.get('Variant Inventory Qty', '')
-                    
-                    has_variant_fields = (
-                        (variant_price and pd.notna(variant_price) and str(variant_price).strip() != '' and str(variant_price).strip() != 'nan') or
-                        (variant_sku and pd.notna(variant_sku) and str(variant_sku).strip() != '' and str(variant_sku).strip() != 'nan') or
-                        (variant_inventory and pd.notna(variant_inventory) and str(variant_inventory).strip() != '' and str(variant_inventory).strip() != 'nan' and str(variant_inventory).strip() != '0')
-                    )
-                    
-                    # If it's a variant row OR has variant fields, inventory policy must be set
-                    if is_variant_row or has_variant_fields:
-                        policy = row.get('Variant Inventory Policy', '')
-                        policy_str = str(policy).strip().lower() if pd.notna(policy) else ''
-                        
-                        # Check if policy is empty or invalid
-                        if (pd.isna(policy) or 
-                            policy_str == '' or 
-                            policy_str == 'nan' or
-                            policy_str not in ['deny', 'continue']):
-                            # Map invalid/empty values to valid ones
-                            if policy_str in ['true', '1', 'yes', 'y', 'allow', 'allow_continue', 'continue']:
-                                shopify_df.at[idx, 'Variant Inventory Policy'] = 'continue'
-                            else:
-                                shopify_df.at[idx, 'Variant Inventory Policy'] = 'deny'
-                            policy_fixes += 1
+                policy_fixes = fix_inventory_policy(shopify_df)
                 
                 if policy_fixes > 0:
                     logger.info(f"Fixed {policy_fixes} rows (variant rows + rows with variant fields) - set inventory policy to valid values ('deny' or 'continue')")
             
-            # Shopify only accepts specific columns - remove columns that Shopify doesn't recognize
-            # Keep only the columns that Shopify actually accepts
-            shopify_accepted_columns = [
-                'Handle', 'Title', 'Body (HTML)', 'Vendor', 'Product category', 'Type', 'Tags', 'Published',
-                'Option1 Name', 'Option1 Value', 'Option2 Name', 'Option2 Value',
-                'Option3 Name', 'Option3 Value', 'Variant SKU', 'Variant Grams',
-                'Variant Inventory Tracker', 'Variant Inventory Qty', 'Variant Inventory Policy',
-                'Variant Fulfillment Service', 'Variant Price', 'Variant Compare At Price',
-                'Variant Requires Shipping', 'Variant Taxable', 'Variant Barcode',
-                'Image Src', 'Image Alt Text', 'Variant Image', 'Gift Card',
-                'SEO Title', 'SEO Description'
-            ]
-            
-            # Keep only columns that exist in the dataframe and are accepted by Shopify
-            columns_to_keep = [col for col in shopify_accepted_columns if col in shopify_df.columns]
-            
-            # Also keep any columns that start with "Google Shopping" as they might be accepted
-            google_shopping_cols = [col for col in shopify_df.columns if col.startswith('Google Shopping')]
-            columns_to_keep.extend(google_shopping_cols)
-            
-            # Select only the accepted columns
-            shopify_df = shopify_df[columns_to_keep]
-            logger.info(f"Filtered to {len(columns_to_keep)} Shopify-accepted columns (removed {len(shopify_df.columns) - len(columns_to_keep) if len(shopify_df.columns) > len(columns_to_keep) else 0} unrecognized columns)")
-            
             # FINAL SAFETY CHECK: Ensure ALL rows with blank titles have Option1 Value set
             # This prevents "Title can't be blank" errors from Shopify
             if 'Option1 Value' in shopify_df.columns and 'Title' in shopify_df.columns and 'Handle' in shopify_df.columns:
                 final_option1_fixes = 0
                 rows_to_remove_title_issue = []
-                for idx, row in shopify_df.iterrows():
+                for idx, row in _iter_rows(shopify_df):
                     title = row.get('Title', '')
                     option1_val = row.get('Option1 Value', '')
                     handle = row.get('Handle', '')
@@ -1766,7 +1871,7 @@ class MigrationOrchestrator:
                 ultra_final_removals = []
                 option1_fixes_ultra = 0
                 
-                for idx, row in shopify_df.iterrows():
+                for idx, row in _iter_rows(shopify_df):
                     title_raw = row.get('Title', '')
                     title = str(title_raw).strip() if pd.notna(title_raw) else ''
                     option1_raw = row.get('Option1 Value', '')
@@ -1830,7 +1935,7 @@ class MigrationOrchestrator:
                     logger.info(f"ULTRA-FINAL: Fixed {option1_fixes_ultra} rows by ensuring Option1 Value is set")
                 
                 # Final pass: Replace any NaN or empty strings in Option1 Value for variant rows
-                for idx, row in shopify_df.iterrows():
+                for idx, row in _iter_rows(shopify_df):
                     title = str(row.get('Title', '')).strip() if pd.notna(row.get('Title')) else ''
                     if not title or title == '':
                         option1 = row.get('Option1 Value', '')
@@ -1847,13 +1952,9 @@ class MigrationOrchestrator:
             logger.error("No rows were successfully migrated!")
             raise ValueError("Migration failed: No valid rows to output")
         
-        # Generate error report if there are errors
-        if errors:
-            self._generate_error_report(errors)
-        
         # Update statistics
         self.stats['errors'] = errors
-        self.stats['total_rows'] = len(source_df)
+        self.stats['total_rows'] = total_rows
         
         # Generate validation report
         validation_report = self.validator.generate_validation_report(
@@ -1876,28 +1977,40 @@ class MigrationOrchestrator:
         # This can be configured via config file
         return True
     
-    def _generate_error_report(self, errors: List[Dict[str, Any]]) -> None:
+    def _report_error(self, error: Dict[str, Any]) -> None:
         """
-        Generate error report CSV.
+        Append an error to the error report CSV, creating the file on first use.
         
         Args:
-            errors: List of error dictionaries
+            error: Error dictionary
         """
-        error_report_path = self.output_path.parent / f"error_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-        
-        error_rows = []
-        for error in errors:
-            error_rows.append({
-                'row_number': error.get('row_number', ''),
-                'error_type': error.get('type', ''),
-                'errors': '; '.join(error.get('errors', [])) if isinstance(error.get('errors'), list) else str(error.get('error', '')),
-                'warnings': '; '.join(error.get('warnings', [])) if isinstance(error.get('warnings'), list) else ''
-            })
+        if self._error_report_writer is None:
+            error_report_path = self.output_path.parent / f"error_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+            error_report_path.parent.mkdir(parents=True, exist_ok=True)
+            self._error_report_file = open(error_report_path, 'w', encoding='utf-8', newline='')
+            self._error_report_writer = csv.DictWriter(
+                self._error_report_file,
+                fieldnames=ERROR_REPORT_FIELDS,
+                quoting=csv.QUOTE_ALL,  # Same quoting as the output CSV
+                lineterminator='\n'
+            )
+            self._error_report_writer.writeheader()
         
-        if error_rows:
-            error_df = pd.DataFrame(error_rows)
-            self.csv_handler.write_csv(error_df, str(error_report_path))
-            logger.info(f"Error report saved to: {error_report_path}")
+        self._error_report_writer.writerow({
+            'row_number': error.get('row_number', ''),
+            'error_type': error.get('type', ''),
+            'errors': '; '.join(error.get('errors', [])) if isinstance(error.get('errors'), list) else str(error.get('error', '')),
+            'warnings': '; '.join(error.get('warnings', [])) if isinstance(error.get('warnings'), list) else ''
+        })
+    
+    def _generate_error_report(self) -> None:
+        """Close the error report CSV if any error was written to it."""
+        if self._error_report_file is None:
+            return
+        self._error_report_file.close()
+        logger.info(f"Error report saved to: {self._error_report_file.name}")
+        self._error_report_file = None
+        self._error_report_writer = None
     
     def _log_summary(self, validation_report: Dict[str, Any]) -> None:
         """
@@ -6,10 +6,34 @@ Transforms mapped data to match Shopify's specific format requirements.
 import re
 import json
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Callable
 from loguru import logger
 import pandas as pd
 
+# Patterns used on every row, compiled once at import
+URL_RE = re.compile(
+    r'^https?://'  # http:// or https://
+    r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain...
+    r'localhost|'  # localhost...
+    r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # ...or ip
+    r'(?::\d+)?'  # optional port
+    r'(?:/?|[/?]\S+)$', re.IGNORECASE)
+PRICE_JUNK_RE = re.compile(r'[^\d.]')
+HANDLE_JUNK_RE = re.compile(r'[^\w\s-]')
+HANDLE_SEPARATOR_RE = re.compile(r'[-\s]+')
+CATEGORY_SEPARATOR_RE = re.compile(r'\s*>\s*')
+HTML_TAG_RE = re.compile(r'<[^>]+>')
+SCRIPT_RE = re.compile(r'<script[^>]*>.*?</script>', re.DOTALL | re.IGNORECASE)
+HEADING_OPEN_RE = re.compile(r'<h[1-3]([^>]*)>', re.IGNORECASE)
+HEADING_CLOSE_RE = re.compile(r'</h[1-3]>', re.IGNORECASE)
+HEADING_TAG_RE = re.compile(r'<h[1-6]', re.IGNORECASE)
+FIELD_PARAGRAPH_RE = re.compile(r'<p[^>]*>field_[^<]*</p>', re.IGNORECASE)
+FIELD_ID_RE = re.compile(r'field_[a-f0-9]+', re.IGNORECASE)
+BR_RUN_RE = re.compile(r'(<br>\s*){3,}', re.IGNORECASE)
+EMPTY_PARAGRAPH_RE = re.compile(r'<p>\s*</p>', re.IGNORECASE)
+TRAILING_BR_RE = re.compile(r'<br>\s*$', re.IGNORECASE | re.MULTILINE)
+LIST_MARKER_RE = re.compile(r'^[\d#•\-\*]')
+
 
 class DataTransformer:
     """Transform data to Shopify format requirements."""
@@ -66,36 +90,9 @@ class DataTransformer:
             if pd.isna(value) or value is None:
                 continue
             
-            # Handle different field types
-            if 'Price' in field or 'Compare At Price' in field or 'Compare-at price' in field:
-                transformed[field] = self._transform_price(value)
-            elif 'Inventory' in field and 'quantity' in field.lower():
-                transformed[field] = self._transform_inventory(value)
-            elif 'Inventory tracker' in field:
-                transformed[field] = self._transform_inventory_tracker(value)
-            elif 'Image' in field:
-                transformed[field] = self._transform_image_url(value)
-            elif 'Tags' in field:
-                transformed[field] = self._transform_tags(value)
-            elif 'Handle' in field or 'handle' in field.lower():
-                transformed[field] = self._transform_handle(value)
-            elif 'Body' in field or 'Description' in field:
-                transformed[field] = self._transform_html(value)
-            elif 'Published' in field:
-                transformed[field] = self._transform_boolean(value)
-            elif field == 'Status':
-                # Status should be 'active' or 'draft', not TRUE/FALSE
-                transformed[field] = self._transform_status(value)
-            elif 'Continue selling' in field or 'Inventory policy' in field:
-                transformed[field] = self._transform_inventory_policy(value)
-            elif 'Fulfillment service' in field:
-                # Fulfillment service depends on inventory tracker
-                # Will be set after inventory tracker is processed
-                pass
-            elif 'SEO' in field:
-                transformed[field] = self._transform_seo(value)
-            elif 'Product category' in field or ('category' in field.lower() and 'Product' in field):
-                transformed[field] = self._transform_category(value)
+            transform = self._field_transform(field)
+            if transform is not None:
+                transformed[field] = transform(value)
         
         # CRITICAL: Ensure Product category field always exists and has a value
         # Check if Product category field exists in transformed row
@@ -136,6 +133,97 @@ class DataTransformer:
         
         return transformed
     
+    def transform_frame(self, mapped_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Transform a DataFrame of mapped rows to Shopify format, column by column.
+        
+        Row for row this gives the same values as transform_row, with NaN cells
+        standing for fields a row does not have. Each field transform runs once
+        per distinct value of its column.
+        
+        Args:
+            mapped_df: Mapped rows, e.g. from FieldMapper.map_frame
+            
+        Returns:
+            DataFrame of transformed rows, indexed like mapped_df
+        """
+        transformed = mapped_df.copy()
+        
+        for field in mapped_df.columns:
+            transform = self._field_transform(field)
+            if transform is None:
+                continue
+            values = mapped_df[field]
+            present = values.notna()
+            results = {value: transform(value) for value in values[present].unique()}
+            transformed[field] = values.astype(object).where(~present, values.map(results))
+        
+        # Default category on rows whose first category field is blank
+        category_fields = [
+            field for field in transformed.columns
+            if 'Product category' in field or ('category' in field.lower() and 'Product' in field)
+        ]
+        if self.fallback_strategy == 'default' and self.default_category and str(self.default_category).strip() != '':
+            handled = pd.Series(False, index=transformed.index)
+            for field in category_fields:
+                values = transformed[field]
+                present = values.notna() & ~handled
+                blank = present & (~values.astype(object).map(bool) | (values.astype(str).str.strip() == ''))
+                transformed.loc[blank, field] = str(self.default_category).strip()
+                handled |= present
+        
+        if 'Fulfillment service' in transformed.columns:
+            fulfillment = transformed['Fulfillment service']
+            transformed['Fulfillment service'] = fulfillment.where(fulfillment.isna(), 'manual')
+        
+        if 'Continue selling when out of stock' in transformed.columns:
+            policy = transformed['Continue selling when out of stock']
+            blank = policy.notna() & (~policy.astype(object).map(bool) | (policy.astype(str).str.strip() == ''))
+            transformed.loc[blank, 'Continue selling when out of stock'] = 'deny'
+        
+        return transformed
+    
+    def _field_transform(self, field: str) -> Optional[Callable[[Any], str]]:
+        """
+        Pick the value transform for a field by its name.
+        
+        Args:
+            field: Mapped field name
+            
+        Returns:
+            Transform method, or None for fields passed through unchanged
+        """
+        if 'Price' in field or 'Compare At Price' in field or 'Compare-at price' in field:
+            return self._transform_price
+        elif 'Inventory' in field and 'quantity' in field.lower():
+            return self._transform_inventory
+        elif 'Inventory tracker' in field:
+            return self._transform_inventory_tracker
+        elif 'Image' in field:
+            return self._transform_image_url
+        elif 'Tags' in field:
+            return self._transform_tags
+        elif 'Handle' in field or 'handle' in field.lower():
+            return self._transform_handle
+        elif 'Body' in field or 'Description' in field:
+            return self._transform_html
+        elif 'Published' in field:
+            return self._transform_boolean
+        elif field == 'Status':
+            # Status should be 'active' or 'draft', not TRUE/FALSE
+            return self._transform_status
+        elif 'Continue selling' in field or 'Inventory policy' in field:
+            return self._transform_inventory_policy
+        elif 'Fulfillment service' in field:
+            # Fulfillment service depends on inventory tracker
+            # Will be set after inventory tracker is processed
+            return None
+        elif 'SEO' in field:
+            return self._transform_seo
+        elif 'Product category' in field or ('category' in field.lower() and 'Product' in field):
+            return self._transform_category
+        return None
+    
     def _transform_price(self, value: Any) -> str:
         """
         Transform price to Shopify format (2 decimal places).
@@ -149,7 +237,7 @@ class DataTransformer:
         try:
             # Remove currency symbols and whitespace
             price_str = str(value).strip()
-            price_str = re.sub(r'[^\d.]', '', price_str)
+            price_str = PRICE_JUNK_RE.sub('', price_str)
             
             # Convert to float and format
             price = float(price_str)
@@ -287,14 +375,7 @@ class DataTransformer:
         Returns:
             True if URL appears valid
         """
-        url_pattern = re.compile(
-            r'^https?://'  # http:// or https://
-            r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain...
-            r'localhost|'  # localhost...
-            r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # ...or ip
-            r'(?::\d+)?'  # optional port
-            r'(?:/?|[/?]\S+)$', re.IGNORECASE)
-        return bool(url_pattern.match(url))
+        return bool(URL_RE.match(url))
     
     def _transform_tags(self, value: Any) -> str:
         """
@@ -344,10 +425,10 @@ class DataTransformer:
         
         # Replace spaces and special characters with hyphens
         # Keep alphanumeric and hyphens only
-        handle = re.sub(r'[^\w\s-]', '', handle)
+        handle = HANDLE_JUNK_RE.sub('', handle)
         
         # Replace multiple spaces/hyphens with single hyphen
-        handle = re.sub(r'[-\s]+', '-', handle)
+        handle = HANDLE_SEPARATOR_RE.sub('-', handle)
         
         # Remove leading/trailing hyphens
         handle = handle.strip('-')
@@ -419,14 +500,14 @@ class DataTransformer:
         html = html.replace('\\n', '\n')
         
         # Basic HTML cleaning (remove script tags only - preserve everything else)
-        html = re.sub(r'<script[^>]*>.*?</script>', '', html, flags=re.DOTALL | re.IGNORECASE)
+        html = SCRIPT_RE.sub('', html)
         
         # Replace h1, h2, and h3 tags with h4 tags
-        html = re.sub(r'<h[1-3]([^>]*)>', r'<h4\1>', html, flags=re.IGNORECASE)
-        html = re.sub(r'</h[1-3]>', r'</h4>', html, flags=re.IGNORECASE)
+        html = HEADING_OPEN_RE.sub(r'<h4\1>', html)
+        html = HEADING_CLOSE_RE.sub('</h4>', html)
         
         # Remove paragraphs containing field_* patterns (e.g., <p>field_65959a4267af5</p>)
-        html = re.sub(r'<p[^>]*>field_[^<]*</p>', '', html, flags=re.IGNORECASE)
+        html = FIELD_PARAGRAPH_RE.sub('', html)
         
         # DO NOT remove colors - preserve original source formatting
         
@@ -434,13 +515,13 @@ class DataTransformer:
         html = self._structure_description_simple(html)
         
         # Clean up multiple consecutive <br> tags (more than 2)
-        html = re.sub(r'(<br>\s*){3,}', '<br><br>', html, flags=re.IGNORECASE)
+        html = BR_RUN_RE.sub('<br><br>', html)
         
         # Clean up empty paragraphs
-        html = re.sub(r'<p>\s*</p>', '', html, flags=re.IGNORECASE)
+        html = EMPTY_PARAGRAPH_RE.sub('', html)
         
         # Remove trailing <br> tags at the end
-        html = re.sub(r'<br>\s*$', '', html, flags=re.IGNORECASE | re.MULTILINE)
+        html = TRAILING_BR_RE.sub('', html)
         
         return html
     
@@ -458,11 +539,11 @@ class DataTransformer:
             Structured HTML with headings and paragraphs (no tabs, only Overview and Specifications)
         """
         # Replace h1, h2, and h3 tags with h4 tags before processing
-        content = re.sub(r'<h[1-3]([^>]*)>', r'<h4\1>', content, flags=re.IGNORECASE)
-        content = re.sub(r'</h[1-3]>', r'</h4>', content, flags=re.IGNORECASE)
+        content = HEADING_OPEN_RE.sub(r'<h4\1>', content)
+        content = HEADING_CLOSE_RE.sub('</h4>', content)
         
         # Remove paragraphs containing field_* patterns before processing
-        content = re.sub(r'<p[^>]*>field_[^<]*</p>', '', content, flags=re.IGNORECASE)
+        content = FIELD_PARAGRAPH_RE.sub('', content)
         
         # Check if content has explicit specification marker from mapper
         if '---SPECIFICATIONS---' in content:
@@ -562,12 +643,12 @@ class DataTransformer:
                 if current_paragraph:
                     para_text = ' '.join(current_paragraph)
                     # Skip paragraphs containing field_* patterns
-                    if re.search(r'field_[a-f0-9]+', para_text, re.IGNORECASE):
+                    if FIELD_ID_RE.search(para_text):
                         current_paragraph = []
                         continue
                     # Replace h1, h2, and h3 with h4 in paragraph text
-                    para_text = re.sub(r'<h[1-3]([^>]*)>', r'<h4\1>', para_text, flags=re.IGNORECASE)
-                    para_text = re.sub(r'</h[1-3]>', r'</h4>', para_text, flags=re.IGNORECASE)
+                    para_text = HEADING_OPEN_RE.sub(r'<h4\1>', para_text)
+                    para_text = HEADING_CLOSE_RE.sub('</h4>', para_text)
                     # Preserve original HTML if present, otherwise wrap in <p>
                     if para_text.startswith('<') and para_text.endswith('>'):
                         formatted.append(para_text)
@@ -579,11 +660,11 @@ class DataTransformer:
             # Check if line is already HTML
             if line.startswith('<') and line.endswith('>'):
                 # Skip paragraphs containing field_* patterns
-                if re.search(r'field_[a-f0-9]+', line, re.IGNORECASE):
+                if FIELD_ID_RE.search(line):
                     continue
                 # Replace h1, h2, and h3 with h4 in HTML tags
-                line = re.sub(r'<h[1-3]([^>]*)>', r'<h4\1>', line, flags=re.IGNORECASE)
-                line = re.sub(r'</h[1-3]>', r'</h4>', line, flags=re.IGNORECASE)
+                line = HEADING_OPEN_RE.sub(r'<h4\1>', line)
+                line = HEADING_CLOSE_RE.sub('</h4>', line)
                 # Close current paragraph if any
                 if current_paragraph:
                     para_text = ' '.join(current_paragraph)
@@ -596,7 +677,7 @@ class DataTransformer:
                 formatted.append(line)
             else:
                 # Regular text - skip if it's a field_* pattern
-                if re.search(r'field_[a-f0-9]+', line, re.IGNORECASE):
+                if FIELD_ID_RE.search(line):
                     continue
                 # Regular text - add to current paragraph
                 current_paragraph.append(line)
@@ -605,10 +686,10 @@ class DataTransformer:
         if current_paragraph:
             para_text = ' '.join(current_paragraph)
             # Skip paragraphs containing field_* patterns
-            if not re.search(r'field_[a-f0-9]+', para_text, re.IGNORECASE):
+            if not FIELD_ID_RE.search(para_text):
                 # Replace h1, h2, and h3 with h4 in paragraph text
-                para_text = re.sub(r'<h[1-3]([^>]*)>', r'<h4\1>', para_text, flags=re.IGNORECASE)
-                para_text = re.sub(r'</h[1-3]>', r'</h4>', para_text, flags=re.IGNORECASE)
+                para_text = HEADING_OPEN_RE.sub(r'<h4\1>', para_text)
+                para_text = HEADING_CLOSE_RE.sub('</h4>', para_text)
                 if para_text.startswith('<') and para_text.endswith('>'):
                     formatted.append(para_text)
                 else:
@@ -648,22 +729,22 @@ class DataTransformer:
                 if line.isupper() and len(line.split()) <= 8:
                     is_heading = True
                 # Check if it starts with a number or bullet
-                elif re.match(r'^[\d#•\-\*]', line):
+                elif LIST_MARKER_RE.match(line):
                     is_subheading = True
                 # Check if it's a short line that might be a heading
                 elif len(line.split()) <= 5 and not line.endswith('.') and not line.endswith(','):
                     is_subheading = True
             
             # Check if line already contains HTML heading tags
-            if re.match(r'<h[1-6]', line, re.IGNORECASE):
+            if HEADING_TAG_RE.match(line):
                 formatted.append(line)
             elif is_heading:
                 # Main heading - use smaller h5 instead of h3
-                clean_line = re.sub(r'<[^>]+>', '', line)  # Remove any existing HTML
+                clean_line = HTML_TAG_RE.sub('', line)  # Remove any existing HTML
                 formatted.append(f'<h5>{clean_line}</h5>')
             elif is_subheading:
                 # Subheading - use h6 for smaller size
-                clean_line = re.sub(r'<[^>]+>', '', line)  # Remove any existing HTML
+                clean_line = HTML_TAG_RE.sub('', line)  # Remove any existing HTML
                 formatted.append(f'<h6>{clean_line}</h6>')
             else:
                 # Regular paragraph
@@ -749,7 +830,7 @@ class DataTransformer:
         seo = str(value).strip()
         
         # Remove HTML tags
-        seo = re.sub(r'<[^>]+>', '', seo)
+        seo = HTML_TAG_RE.sub('', seo)
         
         # Limit length (SEO best practices)
         if 'Title' in str(value):
@@ -784,7 +865,7 @@ class DataTransformer:
             category_str = category_str.split(',')[0].strip()
         
         # Clean up: normalize spaces around ">"
-        category_str = re.sub(r'\s*>\s*', ' > ', category_str)
+        category_str = CATEGORY_SEPARATOR_RE.sub(' > ', category_str)
         
         # Remove trailing commas and clean up extra spaces
         category_str = category_str.rstrip(',').strip()
@@ -105,6 +105,112 @@ class DataValidator:
         
         return len(errors) == 0, errors, warnings
     
+    def validate_source_frame(
+        self,
+        df: pd.DataFrame,
+        row_numbers: Optional[pd.Series] = None
+    ) -> Tuple[pd.Series, pd.Series]:
+        """
+        Validate every source row of a DataFrame at once, like validate_source_row.
+        
+        Args:
+            df: Source rows
+            row_numbers: Row number per row for error messages (default: position + 1)
+            
+        Returns:
+            Tuple of (valid mask indexed like df, Series of error lists for the invalid rows)
+        """
+        prefix = _row_prefix(df, row_numbers)
+        
+        # Each column is only checked for the rows still without content
+        has_content = pd.Series(False, index=df.index)
+        for field in df.columns:
+            empty = ~has_content
+            if not empty.any():
+                break
+            has_content[empty.to_numpy()] = _has_text(df.loc[empty, field]).to_numpy()
+        
+        errors = [(prefix + "Row is completely empty").where(~has_content)]
+        return has_content, _collect_messages(errors, df.index)
+    
+    def validate_shopify_frame(
+        self,
+        df: pd.DataFrame,
+        required_fields: Optional[List[str]] = None,
+        row_numbers: Optional[pd.Series] = None
+    ) -> Tuple[pd.Series, pd.Series, pd.Series]:
+        """
+        Validate every Shopify row of a DataFrame at once, like validate_shopify_row.
+        
+        NaN cells count as absent fields. Each format check runs once per
+        distinct value of a column, and messages come out in the same order
+        validate_shopify_row produces them.
+        
+        Args:
+            df: Shopify rows
+            required_fields: List of required fields (overrides instance default)
+            row_numbers: Row number per row for messages (default: position + 1)
+            
+        Returns:
+            Tuple of (valid mask indexed like df, Series of error lists,
+            Series of warning lists), the latter two only for rows that have any
+        """
+        prefix = _row_prefix(df, row_numbers)
+        required = required_fields or self.required_fields
+        errors = []
+        warnings = []
+        
+        # Check required fields
+        for field in required:
+            if field in df.columns:
+                missing = ~_has_text(df[field])
+            else:
+                missing = pd.Series(True, index=df.index)
+            errors.append((prefix + f"Missing required field '{field}'").where(missing))
+        
+        # Validate specific field formats
+        for field in df.columns:
+            values = df[field]
+            present = values.notna()
+            if not present.any():
+                continue
+            text = values.astype(object).map(str).str.strip()
+            
+            def failing(check) -> pd.Series:
+                # Rows whose value fails check, evaluating each distinct value once
+                results = {value: check(value) for value in text[present].unique()}
+                return present & ~text.map(results).fillna(True).astype(bool)
+            
+            # Validate price fields
+            if 'Price' in field:
+                bad = failing(self._is_valid_price)
+                errors.append((prefix + f"Invalid price format in '{field}': " + text).where(bad))
+            
+            # Validate inventory quantity fields (but not Inventory tracker which is a string)
+            if ('Inventory' in field or 'Qty' in field) and 'tracker' not in field.lower():
+                bad = failing(self._is_valid_inventory)
+                errors.append((prefix + f"Invalid inventory in '{field}': " + text).where(bad))
+            
+            # Validate image URLs
+            if 'Image' in field:
+                invalid_urls = {value: ', '.join(self._validate_image_urls(value)) for value in text[present].unique() if value}
+                listed = text.where(present).map(invalid_urls).fillna('').astype(str)
+                warnings.append((prefix + f"Invalid image URLs in '{field}': " + listed).where(listed != ''))
+            
+            # Validate handle
+            if 'Handle' in field:
+                bad = failing(self._is_valid_handle)
+                errors.append((prefix + f"Invalid handle format in '{field}': " + text).where(bad))
+            
+            # Validate boolean fields
+            if 'Published' in field or 'Status' in field:
+                bad = present & ~text.isin(['TRUE', 'FALSE'])
+                warnings.append((prefix + f"Boolean field '{field}' should be TRUE/FALSE, got: " + text).where(bad))
+        
+        error_lists = _collect_messages(errors, df.index)
+        valid = ~df.index.to_series().isin(error_lists.index)
+        return valid, error_lists, _collect_messages(warnings, df.index)
+    
     def _is_valid_price(self, value: str) -> bool:
         """
         Validate price format.
@@ -231,3 +337,41 @@ class DataValidator:
         
         return report
 
+
+def _row_prefix(df: pd.DataFrame, row_numbers: Optional[pd.Series]) -> pd.Series:
+    """'Row N: ' message prefix for every row of df."""
+    if row_numbers is None:
+        row_numbers = pd.Series(range(1, len(df) + 1), index=df.index)
+    return 'Row ' + row_numbers.astype(str) + ': '
+
+
+def _has_text(values: pd.Series) -> pd.Series:
+    """Cells that are present and not blank once rendered with str()."""
+    present = values.notna()
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        values = values.astype(object)
+    elif not (pd.api.types.is_object_dtype(values) or pd.api.types.is_string_dtype(values)):
+        # Numbers, booleans and dates never render as blank text
+        return present
+    # Only present cells can hold text, so only those are rendered and stripped
+    present_values = values[present]
+    if not pd.api.types.is_string_dtype(present_values) or pd.api.types.is_object_dtype(present_values):
+        present_values = present_values.astype(object).map(str)
+    present[present.to_numpy()] = (present_values.str.strip() != '').to_numpy()
+    return present
+
+
+def _collect_messages(parts: List[pd.Series], index: pd.Index) -> pd.Series:
+    """
+    Gather per-check message Series (NaN where a check passed) into one list per row.
+    
+    Returns:
+        Series of message lists, in check order, for the rows with any message
+    """
+    if not parts:
+        return pd.Series([], index=index[:0], dtype=object)
+    stacked = pd.concat(parts, axis=1, ignore_index=True).stack()
+    stacked = stacked[stacked.notna()]
+    if stacked.empty:
+        return pd.Series([], index=index[:0], dtype=object)
+    return stacked.groupby(level=0, sort=False).agg(list)
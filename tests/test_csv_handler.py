@@ -8,7 +8,7 @@ from pathlib import Path
 import tempfile
 import os
 
-from src.csv_handler import CSVHandler
+from src.csv_handler import CSVHandler, _fast_row_count, read_arrow_table
 
 
 class TestCSVHandler:
@@ -43,6 +43,22 @@ class TestCSVHandler:
             if os.path.exists(temp_path):
                 os.unlink(temp_path)
     
+    def test_read_many(self):
+        """Test reading several files concurrently, in input order."""
+        paths = []
+        try:
+            for i in range(3):
+                with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
+                    paths.append(f.name)
+                self.handler.write_csv(self.test_data.head(i + 1), paths[-1])
+            
+            frames = self.handler.read_many(paths)
+            
+            assert [len(df) for df in frames] == [1, 2, 3]
+        finally:
+            for path in paths:
+                os.unlink(path)
+    
     def test_analyze_csv(self):
         """Test CSV analysis."""
         with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
@@ -59,6 +75,53 @@ class TestCSVHandler:
             if os.path.exists(temp_path):
                 os.unlink(temp_path)
     
+    def test_analyze_csv_in_chunks(self, monkeypatch):
+        """Test that streamed analysis matches analysis of the full frame."""
+        monkeypatch.setattr('src.csv_handler.ANALYZE_CHUNK_SIZE', 4)
+        data = pd.concat([self.test_data] * 5, ignore_index=True)
+        data.loc[7, 'SKU'] = None
+        
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
+            temp_path = f.name
+        
+        try:
+            data.to_csv(temp_path, index=False)
+            analysis = self.handler.analyze_csv(temp_path)
+            expected = self.handler.analyze_dataframe(pd.read_csv(temp_path))
+            
+            assert analysis['row_count'] == 15
+            assert analysis['missing_values'] == expected['missing_values']
+            assert analysis['dtypes'] == expected['dtypes']
+            assert analysis['sample_rows'] == expected['sample_rows'][:4]
+        finally:
+            os.unlink(temp_path)
+    
+    def test_fast_row_count(self):
+        """Test that line counting handles every line ending and bounds the record count."""
+        with tempfile.NamedTemporaryFile(mode='wb', suffix='.csv', delete=False) as f:
+            temp_path = f.name
+        
+        try:
+            for content, expected in [
+                (b'', 0),
+                (b'Name\nA\nB', 3),
+                (b'Name\r\nA\r\nB\r\n', 3),
+                (b'Name\rA\rB\r', 3),
+                (b'Name,Body\nA,"<p>one</p>\n<p>two</p>"\n', 3),
+            ]:
+                Path(temp_path).write_bytes(content)
+                assert _fast_row_count(temp_path) == expected
+        finally:
+            os.unlink(temp_path)
+    
+    def test_analyze_dataframe(self):
+        """Test analysis of an in-memory DataFrame."""
+        analysis = self.handler.analyze_dataframe(self.test_data)
+        
+        assert analysis['row_count'] == 3
+        assert analysis['column_count'] == 3
+        assert analysis['columns'] == ['Name', 'Price', 'SKU']
+    
     def test_extract_sample(self):
         """Test sample extraction."""
         with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
@@ -83,6 +146,112 @@ class TestCSVHandler:
                 if os.path.exists(path):
                     os.unlink(path)
     
+    def test_detect_encoding(self):
+        """Test encoding detection with a forced backend."""
+        handler = CSVHandler(detector='chardet')
+        
+        with tempfile.NamedTemporaryFile(mode='wb', suffix='.csv', delete=False) as f:
+            f.write('Name,Price\nCafé crème,19.99\n'.encode('utf-8'))
+            temp_path = f.name
+        
+        try:
+            assert handler.detect_encoding(temp_path).lower() == 'utf-8'
+            
+            # Rewriting the file changes its size/mtime, so the cached result is not reused
+            with open(temp_path, 'wb') as f:
+                f.write(b'Name,Price\nPlain,1\n')
+            assert handler.detect_encoding(temp_path) == 'utf-8'
+            
+            with open(temp_path, 'wb') as f:
+                f.write('Name,Price\nCafé,1\n'.encode('utf-8-sig'))
+            assert handler.detect_encoding(temp_path) == 'utf-8-sig'
+        finally:
+            os.unlink(temp_path)
+    
+    def test_unknown_detector(self):
+        """Test that an unknown detection backend is rejected."""
+        with pytest.raises(ValueError):
+            CSVHandler(detector='magic')
+    
+    def test_read_csv_matches_c_engine(self):
+        """Test that dates stay text and empty columns stay float, as with pandas' C engine."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
+            f.write('Name,Date sale price starts,Purchase note\n"A\nB",2024-01-05,\nC,,\n')
+            temp_path = f.name
+        
+        try:
+            df = self.handler.read_csv(temp_path)
+            expected = pd.read_csv(temp_path)
+            
+            pd.testing.assert_frame_equal(df, expected)
+            assert df.iloc[0]['Name'] == 'A\nB'
+        finally:
+            os.unlink(temp_path)
+    
+    def test_read_arrow_table_matches_read_csv(self):
+        """Test the shared pyarrow reader nulls NA markers and leaves repeated headers to pandas."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            markers = os.path.join(temp_dir, 'markers.csv')
+            with open(markers, 'w') as f:
+                f.write('Name,SKU,Qty\nNone,<NA>,1\nBoard,0004,\n')
+            repeated = os.path.join(temp_dir, 'repeated.csv')
+            with open(repeated, 'w') as f:
+                f.write('Name,Parent,Name\nA,,B\n')
+            
+            for kwargs in ({}, {'dtype': str}, {'keep_default_na': False}):
+                pd.testing.assert_frame_equal(
+                    read_arrow_table(markers, **kwargs).to_pandas(), pd.read_csv(markers, **kwargs)
+                )
+            assert read_arrow_table(repeated) is None
+    
+    def test_read_csv_replaces_undecodable_bytes(self):
+        """Test that a wrong encoding falls back to lossy UTF-8 instead of failing."""
+        with tempfile.NamedTemporaryFile(mode='wb', suffix='.csv', delete=False) as f:
+            f.write('Name,Price\nCaf\u00e9,10\n'.encode('latin-1'))
+            temp_path = f.name
+        
+        try:
+            df = self.handler.read_csv(temp_path, encoding='utf-8')
+            
+            assert df.iloc[0]['Name'] == 'Caf\ufffd'
+            assert df.iloc[0]['Price'] == 10
+        finally:
+            os.unlink(temp_path)
+    
+    def test_read_csv_dtype_overrides(self):
+        """Test that declared dtypes apply on both the pyarrow and C engine paths."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
+            f.write('SKU,Type,Price\n0012,simple,10\n0013,variable,12\n')
+            temp_path = f.name
+        
+        try:
+            dtype = {'SKU': str, 'Type': 'category', 'Missing': str}
+            for df in (
+                self.handler.read_csv(temp_path, dtype=dtype),
+                self.handler.read_csv(temp_path, dtype=dtype, skipinitialspace=False)
+            ):
+                assert df['SKU'].tolist() == ['0012', '0013']
+                assert isinstance(df['Type'].dtype, pd.CategoricalDtype)
+                assert df['Price'].tolist() == [10, 12]
+        finally:
+            os.unlink(temp_path)
+    
+    def test_write_csv_text_frame_matches_to_csv(self):
+        """Test the pyarrow writer produces the same bytes as to_csv with QUOTE_ALL."""
+        df = pd.DataFrame({
+            'Title': ['Board', None, 'Say "hi"'],
+            'Body (HTML)': ['<p>a</p>\n<p>b</p>', '', 'x,y'],
+            'Option1 Value': ['S', 'M', pd.NA]
+        }, dtype=object)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            written = os.path.join(temp_dir, 'out.csv')
+            expected = os.path.join(temp_dir, 'expected.csv')
+            self.handler.write_csv(df, written)
+            df.to_csv(expected, index=False, lineterminator='\n', na_rep='', quoting=1)
+            
+            with open(written, 'rb') as f, open(expected, 'rb') as g:
+                assert f.read() == g.read()
+    
     def test_file_not_found(self):
         """Test error handling for missing file."""
         with pytest.raises(FileNotFoundError):
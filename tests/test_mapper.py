@@ -6,6 +6,7 @@ import pytest
 import json
 import tempfile
 import os
+import pandas as pd
 from src.mapper import FieldMapper
 
 
@@ -122,4 +123,73 @@ class TestFieldMapper:
         finally:
             if os.path.exists(config_path):
                 os.unlink(config_path)
-
+    
+    def test_map_frame_matches_map_row(self):
+        """Test that whole-frame mapping gives the same values as per-row mapping."""
+        config = {
+            "mappings": {
+                "direct": {
+                    "fields": {
+                        "Name": "Title",
+                        "Regular price": "Price",
+                        "Description": "Description"
+                    }
+                },
+                "concatenate": {
+                    "fields": {
+                        "tags": {
+                            "target": "Tags",
+                            "fields": ["Categories", "Brands"],
+                            "separator": ", "
+                        }
+                    }
+                },
+                "conditional": {
+                    "fields": {
+                        "status": {
+                            "target": "Status",
+                            "condition": {"field": "Stock", "operator": ">", "value": "0", "then": "active", "else": "draft"}
+                        },
+                        "tracker": {
+                            "target": "Inventory tracker",
+                            "condition": {"field": "Stock", "operator": "empty", "value": "", "then": "", "else": "shopify"}
+                        }
+                    }
+                },
+                "default": {
+                    "fields": {
+                        "Vendor": "Default Vendor",
+                        "Tags": "none"
+                    }
+                }
+            }
+        }
+        source_df = pd.DataFrame({
+            "Name": [" Board ", "Wheel", None],
+            "Regular price": [19.99, None, 5.0],
+            "Description": ["Deck", "nan", None],
+            "Short description": [None, "Short", "  "],
+            "Meta: features": ["Maple", None, "Fast"],
+            "Categories": ["Skate", None, "Parts"],
+            "Brands": [None, None, "Acme"],
+            "Stock": ["3", None, "abc"]
+        })
+        
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            json.dump(config, f)
+            config_path = f.name
+        
+        try:
+            mapper = FieldMapper(config_path)
+            frame = mapper.map_frame(source_df)
+            
+            for idx, row in source_df.iterrows():
+                expected = mapper.map_row(row.to_dict())
+                mapped = frame.loc[idx].dropna().to_dict()
+                assert mapped == expected
+            
+            records = mapper.map_records(source_df)
+            assert records == [mapper.map_row(row) for row in source_df.to_dict('records')]
+        finally:
+            if os.path.exists(config_path):
+                os.unlink(config_path)
@@ -0,0 +1,36 @@
+"""
+Tests for the single product migration script helpers
+"""
+
+import pandas as pd
+from scripts.migrate_single_product_test import analyze_product_fields, analyze_product_fields_df
+
+
+class TestAnalyzeProductFields:
+    """Test cases for the product field analysis."""
+    
+    def test_vectorized_matches_row_function(self):
+        """Test that the frame-wide analysis flags the same fields as the per-row function."""
+        df = pd.DataFrame({
+            'Name': ['Skate', None, '  ', 'Wheel', 'nan', 'Board'],
+            'SKU': ['SK-1', '', None, ' 0004 ', 'W-2', 'nan'],
+            'Regular price': ['19.99', None, '$1,200', '0', 'abc', ''],
+            'Sale price': [None, '5', '', '-3', '₹ 250', None],
+            'Images': ['http://x/a.jpg', 'nan', ' NaN ', '', None, 'http://x/b.jpg'],
+            'Description': ['<p>Fast</p>', None, 'nan', '   ', 'Good', 'Nan']
+        })
+        result = analyze_product_fields_df(df)
+        
+        for idx, row in df.iterrows():
+            expected = analyze_product_fields(row)
+            for field in result.columns:
+                assert result.at[idx, field] == expected[field], (idx, field)
+    
+    def test_vectorized_missing_columns(self):
+        """Test that absent columns count as missing, as row.get('', '') does."""
+        df = pd.DataFrame({'Name': ['Skate', None]})
+        result = analyze_product_fields_df(df)
+        
+        for idx, row in df.iterrows():
+            expected = analyze_product_fields(row)
+            assert result.loc[idx].to_dict() == {field: expected[field] for field in result.columns}
@@ -0,0 +1,135 @@
+"""
+Tests for Migration Module helpers
+"""
+
+import os
+import tempfile
+
+import pandas as pd
+import pytest
+from src.migration import (
+    MigrationOrchestrator, _iter_rows,
+    determine_product_group_id, determine_product_group_ids,
+    fix_inventory_tracker, fix_fulfillment_service, fix_inventory_policy,
+    fill_variant_option1
+)
+
+
+class TestProductGrouping:
+    """Test cases for product group identifiers."""
+    
+    def test_vectorized_matches_row_function(self):
+        """Test determine_product_group_ids agrees with the per-row function."""
+        df = pd.DataFrame({
+            'Type': ['variable', 'variation', 'variation', 'simple', 'simple', None, 'grouped'],
+            'SKU': ['SK-1', 'SK-1-S', None, 'nan', '  ', 'X-9', 'G-1'],
+            'Parent': [None, 'SK-1', '0', None, None, 'None', None],
+            'Name': ['Skate - Black', 'Skate - Small', 'Helmet (Large)', 'Wheel 80mm - 4', '  ', None, 'Kit'],
+        })
+        expected = df.apply(determine_product_group_id, axis=1)
+        assert determine_product_group_ids(df).tolist() == expected.tolist()
+    
+    def test_vectorized_missing_columns(self):
+        """Test rows without Parent/Type/SKU columns fall back to the base name."""
+        df = pd.DataFrame({'Name': ['Skate - Black', 'Skate - White', None]})
+        result = determine_product_group_ids(df)
+        assert result.tolist() == ['Skate', 'Skate', '']
+    
+    def test_iter_rows_matches_iterrows(self):
+        """Test row dicts carry the same index and values as iterrows()."""
+        df = pd.DataFrame({'Title': ['Board', ''], 'Option1 Value': ['', 'S']}, index=[4, 7])
+        assert [(idx, row) for idx, row in _iter_rows(df)] == [
+            (idx, row.to_dict()) for idx, row in df.iterrows()
+        ]
+
+
+class TestVariantFieldFixes:
+    """Test cases for the post-processing fixes on Shopify variant fields."""
+    
+    def test_fix_inventory_tracker(self):
+        """Test rows holding inventory get the shopify tracker."""
+        df = pd.DataFrame({
+            'Variant Inventory Qty': ['5', '0', '', 'lots', '-2', '3'],
+            'Variant Inventory Tracker': ['', '', '', 'shopify', '', 'shopify']
+        })
+        assert fix_inventory_tracker(df) == 2
+        assert df['Variant Inventory Tracker'].tolist() == ['shopify', '', '', 'shopify', '', 'shopify']
+    
+    def test_fix_fulfillment_service(self):
+        """Test single products and variant rows get manual fulfillment, parents with variants do not."""
+        df = pd.DataFrame({
+            'Handle': ['board', 'board', 'board', 'wheel', 'orphan', ''],
+            'Title': ['Board', '', '', 'Wheel', '', ''],
+            'Variant Fulfillment Service': ['', '', 'Manual', '', '', '']
+        })
+        assert fix_fulfillment_service(df) == 3
+        assert df['Variant Fulfillment Service'].tolist() == ['', 'manual', 'Manual', 'manual', 'manual', '']
+    
+    def test_fix_inventory_policy(self):
+        """Test variant rows and rows with variant fields get a valid inventory policy."""
+        df = pd.DataFrame({
+            'Title': ['Board', 'Board', '', '', 'Wheel'],
+            'Variant Price': ['', '10.00', '', '', ''],
+            'Variant SKU': ['', '', '', '', ''],
+            'Variant Inventory Qty': ['', '', '', '', '0'],
+            'Variant Inventory Policy': ['', 'yes', 'Continue', 'bogus', '']
+        })
+        assert fix_inventory_policy(df) == 2
+        assert df['Variant Inventory Policy'].tolist() == ['', 'continue', 'Continue', 'deny', '']
+    
+    def test_fill_variant_option1(self):
+        """Test variant rows copy Option1 Value within their handle, then fall back to SKU or a default."""
+        df = pd.DataFrame({
+            'Handle': ['board', 'board', 'board', 'wheel', 'wheel', ''],
+            'Title': ['Board', '', '', '', '', ''],
+            'Option1 Name': ['Size', 'Size', 'Size', '', 'Color', ''],
+            'Option1 Value': ['', 'S', '', '', '', ''],
+            'Variant SKU': ['', '', 'B-M', 'W-1', '', '']
+        })
+        assert fill_variant_option1(df) == 4
+        assert df['Option1 Value'].tolist() == ['', 'S', 'S', 'W-1', 'W-1', 'Variant-5']
+        assert df['Option1 Name'].tolist() == ['Size', 'Size', 'Size', 'Size', 'Color', 'Size']
+
+
+class TestErrorReport:
+    """Test cases for the streamed error report."""
+    
+    def test_errors_written_as_they_are_reported(self):
+        """Test errors are appended to one report file that is created on the first error."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            orchestrator = MigrationOrchestrator.from_dataframe(
+                pd.DataFrame(), 'shopify_template.csv', os.path.join(temp_dir, 'out.csv')
+            )
+            orchestrator._generate_error_report()
+            assert os.listdir(temp_dir) == []
+            
+            orchestrator._report_error({'row_number': 'group', 'type': 'processing_error', 'error': 'bad "value"'})
+            orchestrator._report_error({'row_number': 3, 'type': 'validation', 'errors': ['a', 'b'], 'warnings': ['w']})
+            orchestrator._generate_error_report()
+            
+            report_name, = os.listdir(temp_dir)
+            assert report_name.startswith('error_report_')
+            with open(os.path.join(temp_dir, report_name), encoding='utf-8') as f:
+                assert f.read() == (
+                    '"row_number","error_type","errors","warnings"\n'
+                    '"group","processing_error","bad ""value""",""\n'
+                    '"3","validation","a; b","w"\n'
+                )
+    
+    def test_report_closed_when_migration_fails(self):
+        """Test the report is closed and complete when migrate() raises after an error was written."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            source_df = pd.DataFrame({'Name': ['Board', None], 'SKU': ['B-1', None]})
+            orchestrator = MigrationOrchestrator.from_dataframe(
+                source_df, os.path.join(temp_dir, 'missing_template.csv'), os.path.join(temp_dir, 'out.csv')
+            )
+            with pytest.raises(FileNotFoundError):
+                orchestrator.migrate()
+            
+            assert orchestrator._error_report_file is None
+            report_name, = os.listdir(temp_dir)
+            with open(os.path.join(temp_dir, report_name), encoding='utf-8') as f:
+                assert f.read() == (
+                    '"row_number","error_type","errors","warnings"\n'
+                    '"2","validation_error","Row 2: Row is completely empty",""\n'
+                )
@@ -3,6 +3,7 @@ Tests for Data Transformer Module
 """
 
 import pytest
+import pandas as pd
 from src.transformer import DataTransformer
 
 
@@ -66,4 +67,22 @@ class TestDataTransformer:
         row = {"Published": "no"}
         result = self.transformer.transform_row(row)
         assert result["Published"] == "FALSE"
-
+    
+    def test_transform_frame_matches_transform_row(self):
+        """Test that whole-frame transformation gives the same values as per-row transformation."""
+        self.transformer.fallback_strategy = 'default'
+        self.transformer.default_category = 'Sporting Goods'
+        mapped_df = pd.DataFrame({
+            "Title": ["Board", "Wheel", None],
+            "Price": ["$19.99", "bad", None],
+            "Inventory quantity": ["5", "-2", "5"],
+            "Tags": ["a,b", None, "a,b"],
+            "Product category": ["", None, "  "],
+            "Fulfillment service": ["", None, "x"],
+            "Continue selling when out of stock": ["", "continue", None]
+        })
+        frame = self.transformer.transform_frame(mapped_df)
+        
+        for idx, row in mapped_df.iterrows():
+            expected = self.transformer.transform_row(row.dropna().to_dict())
+            assert frame.loc[idx].dropna().to_dict() == expected
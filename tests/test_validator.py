@@ -60,4 +60,32 @@ class TestDataValidator:
         
         duplicates = self.validator.check_duplicates(df, "Variant SKU")
         assert len(duplicates) == 2  # Two rows with SKU001
-
+    
+    def test_validate_shopify_frame_matches_row(self):
+        """Test that whole-frame validation gives the same messages as per-row validation."""
+        df = pd.DataFrame({
+            "Handle": ["board", "Bad Handle", None, "wheel"],
+            "Title": ["Board", "", "Wheel", None],
+            "Variant Price": ["19.99", "1.999", None, "abc"],
+            "Variant Inventory Qty": ["5", "-1", "x", None],
+            "Variant Inventory Tracker": ["shopify", "", None, "shopify"],
+            "Image Src": ["https://example.com/a.jpg", "not-a-url", "", None],
+            "Published": ["TRUE", "yes", None, "FALSE"]
+        })
+        
+        valid, errors, warnings = self.validator.validate_shopify_frame(df)
+        
+        for position, (idx, row) in enumerate(df.iterrows(), 1):
+            expected_valid, expected_errors, expected_warnings = self.validator.validate_shopify_row(row.to_dict(), position)
+            assert valid[idx] == expected_valid
+            assert errors.get(idx, []) == expected_errors
+            assert warnings.get(idx, []) == expected_warnings
+    
+    def test_validate_source_frame(self):
+        """Test that completely empty source rows are flagged."""
+        df = pd.DataFrame({"Name": ["Board", None, "  "], "Price": [1.5, None, None]})
+        
+        valid, errors = self.validator.validate_source_frame(df)
+        
+        assert valid.tolist() == [True, False, False]
+        assert errors.to_dict() == {1: ["Row 2: Row is completely empty"], 2: ["Row 3: Row is completely empty"]}